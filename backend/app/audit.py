@@ -0,0 +1,352 @@
+# backend/app/audit.py
+"""
+AuditLog 기록 (main.py / services.py 에 있던 audit() 를 하나로)
+
+- sync (기본): 호출한 세션에 AuditLog 를 add 만 함
+    → 업무 변경과 같은 트랜잭션(commit 1번)으로 flush 됨
+- async (AUDIT_MODE=async): commit 성공 후 메모리 큐에 넣고
+    백그라운드 스레드가 모아서 bulk insert (요청 latency 에서 audit write 제거)
+    - 큐 크기 제한 (AUDIT_QUEUE_SIZE), 가득 차면 AUDIT_PUT_TIMEOUT 초 동안 대기(backpressure)
+    - 그래도 자리가 없으면 호출 스레드에서 직접 insert (유실 없음)
+    - 종료 시 stop() 으로 남은 큐를 모두 flush
+
+저장 형식 (AuditLog.encoding)
+- full: before/after 를 그대로 (create, assign 등)
+- diff (AUDIT_ENCODING=diff, 기본): entity 스냅샷 수정은 바뀐 필드만 저장
+- checkpoint: diff 가 AUDIT_CHECKPOINT_EVERY 번 이어지면 전체 스냅샷을 한 번 저장
+  → entity_state() 는 가장 가까운 checkpoint/create 부터 diff 를 순서대로 적용해 복원
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import event, func, insert, or_, tuple_
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session, select
+
+from . import db, events
+from .models import AuditLog
+from .utils import sanitize_for_json
+from .versions import touch
+
+log = logging.getLogger(__name__)
+
+AUDIT_MODE = (os.getenv("AUDIT_MODE") or "sync").strip().lower()
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE") or 10000)
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE") or 500)
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL") or 0.2)
+AUDIT_PUT_TIMEOUT = float(os.getenv("AUDIT_PUT_TIMEOUT") or 2.0)
+AUDIT_ENCODING = (os.getenv("AUDIT_ENCODING") or "diff").strip().lower()
+AUDIT_CHECKPOINT_EVERY = int(os.getenv("AUDIT_CHECKPOINT_EVERY") or 20)
+
+_PENDING_KEY = "audit_pending"
+_SINCE_RESET_KEY = "audit_since_reset"
+_NOTIFY_KEY = "audit_notify"
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def diff_fields(before: dict, after: dict) -> tuple[dict, dict]:
+    """바뀐 필드만 (before 값, after 값)"""
+    keys = [k for k in after if before.get(k) != after[k]]
+    keys += [k for k in before if k not in after]
+    return {k: before.get(k) for k in keys}, {k: after.get(k) for k in keys}
+
+
+def audit_row(conference_id: int, entity_type: str, entity_id: int, action: str,
+              before: Optional[dict], after: Optional[dict],
+              actor_person_id: Optional[int] = None, encoding: str = "full") -> dict[str, Any]:
+    """AuditLog insert 용 dict (date/datetime 은 isoformat)"""
+    before = sanitize_for_json(before or {})
+    after = sanitize_for_json(after or {})
+    if encoding == "diff":
+        before, after = diff_fields(before, after)
+    return {
+        "conference_id": conference_id,
+        "actor_person_id": actor_person_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "action": action,
+        "before_json": _dumps(before),
+        "after_json": _dumps(after),
+        "encoding": encoding,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def _entity_history(entity_type: str, entity_id: int, conference_id: int):
+    return (
+        select(AuditLog)
+        .where(AuditLog.conference_id == conference_id,
+               AuditLog.entity_type == entity_type,
+               AuditLog.entity_id == entity_id)
+        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    )
+
+
+def _is_reset(row) -> bool:
+    # 이 row 의 after 가 entity 전체 스냅샷인가
+    return row.encoding == "checkpoint" or row.action == "create"
+
+
+def _rows_since_reset(session: Session, key: tuple) -> dict:
+    """
+    entity 별 '마지막 checkpoint/create 이후 row 수' (세션 단위 캐시)
+    - 처음 한 번만 최근 AUDIT_CHECKPOINT_EVERY 개를 조회, 이후는 세션 안에서 셈
+    - no_autoflush: 배치 수정 중 매번 flush 되지 않도록
+    """
+    cache = session.info.setdefault(_SINCE_RESET_KEY, {})
+    if key not in cache:
+        conference_id, entity_type, entity_id = key
+        with session.no_autoflush:
+            recent = session.exec(
+                select(AuditLog.encoding, AuditLog.action)
+                .where(AuditLog.conference_id == conference_id,
+                       AuditLog.entity_type == entity_type,
+                       AuditLog.entity_id == entity_id)
+                .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+                .limit(AUDIT_CHECKPOINT_EVERY)
+            ).all()
+        n = 0
+        for r in recent:
+            if _is_reset(r):
+                break
+            n += 1
+        cache[key] = n
+    return cache
+
+
+def prime_since_reset(session: Session, conference_id: int, entity_type: str,
+                      entity_ids: list[int]) -> None:
+    """배치 수정 전에 여러 entity 의 checkpoint 카운트를 쿼리 1번으로 채움"""
+    if AUDIT_ENCODING != "diff" or not entity_ids:
+        return
+    scope = (AuditLog.conference_id == conference_id,
+             AuditLog.entity_type == entity_type,
+             AuditLog.entity_id.in_(entity_ids))
+    # entity 별 마지막 checkpoint/create id (GROUP BY 1번, 행마다 서브쿼리 X)
+    last_reset = (
+        select(AuditLog.entity_id, func.max(AuditLog.id).label("reset_id"))
+        .where(*scope, or_(AuditLog.encoding == "checkpoint", AuditLog.action == "create"))
+        .group_by(AuditLog.entity_id)
+        .subquery()
+    )
+    stmt = (
+        select(AuditLog.entity_id, func.count())
+        .outerjoin(last_reset, last_reset.c.entity_id == AuditLog.entity_id)
+        .where(*scope, AuditLog.id > func.coalesce(last_reset.c.reset_id, 0))
+        .group_by(AuditLog.entity_id)
+    )
+    with session.no_autoflush:
+        counts = dict(session.exec(stmt).all())
+    cache = session.info.setdefault(_SINCE_RESET_KEY, {})
+    for eid in entity_ids:
+        cache.setdefault((conference_id, entity_type, eid), counts.get(eid, 0))
+
+
+def _choose_encoding(session: Session, conference_id: int, entity_type: str, entity_id: int,
+                     action: str, before: Optional[dict], after: Optional[dict]) -> str:
+    # entity 전체 스냅샷(model_dump) 끼리의 수정만 diff 대상
+    is_snapshot = bool(before) and bool(after) and before.get("id") == after.get("id") == entity_id
+    key = (conference_id, entity_type, entity_id)
+
+    if action == "create":
+        session.info.setdefault(_SINCE_RESET_KEY, {})[key] = 0
+        return "full"
+    if AUDIT_ENCODING != "diff" or not is_snapshot:
+        cache = session.info.get(_SINCE_RESET_KEY)
+        if cache and key in cache:
+            cache[key] += 1
+        return "full"
+
+    cache = _rows_since_reset(session, key)
+    if cache[key] >= AUDIT_CHECKPOINT_EVERY:
+        cache[key] = 0
+        return "checkpoint"
+    cache[key] += 1
+    return "diff"
+
+
+def audit(session: Session, conference_id: int, entity_type: str, entity_id: int,
+          action: str, before: Optional[dict], after: Optional[dict],
+          actor_person_id: Optional[int] = None) -> None:
+    """
+    ✅ commit 하지 않음 — 호출한 쪽의 session.commit() 에 같이 반영
+    (entity_id 가 필요하면 호출 전에 session.flush())
+    """
+    touch(session, conference_id)
+    encoding = _choose_encoding(session, conference_id, entity_type, entity_id, action, before, after)
+    row = audit_row(conference_id, entity_type, entity_id, action, before, after,
+                    actor_person_id, encoding)
+    if writer.running:
+        session.info.setdefault(_PENDING_KEY, []).append(row)
+    else:
+        session.add(AuditLog(**row))
+        session.info.setdefault(_NOTIFY_KEY, set()).add(conference_id)
+
+
+def audit_many(session: Session, conference_id: int, entity_type: str, changes: list[tuple],
+               actor_person_id: Optional[int] = None) -> None:
+    """
+    여러 entity 의 audit 를 INSERT 문 1번으로 (batch 생성/수정, commit 하지 않음)
+    - changes: [(entity_id, action, before, after), ...]
+    - sync 모드는 바로 execute (세션에 AuditLog 객체를 행마다 쌓지 않음)
+    """
+    if not changes:
+        return
+    touch(session, conference_id)
+    rows = [
+        audit_row(conference_id, entity_type, entity_id, action, before, after, actor_person_id,
+                  _choose_encoding(session, conference_id, entity_type, entity_id, action, before, after))
+        for entity_id, action, before, after in changes
+    ]
+    if writer.running:
+        session.info.setdefault(_PENDING_KEY, []).extend(rows)
+    else:
+        session.execute(insert(AuditLog), rows)
+        session.info.setdefault(_NOTIFY_KEY, set()).add(conference_id)
+
+
+def entity_state(session: Session, row: AuditLog) -> dict[str, Any]:
+    """
+    row 시점(해당 audit 적용 직후)의 entity 상태 복원
+    - 최신 → 과거로 읽다가 전체 스냅샷(create / checkpoint / full 스냅샷)을 만나면 멈추고,
+      거꾸로 after 를 덮어씀
+    - 스냅샷이 아닌 row (assign 의 {"assignees": …} 등) 는 건너뜀
+    - 스냅샷이 하나도 없는 entity (milestones generate 등) 는 그 row 의 after 그대로
+    """
+    stmt = (
+        _entity_history(row.entity_type, row.entity_id, row.conference_id)
+        .where(tuple_(AuditLog.created_at, AuditLog.id) <= (row.created_at, row.id))
+        .execution_options(yield_per=200)
+    )
+    chain = []
+    for r in session.exec(stmt):
+        after = json.loads(r.after_json)
+        full_snapshot = r.encoding == "full" and after.get("id") == r.entity_id
+        if r.encoding == "full" and r.action != "create" and not full_snapshot:
+            continue
+        chain.append(after)
+        if _is_reset(r) or full_snapshot:
+            break
+    if not chain:
+        return json.loads(row.after_json)
+
+    state: dict[str, Any] = {}
+    for after in reversed(chain):
+        state.update(after)
+    return state
+
+
+# -----------------------
+# write-behind
+# -----------------------
+class AuditWriter:
+    def __init__(self, maxsize: int = AUDIT_QUEUE_SIZE, batch_size: int = AUDIT_BATCH_SIZE,
+                 flush_interval: float = AUDIT_FLUSH_INTERVAL, put_timeout: float = AUDIT_PUT_TIMEOUT):
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 큐를 모두 쓰고 종료"""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self._drain()  # join 이후 들어온 것까지
+
+    def put_many(self, rows: list[dict]) -> None:
+        for i, row in enumerate(rows):
+            try:
+                self.queue.put(row, timeout=self.put_timeout)
+            except queue.Full:
+                log.warning("audit queue full; writing %d rows inline", len(rows) - i)
+                self._write(rows[i:])
+                return
+
+    def _take_batch(self, block: bool) -> list[dict]:
+        batch = []
+        try:
+            batch.append(self.queue.get(timeout=self.flush_interval) if block else self.queue.get_nowait())
+            while len(batch) < self.batch_size:
+                batch.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._take_batch(block=True)
+            if batch:
+                self._write(batch)
+        self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _write(self, rows: list[dict]) -> None:
+        try:
+            with Session(db.engine) as session:
+                session.execute(insert(AuditLog), rows)
+                session.commit()
+        except Exception:
+            log.exception("failed to write %d audit rows", len(rows))
+            return
+        events.notify(r["conference_id"] for r in rows)
+
+
+writer = AuditWriter()
+
+
+@event.listens_for(SASession, "after_commit")
+def _enqueue_after_commit(session: SASession) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        writer.put_many(rows)
+    # sync 모드: 이미 commit 됨 → SSE 구독자 깨움 (write-behind 는 _write 에서)
+    cids = session.info.pop(_NOTIFY_KEY, None)
+    if cids:
+        events.notify(cids)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _drop_after_rollback(session: SASession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_NOTIFY_KEY, None)
+
+
+def start() -> None:
+    if AUDIT_MODE == "async":
+        writer.start()
+
+
+def stop() -> None:
+    writer.stop()
@@ -0,0 +1,80 @@
+# backend/app/cache.py
+"""
+RoleTemplate 메모리 캐시
+
+- 테이블이 작고 거의 안 바뀌므로 프로세스 안에 통째로 들고 있음
+- role-templates 생성/수정/삭제/seed 시 invalidate()
+- version = 내용 해시 → 워커가 여러 개여도 같은 내용이면 같은 ETag
+- 다른 워커에서 바뀐 경우를 위해 ROLE_CACHE_TTL 초 지나면 다시 읽음
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from sqlmodel import Session, select
+
+from .models import RoleTemplate
+
+ROLE_CACHE_TTL = float(os.getenv("ROLE_CACHE_TTL") or 30)
+
+
+class RoleTemplateCache:
+    def __init__(self, ttl: float = ROLE_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._rows: Optional[list[dict[str, Any]]] = None
+        self._labels: dict[str, str] = {}
+        self._version = ""
+        self._loaded_at = 0.0
+
+    def _fresh(self) -> bool:
+        return self._rows is not None and (time.monotonic() - self._loaded_at) < self.ttl
+
+    def _load(self, session: Session) -> None:
+        rows = session.exec(
+            select(RoleTemplate).order_by(RoleTemplate.sort_order, RoleTemplate.label)
+        ).all()
+        data = [r.model_dump() for r in rows]
+        digest = hashlib.sha1(
+            json.dumps([(r["id"], r["key"], r["label"], r["sort_order"]) for r in data],
+                       ensure_ascii=False).encode()
+        ).hexdigest()[:16]
+        self._rows = data
+        self._labels = {r["key"]: r["label"] for r in data}
+        self._version = digest
+        self._loaded_at = time.monotonic()
+
+    def snapshot(self, session: Session) -> tuple[str, list[dict[str, Any]], dict[str, str]]:
+        """(version, rows(sort_order, label 순), key -> label)"""
+        with self._lock:
+            if self._fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._load(session)
+            return self._version, self._rows, self._labels
+
+    def labels(self, session: Session) -> dict[str, str]:
+        return self.snapshot(session)[2]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._rows or []),
+            "version": self._version,
+        }
+
+
+role_cache = RoleTemplateCache()
@@ -0,0 +1,135 @@
+# backend/app/clone.py
+"""
+학회 복제 (작년 학회 → 새 연도)
+
+- milestone / task / 할당 / task 의존관계를 테이블마다 INSERT … SELECT 한 번씩 (ORM 객체 X)
+- 날짜는 새 시작일과의 차이만큼 이동 (shift_date), task 상태는 todo 로
+- 한 문장으로 원본 id 순서대로 넣으므로 새 task id 도 같은 순서
+  → row_number() 로 원본 ↔ 새 task id 를 짝지어 할당/의존관계를 옮김
+- task 마다 create audit 도 INSERT … SELECT (이후 diff audit / entity_state 의 기준점)
+- commit 은 호출하는 쪽에서 (전부 한 트랜잭션)
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, insert, literal
+from sqlmodel import Session, select
+
+from .models import Assignment, AuditLog, Conference, Milestone, Task, TaskDependency
+from .schedule import shift_date
+
+# model_dump() 와 같은 순서
+_TASK_FIELDS = ("id", "conference_id", "task_group", "name", "description", "status", "priority",
+                "start_date", "due_date", "milestone_key", "created_at", "updated_at")
+
+
+def _json_object(session: Session, pairs: list):
+    fn = func.json_build_object if session.get_bind().dialect.name == "postgresql" else func.json_object
+    return fn(*[x for k, v in pairs for x in (literal(k), v)])
+
+
+def _task_map(session: Session, src_id: int, new_id: int):
+    """
+    (old_id, new_id) — 두 학회 task 를 id 순서로 짝지음
+    - 한 문장으로 넣은 새 task id 가 빈틈없이 이어져 있으면 (SQLite 는 항상) 순번 + 시작 id
+    - 아니면 (다른 세션과 sequence 를 나눠 쓴 경우 등) 양쪽 순번끼리 join
+    - CTE 로 한 번만 계산 (subquery 로 두면 SQLite 가 join 할 때마다 다시 계산)
+    """
+    lo, hi, n = session.exec(
+        select(func.min(Task.id), func.max(Task.id), func.count()).where(Task.conference_id == new_id)
+    ).one()
+    rank = func.row_number().over(order_by=Task.id)
+    if n and hi - lo + 1 == n:
+        return (
+            select(Task.id.label("old_id"), (rank + (lo - 1)).label("new_id"))
+            .where(Task.conference_id == src_id)
+            .cte("task_map")
+        )
+    old = select(Task.id.label("id"), rank.label("rn")).where(Task.conference_id == src_id).subquery("old_task")
+    new = select(Task.id.label("id"), rank.label("rn")).where(Task.conference_id == new_id).subquery("new_task")
+    return (
+        select(old.c.id.label("old_id"), new.c.id.label("new_id"))
+        .join(new, new.c.rn == old.c.rn)
+        .cte("task_map")
+    )
+
+
+def clone_into(session: Session, src: Conference, conf: Conference, days: int,
+               assignments: bool = True, dependencies: bool = True) -> dict[str, Any]:
+    """
+    src 의 milestone / task (+ 할당, 의존관계) 를 conf 로 복사 (conf 는 flush 돼서 id 가 있어야 함)
+    → 테이블별 복사 행 수
+    """
+    now = datetime.utcnow()
+    stamp = literal(now, Task.created_at.type)
+
+    m = session.execute(insert(Milestone).from_select(
+        ["conference_id", "key", "name", "relative_days", "target_date", "locked"],
+        select(literal(conf.id), Milestone.key, Milestone.name, Milestone.relative_days,
+               shift_date(session, Milestone.target_date, days), Milestone.locked)
+        .where(Milestone.conference_id == src.id)
+        .order_by(Milestone.id),
+    ))
+
+    t = session.execute(insert(Task).from_select(
+        ["conference_id", "task_group", "name", "description", "status", "priority",
+         "start_date", "due_date", "milestone_key", "created_at", "updated_at"],
+        select(literal(conf.id), Task.task_group, Task.name, Task.description, literal("todo"),
+               Task.priority, shift_date(session, Task.start_date, days),
+               shift_date(session, Task.due_date, days), Task.milestone_key, stamp, stamp)
+        .where(Task.conference_id == src.id)
+        .order_by(Task.id),
+    ))
+
+    # task create audit (audit() 가 남기는 것과 같은 모양, encoding=full)
+    iso = literal(now.isoformat())
+    after = _json_object(session, [
+        (k, iso if k in ("created_at", "updated_at") else getattr(Task, k)) for k in _TASK_FIELDS
+    ])
+    session.execute(insert(AuditLog).from_select(
+        ["conference_id", "entity_type", "entity_id", "action", "before_json", "after_json",
+         "encoding", "created_at"],
+        select(literal(conf.id), literal("task"), Task.id, literal("create"), literal("{}"),
+               after, literal("full"), literal(now, AuditLog.created_at.type))
+        .where(Task.conference_id == conf.id)
+        .order_by(Task.id),
+    ))
+
+    out = {"milestones": m.rowcount, "tasks": t.rowcount, "assignments": 0, "dependencies": 0}
+    task_map = _task_map(session, src.id, conf.id)
+    if assignments:
+        # 같은 task/사람/역할이 여러 번 있으면 1개만
+        session.execute(insert(Assignment).from_select(
+            ["task_id", "person_id", "responsibility", "created_at"],
+            select(task_map.c.new_id, Assignment.person_id, Assignment.responsibility,
+                   literal(now, Assignment.created_at.type))
+            .select_from(Assignment)
+            .join(task_map, task_map.c.old_id == Assignment.task_id)
+            .group_by(task_map.c.new_id, Assignment.person_id, Assignment.responsibility)
+            .order_by(func.min(Assignment.id)),
+        ))
+        # WITH … INSERT 는 sqlite3 드라이버가 rowcount 를 -1 로 돌려줌 → 따로 셈
+        out["assignments"] = session.exec(
+            select(func.count()).select_from(Assignment).join(Task, Task.id == Assignment.task_id)
+            .where(Task.conference_id == conf.id)
+        ).one()
+
+    if dependencies:
+        pre, post = task_map.alias("dep_from"), task_map.alias("dep_to")
+        session.execute(insert(TaskDependency).from_select(
+            ["conference_id", "task_id", "depends_on_id", "created_at"],
+            select(literal(conf.id), pre.c.new_id, post.c.new_id,
+                   literal(now, TaskDependency.created_at.type))
+            .select_from(TaskDependency)
+            .join(pre, pre.c.old_id == TaskDependency.task_id)
+            .join(post, post.c.old_id == TaskDependency.depends_on_id)
+            .where(TaskDependency.conference_id == src.id)
+            .order_by(TaskDependency.id),
+        ))
+        out["dependencies"] = session.exec(
+            select(func.count()).where(TaskDependency.conference_id == conf.id)
+        ).one()
+
+    return out
@@ -0,0 +1,139 @@
+# backend/app/copy_db.py
+"""
+DB → DB 데이터 복사 (SQLite conf_os.db → Postgres 이전용)
+
+    python -m app.copy_db SOURCE_URL TARGET_URL [--chunk 5000]
+    python -m app.copy_db sqlite:///./conf_os.db postgresql://user:pw@localhost/conf_os
+
+- 원본 / 대상 DB 스키마 모두 migrations.upgrade() 로 먼저 맞춤
+  → 원본이 예전 스키마여도 models.py 컬럼으로 읽을 수 있음
+- 원본의 지워진 사람을 가리키는 할당은 복사 전에 삭제 (Postgres FK 에 걸리지 않게)
+- 테이블을 FK 순서대로, id 순으로 CHUNK 행씩 읽어서 (yield_per) 바로 쓰고 commit
+  → DB 크기와 상관없이 메모리 일정 (한 번에 CHUNK 행만)
+  - 대상이 Postgres(psycopg2) 면 COPY FROM STDIN (executemany insert 보다 2배+ 빠름), 아니면 insert
+- 중간에 멈추면 같은 명령을 다시 실행: 대상에 이미 있는 max(id) 다음부터 이어서
+- Postgres 는 끝나고 id sequence 를 max(id) 로 맞춤 (안 하면 다음 insert 가 id 충돌)
+- FTS 검색 index(fts_*) 는 옮기지 않음 (대상이 SQLite 면 startup / 첫 검색에서 다시 만듦)
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import time
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import func, insert, select, text
+from sqlmodel import SQLModel
+
+from . import migrations
+from .db import make_engine, normalize_url
+
+
+def _log(msg: str) -> None:
+    print(msg, file=sys.stderr, flush=True)
+
+
+def _copy_text(v: Any) -> str:
+    """COPY text 형식 한 칸"""
+    if v is None:
+        return "\\N"
+    if isinstance(v, bool):
+        return "t" if v else "f"
+    if isinstance(v, (date, datetime)):
+        return v.isoformat()
+    return (str(v).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _write(conn, table, part: list) -> None:
+    if conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg2":
+        buf = io.StringIO("".join("\t".join(map(_copy_text, r)) + "\n" for r in part))
+        cols = ", ".join(c.name for c in table.columns)
+        conn.connection.cursor().copy_expert(f"COPY {table.name} ({cols}) FROM STDIN", buf)
+    else:
+        conn.execute(insert(table), [r._asdict() for r in part])
+
+
+def copy_table(src, dst, table, chunk: int) -> dict:
+    pk = table.c.id
+    with dst.connect() as conn:
+        last = conn.execute(select(func.max(pk))).scalar() or 0
+    with src.connect() as conn:
+        todo = conn.execute(select(func.count()).select_from(table).where(pk > last)).scalar()
+
+    copied = 0
+    t0 = time.perf_counter()
+    with src.connect() as read:
+        rows = read.execution_options(yield_per=chunk).execute(
+            select(table).where(pk > last).order_by(pk)
+        )
+        for part in rows.partitions():
+            with dst.begin() as write:
+                _write(write, table, part)
+            copied += len(part)
+            _log(f"  {table.name}: {copied}/{todo} ({copied / (time.perf_counter() - t0):.0f} rows/s)")
+    return {"resumed_after_id": last, "copied": copied,
+            "seconds": round(time.perf_counter() - t0, 2)}
+
+
+def reset_sequences(dst) -> None:
+    """Postgres: 복사한 id 뒤부터 이어서 발급되게"""
+    if dst.dialect.name != "postgresql":
+        return
+    with dst.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {table.name}"
+            ))
+
+
+def verify(src, dst) -> dict:
+    """테이블별 (행 수, max id) 비교"""
+    out = {}
+    for table in SQLModel.metadata.sorted_tables:
+        q = select(func.count(), func.max(table.c.id))
+        with src.connect() as a, dst.connect() as b:
+            out[table.name] = {"source": list(a.execute(q).one()), "target": list(b.execute(q).one())}
+        out[table.name]["ok"] = out[table.name]["source"] == out[table.name]["target"]
+    return out
+
+
+def copy_db(source_url: str, target_url: str, chunk: int = 5000) -> dict:
+    src = make_engine(normalize_url(source_url), "plain")  # 한 번 훑고 끝 → 큰 mmap/cache 불필요
+    dst = make_engine(normalize_url(target_url))
+    for name, engine in (("source", src), ("target", dst)):
+        applied = migrations.upgrade(engine)
+        _log(f"{name} schema: applied {applied or 'nothing (up to date)'}")
+    # 0003 이후에 (SQLite 는 FK 검사 없음) 생긴 것까지
+    with src.begin() as conn:
+        orphans = migrations.delete_orphan_assignments(conn)
+    if orphans:
+        _log(f"source: deleted {orphans} assignments of deleted people")
+
+    tables = {}
+    for table in SQLModel.metadata.sorted_tables:
+        tables[table.name] = copy_table(src, dst, table, chunk)
+    reset_sequences(dst)
+    result = {"tables": tables, "verify": verify(src, dst)}
+    src.dispose()
+    dst.dispose()
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("source_url")
+    p.add_argument("target_url")
+    p.add_argument("--chunk", type=int, default=5000, help="한 번에 읽고 쓰는 행 수")
+    args = p.parse_args(argv)
+    result = copy_db(args.source_url, args.target_url, args.chunk)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0 if all(v["ok"] for v in result["verify"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,155 @@
-from sqlmodel import SQLModel, create_engine, Session
+import importlib.util
+import logging
+import os
+
+from sqlalchemy import event
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+log = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    # postgres:// (Heroku 등) 은 SQLAlchemy 2 에서 안 받음
+    if url.startswith("postgres://"):
+        return "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+# ✅ env 로 설정 (.env 또는 shell)
+# - DATABASE_URL : 기본 sqlite:///./conf_os.db
+#                  Postgres: postgresql://user:pw@host:5432/conf_os (psycopg2 필요)
+# - DB_PROFILE   : tuned(기본) = WAL + pragma + pool 크기 지정 / plain = 예전 기본 엔진
+DB_URL = normalize_url(os.getenv("DATABASE_URL") or "sqlite:///./conf_os.db")
+DB_PROFILE = (os.getenv("DB_PROFILE") or "tuned").strip().lower()
+DB_ECHO = (os.getenv("DB_ECHO") or "").lower() in ("1", "true", "yes")  # 디버깅 시 1로
+# - DB_ASYNC     : 1 이면 읽기 위주 목록 API 를 async 엔진(aiosqlite / asyncpg)으로
+#                  (드라이버가 없으면 경고 후 threadpool 그대로)
+DB_ASYNC = (os.getenv("DB_ASYNC") or "").lower() in ("1", "true", "yes")
+
+# tuned 프로필에서 connect 시 적용하는 SQLite pragma
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE") or "WAL",   # reader 가 writer 에 막히지 않음
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS") or "NORMAL",  # WAL 에서는 NORMAL 로도 안전
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS") or 5000),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE") or -64000),  # 음수 = KiB (64MB)
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE") or 256 * 1024 * 1024),
+    "temp_store": "MEMORY",
+}
+
+
+def _engine_kwargs(url: str, profile: str) -> dict:
+    if profile != "tuned":
+        return {}
+    kw = {"pool_pre_ping": True}
+    if ":memory:" in url:
+        return kw
+    kw.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE") or 10),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW") or 20),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT") or 30),
+    )
+    if url.startswith("sqlite"):
+        kw["connect_args"] = {"check_same_thread": False}
+    else:
+        # 서버 DB: 오래된 연결은 재연결 (방화벽 / pgbouncer idle timeout)
+        kw["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE") or 1800)
+    return kw
+
+
+def _apply_sqlite_pragmas(dbapi_conn, _record):
+    cur = dbapi_conn.cursor()
+    for k, v in SQLITE_PRAGMAS.items():
+        cur.execute(f"PRAGMA {k}={v}")
+    cur.close()
+
+
+def make_engine(url: str = DB_URL, profile: str = DB_PROFILE):
+    eng = create_engine(url, echo=DB_ECHO, **_engine_kwargs(url, profile))
+    if profile == "tuned" and url.startswith("sqlite"):
+        event.listen(eng, "connect", _apply_sqlite_pragmas)
+    return eng
+
+
+engine = make_engine()
+
+# -----------------------
+# async (DB_ASYNC=1)
+# -----------------------
+# sync URL scheme → (async driver URL scheme, 필요한 패키지)
+ASYNC_DRIVERS = {
+    "sqlite": ("sqlite+aiosqlite", "aiosqlite"),
+    "postgresql": ("postgresql+asyncpg", "asyncpg"),
+}
+_async_engine = None
+
+
+def async_driver(url: str):
+    """(async URL, 패키지) — 지원하지 않는 DB 면 None"""
+    scheme, rest = url.split("://", 1)
+    found = ASYNC_DRIVERS.get(scheme.split("+")[0])
+    return (f"{found[0]}://{rest}", found[1]) if found else None
+
+
+def make_async_engine(url: str, profile: str = DB_PROFILE):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    eng = create_async_engine(async_driver(url)[0], echo=DB_ECHO, **_engine_kwargs(url, profile))
+    if profile == "tuned" and url.startswith("sqlite"):
+        event.listen(eng.sync_engine, "connect", _apply_sqlite_pragmas)
+    return eng
+
+
+def get_async_engine():
+    """지금 engine 과 같은 DB 를 보는 async 엔진 (engine 을 바꾸면 같이 바뀜)"""
+    global _async_engine
+    url = engine.url.render_as_string(hide_password=False)
+    if _async_engine is None or _async_engine.url.database != engine.url.database:
+        _async_engine = make_async_engine(url)
+    return _async_engine
+
+
+def _async_enabled() -> bool:
+    if not DB_ASYNC:
+        return False
+    driver = async_driver(DB_URL)
+    if driver is None or importlib.util.find_spec(driver[1]) is None:
+        log.warning("DB_ASYNC=1 but no async driver for %s, using threadpool", DB_URL.split("://")[0])
+        return False
+    return True
+
+
+ASYNC_ENABLED = _async_enabled()
 
-DB_URL = "sqlite:///./conf_os.db"
-engine = create_engine(DB_URL, echo=False)  # 디버깅 시 True로
 
 def init_db():
-    SQLModel.metadata.create_all(engine)
+    # 스키마 생성/변경은 버전 관리되는 migration 단계로 (migrations.py)
+    from . import migrations
+
+    migrations.upgrade(engine)
+
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
+
+
+# 읽기 위주 목록 API 용: DB_ASYNC 면 AsyncSession, 아니면 기존 Session (threadpool)
+get_read_session = get_async_session if ASYNC_ENABLED else get_session
+
+
+async def run_read(session, fn, *args):
+    """
+    fn(sync_session, *args) 를 실행
+    - AsyncSession: run_sync → 쿼리 대기 중에는 event loop 를 놓아줌 (threadpool worker 를 잡지 않음)
+    - Session: threadpool 에서 (예전 sync def 와 같음)
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(fn, *args)
+    return await run_in_threadpool(fn, session, *args)
@@ -0,0 +1,179 @@
+# backend/app/events.py
+"""
+학회별 변경 피드 (SSE)
+
+- 소스는 AuditLog: 이벤트 id = AuditLog.id → Last-Event-ID 로 이어받기
+- audit 가 commit(또는 write-behind 로 insert)되면 notify(cid) 로 구독자를 깨움
+- 구독자별 큐를 두지 않음: 학회마다 asyncio.Event 하나를 공유하고,
+  깨어난 구독자가 자기 last_id 이후만 DB 에서 읽음 (idle 연결당 메모리 최소)
+- 다른 워커 프로세스의 변경은 SSE_POLL_SECONDS 마다 DB 확인으로 따라잡음
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from typing import AsyncIterator, Iterable, Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from . import db
+from .models import AuditLog
+
+SSE_POLL_SECONDS = float(os.getenv("SSE_POLL_SECONDS") or 5)
+SSE_PING_SECONDS = float(os.getenv("SSE_PING_SECONDS") or 15)
+SSE_REPLAY_MAX = int(os.getenv("SSE_REPLAY_MAX") or 1000)  # 이보다 밀리면 reset
+
+
+class ChangeHub:
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._events: dict[int, asyncio.Event] = {}
+        self._subscribers: dict[int, int] = {}
+        self._latest: dict[int, tuple[float, int]] = {}  # cid -> (조회 시각, max audit id)
+        self._lock = threading.Lock()
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def notify(self, conference_ids: Iterable[int]) -> None:
+        """어느 스레드에서 불러도 됨 (sync endpoint / audit writer)"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        for cid in set(conference_ids):
+            if cid in self._subscribers:
+                loop.call_soon_threadsafe(self._wake, cid)
+
+    def _wake(self, cid: int) -> None:
+        ev = self._events.pop(cid, None)
+        if ev:
+            ev.set()
+
+    def arm(self, cid: int) -> asyncio.Event:
+        """DB 를 읽기 전에 받아둠 → 읽는 사이에 온 notify 도 놓치지 않음"""
+        ev = self._events.get(cid)
+        if ev is None:
+            ev = self._events[cid] = asyncio.Event()
+        return ev
+
+    async def latest_id(self, cid: int) -> int:
+        """
+        학회의 최신 audit id (구독자끼리 공유, SSE_POLL_SECONDS/2 동안 재사용)
+        → idle 구독자가 수백 개여도 폴링 쿼리는 학회당 1번
+        """
+        now = asyncio.get_running_loop().time()
+        hit = self._latest.get(cid)
+        if hit and now - hit[0] < SSE_POLL_SECONDS / 2:
+            return hit[1]
+        value = await run_in_threadpool(_latest_id, cid)
+        self._latest[cid] = (now, value)
+        return value
+
+    def subscribe(self, cid: int) -> None:
+        with self._lock:
+            self._subscribers[cid] = self._subscribers.get(cid, 0) + 1
+
+    def unsubscribe(self, cid: int) -> None:
+        with self._lock:
+            n = self._subscribers.get(cid, 0) - 1
+            if n > 0:
+                self._subscribers[cid] = n
+            else:
+                self._subscribers.pop(cid, None)
+                self._events.pop(cid, None)
+                self._latest.pop(cid, None)
+
+    def stats(self) -> dict[str, int]:
+        return {str(cid): n for cid, n in self._subscribers.items()}
+
+
+hub = ChangeHub()
+
+
+def notify(conference_ids: Iterable[int]) -> None:
+    hub.notify(conference_ids)
+
+
+# -----------------------
+# DB
+# -----------------------
+def _latest_id(cid: int) -> int:
+    with Session(db.engine) as s:
+        return s.exec(select(func.max(AuditLog.id)).where(AuditLog.conference_id == cid)).one() or 0
+
+
+def _rows_after(cid: int, last_id: int, limit: int) -> list[tuple]:
+    with Session(db.engine) as s:
+        return s.exec(
+            select(AuditLog.id, AuditLog.entity_type, AuditLog.entity_id, AuditLog.action,
+                   AuditLog.encoding, AuditLog.after_json)
+            .where(AuditLog.conference_id == cid, AuditLog.id > last_id)
+            .order_by(AuditLog.id)
+            .limit(limit)
+        ).all()
+
+
+# after_json 이 entity 전체 스냅샷인 action (assign / unassign 등은 일부 필드만)
+SNAPSHOT_ACTIONS = frozenset({"create", "update", "update_status", "update_dates"})
+
+
+def _delta(row: tuple) -> str:
+    rid, entity_type, entity_id, action, encoding, after_json = row
+    full = encoding == "checkpoint" or (encoding == "full" and action in SNAPSHOT_ACTIONS)
+    # after_json 은 이미 JSON 문자열 → 다시 파싱하지 않고 그대로 끼워 넣음
+    return (
+        f"id: {rid}\n"
+        f"event: {entity_type}\n"
+        f'data: {{"id":{rid},"entity_id":{entity_id},"action":{json.dumps(action)},'
+        f'"full":{"true" if full else "false"},"changes":{after_json}}}\n\n'
+    )
+
+
+async def stream(cid: int, last_event_id: Optional[int],
+                 is_disconnected) -> AsyncIterator[str]:
+    """
+    SSE 본문
+    - last_event_id 가 없으면 지금부터, 있으면 그 다음 audit 부터
+    - SSE_REPLAY_MAX 보다 많이 밀려 있으면 'reset' 을 보내고 최신으로 건너뜀 (클라이언트는 전체 새로고침)
+    """
+    hub.bind(asyncio.get_running_loop())
+    hub.subscribe(cid)
+    try:
+        last = last_event_id if last_event_id is not None else await run_in_threadpool(_latest_id, cid)
+        yield f"retry: 3000\nid: {last}\nevent: hello\ndata: {{\"last_id\":{last}}}\n\n"
+
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        woken = True
+        while not await is_disconnected():
+            ev = hub.arm(cid)
+            # notify 없이 깨어난 경우(폴링)는 공유된 최신 id 로 먼저 확인
+            if not woken and await hub.latest_id(cid) <= last:
+                rows = []
+            else:
+                rows = await run_in_threadpool(_rows_after, cid, last, SSE_REPLAY_MAX + 1)
+            if len(rows) > SSE_REPLAY_MAX:
+                last = await run_in_threadpool(_latest_id, cid)
+                last_sent = loop.time()
+                yield f"id: {last}\nevent: reset\ndata: {{\"last_id\":{last}}}\n\n"
+                continue
+            if rows:
+                last = rows[-1][0]
+                last_sent = loop.time()
+                yield "".join(_delta(r) for r in rows)
+                continue
+
+            try:
+                await asyncio.wait_for(ev.wait(), SSE_POLL_SECONDS)
+                woken = True
+            except asyncio.TimeoutError:
+                woken = False
+            if loop.time() - last_sent >= SSE_PING_SECONDS:
+                last_sent = loop.time()
+                yield ": ping\n\n"
+    finally:
+        hub.unsubscribe(cid)
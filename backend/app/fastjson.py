@@ -0,0 +1,81 @@
+# backend/app/fastjson.py
+"""
+목록 응답 JSON 경로
+
+- 행을 ORM 객체 / response_model 로 다시 검증하지 않고 SQL 행 → dict → JSON
+- FAST_JSON=1 이면 orjson (설치돼 있을 때) + 전체 목록은 yield_per 로 읽으면서 바로 스트리밍
+- FAST_JSON 이 꺼져 있거나 orjson 이 없으면 표준 json (출력 형식은 같음)
+"""
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime
+from typing import Any, Iterator, Optional
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from . import db
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+FAST_JSON = (os.getenv("FAST_JSON") or "").lower() in ("1", "true", "yes")
+STREAM_CHUNK = int(os.getenv("FAST_JSON_CHUNK") or 1000)  # 한 번에 읽어서 내보낼 행 수
+
+_PASS_HEADERS = ("ETag", "Cache-Control", "X-Next-Cursor")
+
+
+def fast() -> bool:
+    return FAST_JSON and orjson is not None
+
+
+def _default(v):
+    if isinstance(v, (date, datetime)):
+        return v.isoformat()
+    raise TypeError(f"{type(v).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    if fast():
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def _headers(response: Optional[Response]) -> dict[str, str]:
+    # Response 를 직접 돌려주면 주입된 response 의 헤더(ETag 등)는 빠지므로 옮겨 줌
+    if response is None:
+        return {}
+    return {k: response.headers[k] for k in _PASS_HEADERS if k in response.headers}
+
+
+def json_response(rows: list[dict[str, Any]], response: Optional[Response] = None) -> Response:
+    return Response(dumps(rows), media_type="application/json", headers=_headers(response))
+
+
+def rows_as_dicts(result, names: list[str]) -> list[dict[str, Any]]:
+    return [dict(zip(names, r)) for r in result]
+
+
+def _stream(stmt, names: list[str]) -> Iterator[bytes]:
+    # 요청 세션은 응답 전에 닫히므로 스트리밍은 자기 세션으로
+    with Session(db.engine) as s:
+        yield b"["
+        first = True
+        for part in s.execute(stmt.execution_options(yield_per=STREAM_CHUNK)).partitions():
+            body = dumps(rows_as_dicts(part, names))[1:-1]
+            if not first:
+                yield b","
+            yield body
+            first = False
+        yield b"]"
+
+
+def stream_response(stmt, names: list[str], response: Optional[Response] = None) -> StreamingResponse:
+    """stmt 결과를 STREAM_CHUNK 행씩 JSON 배열로 흘려보냄 (메모리 일정)"""
+    return StreamingResponse(_stream(stmt, names), media_type="application/json",
+                             headers=_headers(response))
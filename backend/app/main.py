@@ -2,21 +2,32 @@ import os
 from fastapi import Header
 
 from datetime import date, timedelta, datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, File, HTTPException, Request, Response, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import ValidationError
 
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
-from .db import init_db, get_session
-from .models import Conference, Task, Milestone, Person, Assignment, AuditLog, RoleTemplate
-from .templates import MILESTONE_TEMPLATE, DEFAULT_TASKS
-
-import json
 from dotenv import load_dotenv
 
-load_dotenv(override=True)  # ✅ main.py 맨 위쪽(전역)에 1번만
+load_dotenv(override=True)  # ✅ main.py 맨 위쪽(전역)에 1번만 (app 모듈들이 env 를 읽기 전에)
+
+from .db import init_db, get_session, get_read_session, run_read
+from .models import Conference, Task, TaskDependency, Milestone, Person, Assignment, AuditLog, RoleTemplate
+from .templates import MILESTONE_TEMPLATE, DEFAULT_TASKS
+from .queries import task_assignments, conference_assignments, audit_page, conference_stats, list_page, list_query
+from .cache import role_cache
+from .versions import conference_etag, people_etag, query_etag, not_modified
+from . import audit as audit_log, events, fastjson, metrics, search, spreadsheet
+from .audit import audit, audit_many, entity_state, prime_since_reset
+from .schedule import ScheduleShift, creates_cycle, critical_paths
+from .clone import clone_into
+
 
 def get_admin_password() -> str:
     return (os.getenv("ADMIN_PASSWORD") or "").strip()
@@ -38,40 +49,6 @@ def to_date_obj(v):
         return date.fromisoformat(v[:10])
     raise ValueError("Invalid date value")
 
-def sanitize_for_json(obj):
-    """
-    AuditLog에 넣기 위한 JSON-safe 변환
-    - date/datetime -> isoformat
-    """
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, (date, datetime)):
-        return obj.isoformat()
-    if isinstance(obj, list):
-        return [sanitize_for_json(x) for x in obj]
-    if isinstance(obj, dict):
-        return {k: sanitize_for_json(v) for k, v in obj.items()}
-    return str(obj)
-
-
-def audit(session: Session, conference_id: int, entity_type: str, entity_id: int,
-          action: str, before: Dict[str, Any], after: Dict[str, Any]) -> None:
-    row = AuditLog(
-        conference_id=conference_id,
-        actor_person_id=None,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        before_json=json.dumps(sanitize_for_json(before), ensure_ascii=False),
-        after_json=json.dumps(sanitize_for_json(after), ensure_ascii=False),
-        created_at=datetime.utcnow(),
-    )
-    session.add(row)
-    session.commit()
-
-
 app = FastAPI(title="Conference OS (MVP)")
 
 app.add_middleware(
@@ -80,12 +57,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
 )
+metrics.install(app)  # ✅ route 별 latency / SQL 수·시간 + Server-Timing 헤더 (METRICS=0 이면 끔)
 
 
 @app.on_event("startup")
 def on_startup():
     init_db()
+    search.init_search()
+    audit_log.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    audit_log.stop()  # write-behind 큐 flush
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """✅ Prometheus scrape (text format)"""
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 # -----------------------
@@ -107,8 +99,8 @@ DEFAULT_ROLE_TEMPLATES = [
 
 @app.post("/role-templates/seed")
 def seed_role_templates(session: Session = Depends(get_session)):
-    # 이미 있으면 아무 것도 안 함
-    existing = session.exec(select(RoleTemplate)).all()
+    # 이미 있으면 아무 것도 안 함 (캐시로 확인, 테이블 스캔 X)
+    _, existing, _ = role_cache.snapshot(session)
     if existing:
         return {"ok": True, "seeded": False, "count": len(existing)}
 
@@ -118,13 +110,21 @@ def seed_role_templates(session: Session = Depends(get_session)):
             created_at=datetime.utcnow(), updated_at=datetime.utcnow()
         ))
     session.commit()
+    role_cache.invalidate()
     return {"ok": True, "seeded": True}
 
 
 @app.get("/role-templates", response_model=List[RoleTemplate])
-def list_role_templates(session: Session = Depends(get_session)):
-    rows = session.exec(select(RoleTemplate).order_by(RoleTemplate.sort_order, RoleTemplate.label)).all()
-    return rows
+def list_role_templates(response: Response, if_none_match: str | None = Header(default=None),
+                        session: Session = Depends(get_session)):
+    """✅ 캐시에서 반환 + ETag (If-None-Match 일치 시 304)"""
+    version, rows, _ = role_cache.snapshot(session)
+    return not_modified(f'W/"roles-{version}"', if_none_match, response) or rows
+
+
+@app.get("/role-templates/cache-stats")
+def role_template_cache_stats():
+    return role_cache.stats()
 
 @app.post("/role-templates", response_model=RoleTemplate)
 def create_role_template(body: dict, session: Session = Depends(get_session)):
@@ -146,6 +146,7 @@ def create_role_template(body: dict, session: Session = Depends(get_session)):
     )
     session.add(rt)
     session.commit()
+    role_cache.invalidate()
     session.refresh(rt)
     return rt
 
@@ -175,6 +176,7 @@ def patch_role_template(rid: int, body: dict, session: Session = Depends(get_ses
     rt.updated_at = datetime.utcnow()
     session.add(rt)
     session.commit()
+    role_cache.invalidate()
     session.refresh(rt)
     return rt
 
@@ -188,6 +190,7 @@ def delete_role_template(rid: int, session: Session = Depends(get_session)):
     # 주의: 이미 Assignment에 쓰인 key를 삭제하면 표시가 깨질 수 있음(프론트는 fallback)
     session.delete(rt)
     session.commit()
+    role_cache.invalidate()
     return {"ok": True}
 
 
@@ -213,6 +216,9 @@ def create_conference(payload: dict, session: Session = Depends(get_session)):
             detail="Conference already exists"
         )
 
+    # 역할 템플릿 시드 (commit 이 conf 를 expire 시키지 않도록 먼저)
+    seed_role_templates(session)
+
     # ✅ 2) 생성
     conf = Conference(
         year=year,
@@ -230,10 +236,6 @@ def create_conference(payload: dict, session: Session = Depends(get_session)):
     session.add(conf)
     session.commit()
     session.refresh(conf)
-
-    # 역할 템플릿 시드
-    seed_role_templates(session)
-
     return conf
 
 
@@ -261,34 +263,52 @@ def delete_conference(
     if not conf:
         raise HTTPException(404, "Conference not found")
 
-    # tasks
-    tasks = session.exec(select(Task).where(Task.conference_id == cid)).all()
-    task_ids = [t.id for t in tasks]
-
-    # assignments
-    if task_ids:
-        assigns = session.exec(select(Assignment).where(Assignment.task_id.in_(task_ids))).all()
-        for a in assigns:
-            session.delete(a)
+    # ✅ ORM 으로 한 줄씩 지우지 않고 테이블별 DELETE ... WHERE 한 번씩 (한 트랜잭션)
+    task_ids = select(Task.id).where(Task.conference_id == cid)
+    steps = [
+        ("assignment", delete(Assignment).where(Assignment.task_id.in_(task_ids))),
+        ("taskdependency", delete(TaskDependency).where(TaskDependency.conference_id == cid)),
+        ("milestone", delete(Milestone).where(Milestone.conference_id == cid)),
+        ("auditlog", delete(AuditLog).where(AuditLog.conference_id == cid)),
+        ("task", delete(Task).where(Task.conference_id == cid)),
+        ("conference", delete(Conference).where(Conference.id == cid)),
+    ]
+    session.expunge(conf)
+    deleted = {}
+    for name, stmt in steps:
+        deleted[name] = session.execute(stmt.execution_options(synchronize_session=False)).rowcount
+    search.drop_audit(session, cid)  # audit 검색 index 는 행마다 지우지 않고 테이블째
+    session.commit()
+    critical_paths.drop(cid)
+    return {"ok": True, "deleted": deleted}
 
-    # milestones
-    miles = session.exec(select(Milestone).where(Milestone.conference_id == cid)).all()
-    for m in miles:
-        session.delete(m)
+# -----------------------
+# 목록 공통 (fields / sort / limit + cursor)
+# -----------------------
+LIST_PAGE_MAX = 5000
+TASK_SORTS = ("updated_at", "id")
+PEOPLE_SORTS = ("name", "updated_at", "id")
 
-    # audit logs
-    logs = session.exec(select(AuditLog).where(AuditLog.conference_id == cid)).all()
-    for l in logs:
-        session.delete(l)
 
-    # tasks
-    for t in tasks:
-        session.delete(t)
+def _list_response(session: Session, model, where: list, fields, sort, sortable, limit, cursor,
+                   response: Response) -> Response:
+    """
+    list_query 결과를 바로 JSON 으로 (ORM 객체 / response_model 검증 없이)
+    - FAST_JSON 이고 limit 가 없으면 (cursor 이후) 전체를 나눠 읽으며 스트리밍
+    """
+    if limit is not None:
+        limit = max(1, min(limit, LIST_PAGE_MAX))
+    try:
+        if fastjson.fast() and limit is None:
+            stmt, names, _, _ = list_query(model, where, fields, sort, sortable, cursor=cursor)
+            return fastjson.stream_response(stmt, names, response)
+        rows, next_cursor = list_page(session, model, where, fields, sort, sortable, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return fastjson.json_response(rows, response)
 
-    # conference
-    session.delete(conf)
-    session.commit()
-    return {"ok": True}
 
 # -----------------------
 # People
@@ -323,17 +343,70 @@ def delete_person(pid: int, session: Session = Depends(get_session)):
     p = session.get(Person, pid)
     if not p:
         raise HTTPException(404, "Person not found")
+
+    # ✅ 할당도 같은 트랜잭션에서 삭제 (Assignment.person_id FK — 남겨 두면 Postgres 는 IntegrityError)
+    assigned = session.exec(
+        select(Assignment.task_id, Assignment.responsibility, Task.conference_id)
+        .join(Task, Task.id == Assignment.task_id)
+        .where(Assignment.person_id == pid)
+    ).all()
+    for task_id, role_key, conf_id in assigned:
+        audit(session, conf_id, "task", task_id, "unassign",
+              {"assignees": [{"person_id": pid, "responsibility": role_key}]},
+              {"assignees": []})
+    removed = session.execute(
+        delete(Assignment).where(Assignment.person_id == pid).execution_options(synchronize_session=False)
+    ).rowcount
     session.delete(p)
     session.commit()
-    return {"ok": True}
+    return {"ok": True, "assignments_removed": removed}
 
 
-@app.get("/people", response_model=List[Person])
-def list_people(q: Optional[str] = None, session: Session = Depends(get_session)):
-    stmt = select(Person)
+@app.get("/people")
+def list_people(request: Request, response: Response, q: Optional[str] = None,
+                fields: Optional[str] = None, sort: str = "name",
+                limit: Optional[int] = None, cursor: Optional[str] = None,
+                if_none_match: str | None = Header(default=None),
+                session: Session = Depends(get_session)):
+    """
+    ✅ 사람 목록 (q: 이름 검색)
+    - fields / sort(name | updated_at | id) / limit + cursor 는 list_tasks 와 같음
+    """
+    cached = not_modified(query_etag(people_etag(session), request.url.query), if_none_match, response)
+    if cached:
+        return cached
+    where = []
     if q:
-        stmt = stmt.where(Person.name.contains(q))
-    return session.exec(stmt.order_by(Person.name)).all()
+        ids = search.person_ids_matching(q)  # 3글자 이상은 FTS index
+        where.append(Person.id.in_(ids) if ids is not None else Person.name.contains(q))
+    return _list_response(session, Person, where, fields, sort, PEOPLE_SORTS, limit, cursor, response)
+
+
+# -----------------------
+# Search
+# -----------------------
+SEARCH_KINDS = ("task", "person", "audit")
+
+
+@app.get("/search")
+def search_all(q: str, kinds: str = "task,person,audit", conference_id: Optional[int] = None,
+               limit: int = 20, offset: int = 0, session: Session = Depends(get_session)):
+    """
+    ✅ task / 사람 / audit 통합 검색 (관련도순)
+    - kinds=task,person 처럼 일부만
+    - 다음 페이지는 next_offset
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(400, "q is required")
+    wanted = [k.strip() for k in kinds.split(",") if k.strip()]
+    bad = [k for k in wanted if k not in SEARCH_KINDS]
+    if bad or not wanted:
+        raise HTTPException(400, f"kinds must be among {', '.join(SEARCH_KINDS)}")
+    limit = max(1, min(limit, 100))
+    offset = max(0, offset)
+    items, next_offset = search.search(session, q, wanted, conference_id, limit, offset)
+    return {"items": items, "next_offset": next_offset, "fts": search.enabled()}
 
 
 # -----------------------
@@ -341,57 +414,243 @@ def list_people(q: Optional[str] = None, session: Session = Depends(get_session)
 # -----------------------
 @app.post("/conferences/{cid}/milestones/generate", response_model=List[Milestone])
 def generate_milestones(cid: int, create_default_tasks: bool = True, session: Session = Depends(get_session)):
+    """
+    ✅ MILESTONE_TEMPLATE 기준으로 다시 계산 (여러 번 불러도 같은 결과)
+    - (conference_id, key) 기준 upsert, locked 는 건드리지 않음
+    - 이미 있는 milestone 은 저장된 relative_days 유지 (reschedule 로 민 일정이 되돌아가지 않게)
+    - 템플릿에서 빠진 key 는 locked 가 아니면 삭제
+    - 기본 Task 는 학회당 한 번만
+    - 전부 한 트랜잭션
+    """
     conf = session.get(Conference, cid)
     if not conf:
         raise HTTPException(404, "Conference not found")
 
-    existing = session.exec(select(Milestone).where(Milestone.conference_id == cid)).all()
-    for m in existing:
-        session.delete(m)
-    session.commit()
+    existing = {m.key: m for m in session.exec(select(Milestone).where(Milestone.conference_id == cid)).all()}
+    template_keys = {t["key"] for t in MILESTONE_TEMPLATE}
 
-    created = []
+    inserts, updates, locked = [], [], 0
     for t in MILESTONE_TEMPLATE:
-        target = conf.start_date + timedelta(days=t["relative_days"])
-        m = Milestone(
-            conference_id=cid,
-            key=t["key"],
-            name=t["name"],
-            relative_days=t["relative_days"],
-            target_date=target,
-            locked=False
-        )
-        session.add(m)
-        created.append(m)
-
+        m = existing.get(t["key"])
+        relative_days = t["relative_days"] if m is None else m.relative_days
+        row = {
+            "key": t["key"],
+            "name": t["name"],
+            "relative_days": relative_days,
+            "target_date": conf.start_date + timedelta(days=relative_days),
+        }
+        if m is None:
+            inserts.append({"conference_id": cid, "locked": False, **row})
+        elif m.locked:
+            locked += 1
+        elif any(getattr(m, k) != v for k, v in row.items()):
+            updates.append({"id": m.id, **row})
+
+    stale = [m.id for k, m in existing.items() if k not in template_keys and not m.locked]
+
+    if inserts:
+        session.execute(insert(Milestone), inserts)
+    if updates:
+        session.execute(update(Milestone), updates)
+    if stale:
+        session.execute(delete(Milestone).where(Milestone.id.in_(stale)))
+
+    seeded = 0
+    if create_default_tasks and not conf.tasks_seeded:
+        # 예전 DB: 플래그 없이 이미 task 가 있으면 seed 된 것으로 봄
+        has_tasks = session.exec(select(Task.id).where(Task.conference_id == cid).limit(1)).first()
+        if not has_tasks:
+            now = datetime.utcnow()
+            tasks = [
+                Task(conference_id=cid, task_group=td["task_group"], name=td["name"],
+                     status="todo", priority="med", created_at=now, updated_at=now)
+                for td in DEFAULT_TASKS
+            ]
+            session.add_all(tasks)
+            session.flush()  # id 확보 (insert 는 한 번에 묶여서 나감)
+            for task in tasks:
+                audit(session, cid, "task", task.id, "create", {}, task.model_dump())
+            seeded = len(tasks)
+        conf.tasks_seeded = True
+        session.add(conf)
+
+    audit(session, cid, "milestones", cid, "generate", {}, {
+        "inserted": len(inserts), "updated": len(updates), "removed": len(stale),
+        "locked_skipped": locked, "tasks_seeded": seeded,
+    })
     session.commit()
-    for m in created:
-        session.refresh(m)
-
-    if create_default_tasks:
-        for td in DEFAULT_TASKS:
-            task = Task(
-                conference_id=cid,
-                task_group=td["task_group"],
-                name=td["name"],
-                status="todo",
-                priority="med",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            session.add(task)
-        session.commit()
 
     return session.exec(
         select(Milestone).where(Milestone.conference_id == cid).order_by(Milestone.target_date)
     ).all()
 
 
-@app.get("/conferences/{cid}/milestones", response_model=List[Milestone])
-def list_milestones(cid: int, session: Session = Depends(get_session)):
+def _list_milestones(session: Session, cid: int, if_none_match: Optional[str], response: Response):
+    cached = not_modified(conference_etag(session, cid, "milestones"), if_none_match, response)
+    if cached:
+        return cached
+    if fastjson.fast():
+        cols = Milestone.__table__.c
+        rows = session.execute(
+            select(*cols).where(Milestone.conference_id == cid).order_by(Milestone.target_date)
+        )
+        return fastjson.json_response(fastjson.rows_as_dicts(rows, [c.name for c in cols]), response)
     return session.exec(select(Milestone).where(Milestone.conference_id == cid).order_by(Milestone.target_date)).all()
 
 
+@app.get("/conferences/{cid}/milestones", response_model=List[Milestone])
+async def list_milestones(cid: int, response: Response, if_none_match: str | None = Header(default=None),
+                          session=Depends(get_read_session)):
+    return await run_read(session, _list_milestones, cid, if_none_match, response)
+
+
+@app.post("/conferences/{cid}/reschedule")
+def reschedule_conference(cid: int, body: dict, session: Session = Depends(get_session)):
+    """
+    ✅ 일정 한꺼번에 옮기기
+    body (셋 중 하나):
+      {"start_date": "YYYY-MM-DD"}              학회 전체를 새 시작일로
+      {"shift_days": 7}                          학회 전체를 N일
+      {"milestone_key": "M_3", "shift_days": 7}  그 milestone 부터 이후 일정만 N일
+    "dry_run": true 이면 저장하지 않고 바뀔 내용만 돌려줌
+    """
+    conf = session.get(Conference, cid)
+    if not conf:
+        raise HTTPException(404, "Conference not found")
+
+    try:
+        new_start = to_date_obj(body.get("start_date"))
+        days = int(body["shift_days"]) if body.get("shift_days") is not None else None
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Invalid start_date or shift_days")
+
+    since = None
+    if body.get("milestone_key"):
+        if days is None or new_start is not None:
+            raise HTTPException(400, "milestone_key requires shift_days only")
+        since = session.exec(
+            select(Milestone.target_date)
+            .where(Milestone.conference_id == cid, Milestone.key == body["milestone_key"])
+        ).first()
+        if since is None:
+            raise HTTPException(404, "Milestone not found")
+    elif new_start is not None:
+        if days is not None:
+            raise HTTPException(400, "Give start_date or shift_days, not both")
+        days = (new_start - conf.start_date).days
+    elif days is None:
+        raise HTTPException(400, "start_date or shift_days is required")
+
+    dry_run = body.get("dry_run", False)
+    if not isinstance(dry_run, bool):
+        raise HTTPException(422, "dry_run must be true or false")
+
+    shift = ScheduleShift(conf, days, since)
+    if dry_run:
+        return {"dry_run": True, **shift.diff(session)}
+    if days == 0:
+        return {"dry_run": False, **shift.summary(0, 0)}
+
+    before = {"start_date": conf.start_date, "end_date": conf.end_date}
+    result = shift.apply(session)
+    # task 마다가 아니라 학회 단위로 1건
+    audit(session, cid, "schedule", cid, "reschedule", before, {
+        **result, "milestone_key": body.get("milestone_key"),
+        "end_date": conf.end_date,
+    })
+    session.commit()
+    return {"dry_run": False, **result}
+
+
+@app.post("/conferences/{cid}/clone")
+def clone_conference(cid: int, body: dict, session: Session = Depends(get_session)):
+    """
+    ✅ 작년 학회를 새 연도로 복제 (milestone / task / 할당 / 의존관계, 한 트랜잭션)
+    body: {"year": 2027, "name"?: 원본 이름, "start_date"?: 없으면 원본과 같은 월/일,
+           "assignments"?: true, "dependencies"?: true}
+    - 날짜는 시작일 차이만큼 이동, task 상태는 todo 로
+    """
+    src = session.get(Conference, cid)
+    if not src:
+        raise HTTPException(404, "Conference not found")
+
+    try:
+        year = int(body.get("year") or src.year + 1)
+        start = to_date_obj(body.get("start_date"))
+        if start is None:
+            try:
+                start = src.start_date.replace(year=src.start_date.year + year - src.year)
+            except ValueError:  # 2월 29일
+                start = src.start_date.replace(year=src.start_date.year + year - src.year, day=28)
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Invalid year or start_date")
+    name = body.get("name") or src.name
+
+    exists = session.exec(
+        select(Conference.id).where(Conference.year == year, Conference.name == name)
+    ).first()
+    if exists:
+        raise HTTPException(409, "Conference already exists")
+
+    days = (start - src.start_date).days
+    now = datetime.utcnow()
+    conf = Conference(
+        year=year, name=name, theme=src.theme,
+        start_date=start, end_date=src.end_date + timedelta(days=days),
+        venue_name=src.venue_name, venue_city=src.venue_city, timezone=src.timezone,
+        status="planning", tasks_seeded=src.tasks_seeded,
+        created_at=now, updated_at=now,
+    )
+    session.add(conf)
+    session.flush()  # id 확보
+
+    copied = clone_into(session, src, conf, days,
+                        assignments=body.get("assignments", True) is not False,
+                        dependencies=body.get("dependencies", True) is not False)
+    audit(session, conf.id, "conference", conf.id, "clone", {"source_id": cid},
+          {"shift_days": days, **copied})
+    session.commit()
+    session.refresh(conf)
+    return {"conference": conf, "source_id": cid, "shift_days": days, "copied": copied}
+
+
+@app.get("/conferences/{cid}/stats")
+def get_conference_stats(cid: int, response: Response, soon_days: int = 7, limit: int = 50,
+                         if_none_match: str | None = Header(default=None),
+                         session: Session = Depends(get_session)):
+    """
+    ✅ 대시보드 집계 (GROUP BY 몇 번, task 목록을 통째로 보내지 않음)
+    - overdue / due_soon 은 날짜에 따라 바뀌므로 ETag 에 오늘 날짜 포함
+    - workload 에 사람 이름이 들어가므로 people_etag 도 포함
+    - 없는 학회는 conference_etag 에서 404
+    """
+    today = date.today()
+    soon_days = max(0, min(soon_days, 365))
+    limit = max(1, min(limit, 500))
+    kind = f"stats-{today:%Y%m%d}-{soon_days}-{limit}"
+    cached = not_modified(conference_etag(session, cid, kind, people_etag(session)), if_none_match, response)
+    if cached:
+        return cached
+    return conference_stats(session, cid, today, soon_days, limit)
+
+
+@app.get("/conferences/{cid}/schedule/critical-path")
+def get_critical_path(cid: int, all_tasks: bool = False, session: Session = Depends(get_session)):
+    """
+    ✅ critical path / slack
+    - milestones: milestone 별 예상 완료일, 밀리는 일수, 그 날짜를 결정한 task 사슬
+    - critical_tasks: slack 0 이하인 (안 끝난) task
+    - all_tasks=true 이면 날짜가 잡힌 task 전체의 es/ef/lf/slack
+    """
+    if not session.get(Conference, cid):
+        raise HTTPException(404, "Conference not found")
+    graph = critical_paths.get(session, cid)
+    out = {**graph.result(), "computed": {"mode": graph.mode, "nodes": graph.recomputed}}
+    if all_tasks:
+        out["tasks"] = graph.all_tasks()
+    return out
+
+
 # -----------------------
 # Tasks
 # -----------------------
@@ -406,55 +665,266 @@ def create_task(cid: int, task: Task, session: Session = Depends(get_session)):
     task.updated_at = datetime.utcnow()
 
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    session.flush()  # id 확보
 
     audit(session, cid, "task", task.id, "create", {}, task.model_dump())
+    session.commit()
+    session.refresh(task)
     return task
 
 
-@app.get("/conferences/{cid}/tasks", response_model=List[Task])
-def list_tasks(cid: int, group: Optional[str] = None, status: Optional[str] = None,
-               session: Session = Depends(get_session)):
-    stmt = select(Task).where(Task.conference_id == cid)
+def _list_tasks(session: Session, cid: int, query: str, group, status, fields, sort, limit, cursor,
+                if_none_match: Optional[str], response: Response):
+    etag = query_etag(conference_etag(session, cid, "tasks"), query)
+    cached = not_modified(etag, if_none_match, response)
+    if cached:
+        return cached
+    where = [Task.conference_id == cid]
     if group:
-        stmt = stmt.where(Task.task_group == group)
+        where.append(Task.task_group == group)
     if status:
-        stmt = stmt.where(Task.status == status)
-    return session.exec(stmt.order_by(Task.updated_at.desc())).all()
+        where.append(Task.status == status)
+    return _list_response(session, Task, where, fields, sort, TASK_SORTS, limit, cursor, response)
 
 
-@app.patch("/tasks/{task_id}", response_model=Task)
-def patch_task(task_id: int, payload: dict, session: Session = Depends(get_session)):
-    task = session.get(Task, task_id)
-    if not task:
-        raise HTTPException(404, "Task not found")
+@app.get("/conferences/{cid}/tasks")
+async def list_tasks(cid: int, request: Request, response: Response, group: Optional[str] = None,
+                     status: Optional[str] = None, fields: Optional[str] = None, sort: str = "-updated_at",
+                     limit: Optional[int] = None, cursor: Optional[str] = None,
+                     if_none_match: str | None = Header(default=None),
+                     session=Depends(get_read_session)):
+    """
+    ✅ Task 목록
+    - fields=id,name,status 처럼 필요한 컬럼만 (id 는 항상 포함)
+    - sort: updated_at | id (앞에 '-' 면 내림차순, 기본 -updated_at)
+    - limit 를 주면 페이지 단위, 다음 페이지는 X-Next-Cursor → ?cursor=
+    """
+    return await run_read(session, _list_tasks, cid, request.url.query, group, status, fields, sort,
+                          limit, cursor, if_none_match, response)
 
-    before = task.model_dump()
 
-    allowed = {"task_group", "name", "description", "status", "priority", "start_date", "due_date"}
+TASK_PATCH_FIELDS = {"task_group", "name", "description", "status", "priority", "start_date", "due_date",
+                     "milestone_key"}
+
+
+def apply_task_patch(task: Task, payload: dict) -> str:
+    """
+    payload 를 task 에 반영하고 audit action 이름을 돌려줌
+    - 날짜 파싱 실패(ValueError) 시 task 는 변경되지 않음
+    """
+    changes = {}
     for k, v in payload.items():
-        if k not in allowed:
+        if k not in TASK_PATCH_FIELDS:
             continue
         if k in ("start_date", "due_date"):
             v = to_date_obj(v) if v else None
+        if k == "milestone_key":
+            v = v or None
+        changes[k] = v
+
+    for k, v in changes.items():
         setattr(task, k, v)
 
     task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
-    session.refresh(task)
 
     action = "update"
     if "status" in payload:
         action = "update_status"
     if ("start_date" in payload) or ("due_date" in payload):
         action = "update_dates"
+    return action
+
+
+@app.patch("/tasks/{task_id}", response_model=Task)
+def patch_task(task_id: int, payload: dict, session: Session = Depends(get_session)):
+    task = session.get(Task, task_id)
+    if not task:
+        raise HTTPException(404, "Task not found")
+
+    before = task.model_dump()
+    action = apply_task_patch(task, payload)
+    session.add(task)
 
     audit(session, task.conference_id, "task", task.id, action, before, task.model_dump())
+    session.commit()
+    session.refresh(task)
     return task
 
 
+# -----------------------
+# Task dependencies
+# -----------------------
+@app.get("/conferences/{cid}/dependencies", response_model=List[TaskDependency])
+def list_dependencies(cid: int, session: Session = Depends(get_session)):
+    return session.exec(
+        select(TaskDependency).where(TaskDependency.conference_id == cid).order_by(TaskDependency.id)
+    ).all()
+
+
+@app.post("/tasks/{task_id}/dependencies", response_model=TaskDependency)
+def add_dependency(task_id: int, body: dict, session: Session = Depends(get_session)):
+    # body: {"depends_on_id": 12}  → task_id 는 12 가 끝난 뒤 시작
+    task = session.get(Task, task_id)
+    if not task:
+        raise HTTPException(404, "Task not found")
+    try:
+        dep_id = int(body.get("depends_on_id"))
+    except (TypeError, ValueError):
+        raise HTTPException(400, "depends_on_id is required")
+    dep = session.get(Task, dep_id)
+    if not dep or dep.conference_id != task.conference_id:
+        raise HTTPException(404, "Dependency task not found in this conference")
+    if dep_id == task_id or creates_cycle(session, task_id, dep_id):
+        raise HTTPException(409, "Dependency would create a cycle")
+
+    existing = session.exec(
+        select(TaskDependency).where(TaskDependency.task_id == task_id, TaskDependency.depends_on_id == dep_id)
+    ).first()
+    if existing:
+        return existing
+
+    link = TaskDependency(conference_id=task.conference_id, task_id=task_id, depends_on_id=dep_id)
+    session.add(link)
+    audit(session, task.conference_id, "dependency", task_id, "add", {}, {"depends_on_id": dep_id})
+    session.commit()
+    session.refresh(link)
+    return link
+
+
+@app.delete("/tasks/{task_id}/dependencies/{depends_on_id}")
+def remove_dependency(task_id: int, depends_on_id: int, session: Session = Depends(get_session)):
+    link = session.exec(
+        select(TaskDependency).where(TaskDependency.task_id == task_id,
+                                     TaskDependency.depends_on_id == depends_on_id)
+    ).first()
+    if not link:
+        raise HTTPException(404, "Dependency not found")
+    session.delete(link)
+    audit(session, link.conference_id, "dependency", task_id, "remove", {"depends_on_id": depends_on_id}, {})
+    session.commit()
+    return {"ok": True}
+
+
+# -----------------------
+# Tasks (batch)
+# -----------------------
+def batch_items(body: dict) -> list:
+    # {"items": [ {...}, ... ]}
+    items = body.get("items")
+    if not isinstance(items, list):
+        raise HTTPException(400, "items (list) is required")
+    return items
+
+
+def _is_id(v) -> bool:
+    # JSON 숫자 id 만 (list / dict 는 dict 조회에서 TypeError, bool 은 int 의 subclass)
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def create_tasks(session: Session, cid: int, items: list) -> tuple[list[dict], list[dict]]:
+    """
+    Task 여러 개 생성 + audit (commit 은 호출하는 쪽에서)
+    - 잘못된 항목은 건너뛰고 errors 에 index 와 함께
+    """
+    now = datetime.utcnow()
+    rows = []
+    errors = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append({"index": i, "error": "item must be an object"})
+            continue
+        try:
+            task = Task.model_validate({**item, "id": None, "conference_id": cid,
+                                        "created_at": now, "updated_at": now})
+        except ValidationError as e:
+            msg = "; ".join(f"{'.'.join(map(str, x['loc']))}: {x['msg']}" for x in e.errors())
+            errors.append({"index": i, "error": msg})
+            continue
+        rows.append(task.model_dump(exclude={"id"}))
+    if not rows:
+        return [], errors
+
+    # ✅ task INSERT 1번 (RETURNING 으로 id 까지), audit 도 INSERT 1번
+    # (ORM flush 는 SQLite 에서 id 순서를 보장하려고 행마다 INSERT)
+    # RETURNING 행 순서는 보장되지 않으므로 돌려받은 행 그대로 쓰고 id 순으로 정렬
+    cols = Task.__table__.c
+    result = session.execute(insert(Task.__table__).returning(*cols), rows)
+    out = sorted(fastjson.rows_as_dicts(result, [c.name for c in cols]), key=lambda r: r["id"])
+    audit_many(session, cid, "task", [(r["id"], "create", {}, r) for r in out])
+    return out, errors
+
+
+def patch_tasks(session: Session, cid: int, items: list,
+                skip_unchanged: bool = False) -> tuple[list[dict], list[dict]]:
+    """
+    Task 여러 개 수정 + audit (commit 은 호출하는 쪽에서)
+    - 각 항목: {"id": task_id, ...patch fields}
+    - 다른 학회 task / 없는 id / 잘못된 날짜는 errors 로
+    - skip_unchanged: 값이 하나도 안 바뀐 항목은 updated_at / audit 없이 건너뜀 (가져오기 재실행용)
+    """
+    ids = [it.get("id") for it in items if isinstance(it, dict) and _is_id(it.get("id"))]
+    tasks = {
+        t.id: t for t in session.exec(
+            select(Task).where(Task.conference_id == cid, Task.id.in_(ids))
+        ).all()
+    }
+    prime_since_reset(session, cid, "task", list(tasks))
+
+    out = []
+    changes = []
+    errors = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or not _is_id(item.get("id")):
+            errors.append({"index": i, "error": "id (integer) is required"})
+            continue
+        task = tasks.get(item["id"])
+        if task is None:
+            errors.append({"index": i, "error": "Task not found"})
+            continue
+        before = task.model_dump()
+        try:
+            action = apply_task_patch(task, item)
+        except ValueError as e:
+            errors.append({"index": i, "error": str(e)})
+            continue
+        row = task.model_dump()
+        if skip_unchanged and all(row[k] == before[k] for k in TASK_PATCH_FIELDS):
+            task.updated_at = before["updated_at"]
+            continue
+        session.add(task)
+        changes.append((task.id, action, before, row))
+        out.append(row)
+    audit_many(session, cid, "task", changes)
+    return out, errors
+
+
+@app.post("/conferences/{cid}/tasks:batch")
+def create_tasks_batch(cid: int, body: dict, session: Session = Depends(get_session)):
+    """
+    ✅ Task 여러 개 생성 + audit 까지 한 트랜잭션(commit 1번)
+    - 잘못된 항목은 건너뛰고 errors 에 index 와 함께 보고
+    """
+    conf = session.get(Conference, cid)
+    if not conf:
+        raise HTTPException(404, "Conference not found")
+
+    out, errors = create_tasks(session, cid, batch_items(body))
+    session.commit()
+    return {"ok": not errors, "created": out, "errors": errors}
+
+
+@app.patch("/conferences/{cid}/tasks:batch")
+def patch_tasks_batch(cid: int, body: dict, session: Session = Depends(get_session)):
+    """
+    ✅ Task 여러 개 수정 + audit 까지 한 트랜잭션(commit 1번)
+    - 각 항목: {"id": task_id, ...patch fields}
+    - 다른 학회 task / 없는 id / 잘못된 날짜는 errors 로 보고
+    """
+    out, errors = patch_tasks(session, cid, batch_items(body))
+    session.commit()
+    return {"ok": not errors, "updated": out, "errors": errors}
+
+
 # -----------------------
 # Assignment
 # -----------------------
@@ -475,13 +945,16 @@ def assign_task(task_id: int, body: dict, session: Session = Depends(get_session
         raise HTTPException(404, "Person not found")
 
     # ✅ 역할 키가 템플릿에 없으면 자동 생성(편의)
-    rt = session.exec(select(RoleTemplate).where(RoleTemplate.key == role_key)).first()
-    if not rt:
-        session.add(RoleTemplate(
-            key=role_key, label=role_key, sort_order=999,
-            created_at=datetime.utcnow(), updated_at=datetime.utcnow()
-        ))
-        session.commit()
+    # 캐시에 없을 때만 DB 확인 (다른 워커가 방금 만들었을 수 있음)
+    new_role = False
+    if role_key not in role_cache.labels(session):
+        rt = session.exec(select(RoleTemplate).where(RoleTemplate.key == role_key)).first()
+        if not rt:
+            session.add(RoleTemplate(
+                key=role_key, label=role_key, sort_order=999,
+                created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+            ))
+        new_role = True
 
     a = Assignment(
         task_id=task_id,
@@ -490,47 +963,408 @@ def assign_task(task_id: int, body: dict, session: Session = Depends(get_session
         created_at=datetime.utcnow(),
     )
     session.add(a)
-    session.commit()
-    session.refresh(a)
 
     audit(session, task.conference_id, "task", task.id, "assign",
           {"assignees": []},
           {"assignees": [{"person_id": person_id, "responsibility": role_key}]})
+    session.commit()
+    if new_role:
+        role_cache.invalidate()
+    session.refresh(a)
     return a
 
 
+def _list_assignments(session: Session, task_id: int):
+    return task_assignments(session, task_id, role_cache.labels(session))
+
+
 @app.get("/tasks/{task_id}/assignments")
-def list_assignments(task_id: int, session: Session = Depends(get_session)):
+async def list_assignments(task_id: int, session=Depends(get_read_session)):
     """
     ✅ 프론트가 바로 쓰게:
     - person name/affiliation 포함
     - role_label 포함
     """
-    assigns = session.exec(select(Assignment).where(Assignment.task_id == task_id)).all()
-    if not assigns:
-        return []
+    return await run_read(session, _list_assignments, task_id)
 
-    role_map = {r.key: r.label for r in session.exec(select(RoleTemplate)).all()}
 
-    out = []
-    for a in assigns:
-        p = session.get(Person, a.person_id)
-        out.append({
-            "id": a.id,
-            "task_id": a.task_id,
-            "person_id": a.person_id,
-            "name": p.name if p else "",
-            "affiliation": p.affiliation if p else None,
-            "responsibility": a.responsibility,
-            "role_label": role_map.get(a.responsibility, a.responsibility),
-        })
-    return out
+def _list_conference_assignments(session: Session, cid: int, person_id: Optional[int],
+                                 if_none_match: Optional[str], response: Response):
+    role_version, _, labels = role_cache.snapshot(session)
+    kind = f"assignments-p{person_id}" if person_id else "assignments"  # 필터가 다르면 다른 ETag
+    etag = conference_etag(session, cid, kind, people_etag(session), f"roles-{role_version}")
+    cached = not_modified(etag, if_none_match, response)
+    if cached:
+        return cached
+    return conference_assignments(session, cid, person_id, labels)
+
+
+@app.get("/conferences/{cid}/assignments")
+async def list_conference_assignments(cid: int, response: Response, person_id: Optional[int] = None,
+                                      if_none_match: str | None = Header(default=None),
+                                      session=Depends(get_read_session)):
+    """
+    ✅ 학회 전체 할당을 한 번에 (task별 /tasks/{id}/assignments 반복 호출 대체)
+    - person_id 가 있으면 해당 사람의 할당만
+    """
+    return await run_read(session, _list_conference_assignments, cid, person_id, if_none_match, response)
+
+
+# -----------------------
+# 스프레드시트 내보내기 / 가져오기 (CSV, XLSX)
+# -----------------------
+TASK_EXPORT_COLUMNS = ("id", "task_group", "name", "description", "status", "priority",
+                       "start_date", "due_date", "milestone_key")
+TASK_REQUIRED_FIELDS = ("task_group", "name", "status", "priority")  # NOT NULL: 빈 칸이면 기존 값/기본값
+PERSON_FIELDS = ("name", "affiliation", "role_title")
+
+
+def _export_format(fmt: Optional[str]) -> str:
+    try:
+        return spreadsheet.check_format(fmt)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+def _row_id(row: dict, key: str = "id") -> Optional[int]:
+    """빈 칸이면 None, 숫자가 아니면 ValueError"""
+    v = row.get(key)
+    if v is None:
+        return None
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be an integer")
+
+
+def _text(v):
+    # 엑셀에서 숫자로 읽힌 이름 등은 문자열로
+    return v if v is None or isinstance(v, (str, date)) else str(v)
+
+
+def run_import(session: Session, file: UploadFile, fmt: Optional[str], apply_chunk) -> dict:
+    """
+    업로드 파일을 IMPORT_CHUNK 행씩 apply_chunk(session, [(row, dict), ...]) → commit
+    - apply_chunk 는 ({"created": n, ...}, [{"row", "error"}, ...]) 를 돌려줌
+    - DB 오류가 난 묶음은 rollback 하고 그 묶음의 행 전체를 errors 로 (앞 묶음은 이미 반영됨)
+    """
+    try:
+        fmt = spreadsheet.check_format(fmt, file.filename)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    result = {"created": 0, "updated": 0, "unchanged": 0, "chunks": 0, "errors": []}
+    try:
+        for part in spreadsheet.chunked(spreadsheet.read_rows(file.file, fmt)):
+            try:
+                counts, errors = apply_chunk(session, part)
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                msg = f"chunk rolled back: {e.__class__.__name__}"
+                counts, errors = {}, [{"row": n, "error": msg} for n, _ in part]
+            for k, v in counts.items():
+                result[k] += v
+            result["errors"] += errors
+            result["chunks"] += 1
+    except ValueError as e:
+        # 파일 자체를 읽을 수 없음 (그 전 묶음까지는 반영됨)
+        result["errors"].append({"row": None, "error": str(e)})
+    return {"ok": not result["errors"], **result}
+
+
+@app.get("/conferences/{cid}/tasks:export")
+def export_tasks(cid: int, format: str = "csv", session: Session = Depends(get_session)):
+    """✅ 학회 task 전체를 CSV/XLSX 로 (id 순, 나눠 읽으며 스트리밍)"""
+    if not session.get(Conference, cid):
+        raise HTTPException(404, "Conference not found")
+    fmt = _export_format(format)
+    stmt = (
+        select(*[getattr(Task, c) for c in TASK_EXPORT_COLUMNS])
+        .where(Task.conference_id == cid)
+        .order_by(Task.id)
+    )
+    return spreadsheet.export_response(stmt, list(TASK_EXPORT_COLUMNS), fmt, f"conference-{cid}-tasks")
+
+
+@app.post("/conferences/{cid}/tasks:import")
+def import_tasks(cid: int, file: UploadFile = File(...), format: Optional[str] = None,
+                 session: Session = Depends(get_session)):
+    """
+    ✅ task 가져오기 (tasks:export 와 같은 컬럼)
+    - id 가 있으면 이 학회 task 수정 (파일에 있는 컬럼만, 바뀐 게 없으면 건너뜀), 없으면 생성
+    - IMPORT_CHUNK 행마다 commit, 잘못된 행은 errors 에 엑셀 행 번호와 함께
+    """
+    if not session.get(Conference, cid):
+        raise HTTPException(404, "Conference not found")
+
+    def apply_chunk(session: Session, part: list) -> tuple[dict, list]:
+        creates, patches, errors = [], [], []
+        for n, row in part:
+            item = {k: _text(row[k]) for k in TASK_EXPORT_COLUMNS[1:] if k in row}
+            for k in TASK_REQUIRED_FIELDS:
+                if item.get(k) is None:
+                    item.pop(k, None)
+            try:
+                tid = _row_id(row)
+            except ValueError as e:
+                errors.append({"row": n, "error": str(e)})
+                continue
+            if tid is None:
+                creates.append((n, item))
+            else:
+                patches.append((n, {**item, "id": tid}))
+
+        created, errs = create_tasks(session, cid, [it for _, it in creates])
+        errors += [{"row": creates[e["index"]][0], "error": e["error"]} for e in errs]
+        updated, errs = patch_tasks(session, cid, [it for _, it in patches], skip_unchanged=True)
+        errors += [{"row": patches[e["index"]][0], "error": e["error"]} for e in errs]
+        errors.sort(key=lambda e: e["row"])
+        return {"created": len(created), "updated": len(updated),
+                "unchanged": len(patches) - len(updated) - len(errs)}, errors
+
+    return run_import(session, file, format, apply_chunk)
+
+
+@app.get("/people:export")
+def export_people(format: str = "csv"):
+    """✅ people 전체를 CSV/XLSX 로"""
+    fmt = _export_format(format)
+    stmt = select(Person.id, Person.name, Person.affiliation, Person.role_title).order_by(Person.id)
+    return spreadsheet.export_response(stmt, ["id", *PERSON_FIELDS], fmt, "people")
+
+
+@app.post("/people:import")
+def import_people(file: UploadFile = File(...), format: Optional[str] = None,
+                  session: Session = Depends(get_session)):
+    """
+    ✅ people 가져오기 (people:export 와 같은 컬럼)
+    - id 가 있으면 그 사람 수정, 없으면 같은 이름+소속이 있으면 수정 / 없으면 생성
+    """
+
+    def apply_chunk(session: Session, part: list) -> tuple[dict, list]:
+        counts = {"created": 0, "updated": 0, "unchanged": 0}
+        errors = []
+        rows = []
+        for n, row in part:
+            try:
+                rows.append((n, _row_id(row), {k: _text(row[k]) for k in PERSON_FIELDS if k in row}))
+            except ValueError as e:
+                errors.append({"row": n, "error": str(e)})
+
+        ids = [pid for _, pid, _ in rows if pid is not None]
+        names = [item.get("name") for _, pid, item in rows if pid is None]
+        by_id = {p.id: p for p in session.exec(select(Person).where(Person.id.in_(ids))).all()}
+        by_key = {}
+        for p in session.exec(select(Person).where(Person.name.in_(names)).order_by(Person.id)).all():
+            by_key.setdefault((p.name, p.affiliation), p)
+
+        now = datetime.utcnow()
+        for n, pid, item in rows:
+            if pid is not None:
+                p = by_id.get(pid)
+                if p is None:
+                    errors.append({"row": n, "error": "Person not found"})
+                    continue
+            elif not item.get("name"):
+                errors.append({"row": n, "error": "name is required"})
+                continue
+            else:
+                p = by_key.get((item["name"], item.get("affiliation")))
+
+            if p is None:
+                p = Person(**item, created_at=now, updated_at=now)
+                by_key[(p.name, p.affiliation)] = p
+                counts["created"] += 1
+            else:
+                if not item.get("name"):
+                    item.pop("name", None)
+                changes = {k: v for k, v in item.items() if getattr(p, k) != v}
+                if not changes:
+                    counts["unchanged"] += 1
+                    continue
+                for k, v in changes.items():
+                    setattr(p, k, v)
+                p.updated_at = now
+                counts["updated"] += 1
+            session.add(p)
+        errors.sort(key=lambda e: e["row"])
+        return counts, errors
+
+    return run_import(session, file, format, apply_chunk)
+
+
+@app.get("/conferences/{cid}/assignments:export")
+def export_assignments(cid: int, format: str = "csv", session: Session = Depends(get_session)):
+    """✅ 학회 할당 전체 (task/사람 이름, 역할 라벨 포함)"""
+    if not session.get(Conference, cid):
+        raise HTTPException(404, "Conference not found")
+    fmt = _export_format(format)
+    stmt = (
+        select(Assignment.id, Assignment.task_id, Task.name, Assignment.person_id, Person.name,
+               Person.affiliation, Assignment.responsibility, RoleTemplate.label, Assignment.created_at)
+        .join(Task, Task.id == Assignment.task_id)
+        .join(Person, Person.id == Assignment.person_id)
+        .outerjoin(RoleTemplate, RoleTemplate.key == Assignment.responsibility)
+        .where(Task.conference_id == cid)
+        .order_by(Task.id, Assignment.id)  # join 순서 그대로 (queries.conference_assignments 와 같음)
+    )
+    header = ["id", "task_id", "task_name", "person_id", "person_name", "affiliation",
+              "responsibility", "role_label", "created_at"]
+    return spreadsheet.export_response(stmt, header, fmt, f"conference-{cid}-assignments")
+
+
+@app.post("/conferences/{cid}/assignments:import")
+def import_assignments(cid: int, file: UploadFile = File(...), format: Optional[str] = None,
+                       session: Session = Depends(get_session)):
+    """
+    ✅ 할당 가져오기: task_id + (person_id 또는 person_name) + responsibility(역할 키 또는 라벨)
+    - 같은 task/사람/역할 할당이 이미 있으면 건너뜀 (export 한 파일을 다시 넣어도 중복 없음)
+    - 없는 역할은 assign 과 같이 자동 생성, 같은 이름이 여러 명이면 person_id 를 쓰라고 오류
+    """
+    if not session.get(Conference, cid):
+        raise HTTPException(404, "Conference not found")
+    new_roles: set[str] = set()
+
+    def apply_chunk(session: Session, part: list) -> tuple[dict, list]:
+        counts = {"created": 0, "unchanged": 0}
+        errors = []
+        rows = []
+        for n, row in part:
+            try:
+                tid, pid = _row_id(row, "task_id"), _row_id(row, "person_id")
+            except ValueError as e:
+                errors.append({"row": n, "error": str(e)})
+                continue
+            if tid is None:
+                errors.append({"row": n, "error": "task_id is required"})
+            elif pid is None and not row.get("person_name"):
+                errors.append({"row": n, "error": "person_id or person_name is required"})
+            else:
+                rows.append((n, tid, pid, _text(row.get("person_name")), _text(row.get("responsibility"))))
+
+        task_ids = {tid for _, tid, _, _, _ in rows}
+        tasks = {t.id: t for t in session.exec(
+            select(Task).where(Task.conference_id == cid, Task.id.in_(task_ids))).all()}
+        people = {p.id: p for p in session.exec(
+            select(Person).where(Person.id.in_([pid for _, _, pid, _, _ in rows if pid]))).all()}
+        by_name: dict[str, list[int]] = {}
+        for pid, name in session.exec(select(Person.id, Person.name).where(
+                Person.name.in_([name for _, _, pid, name, _ in rows if not pid]))).all():
+            by_name.setdefault(name, []).append(pid)
+        existing = set(session.exec(
+            select(Assignment.task_id, Assignment.person_id, Assignment.responsibility)
+            .where(Assignment.task_id.in_(list(tasks)))).all())
+        labels = role_cache.labels(session)
+        keys = {label: key for key, label in labels.items()}
+
+        now = datetime.utcnow()
+        for n, tid, pid, name, role in rows:
+            task = tasks.get(tid)
+            if task is None:
+                errors.append({"row": n, "error": "Task not found"})
+                continue
+            if pid is None:
+                found = by_name.get(name, [])
+                if len(found) != 1:
+                    errors.append({"row": n, "error": "Person not found" if not found else
+                                   f"person_name matches {len(found)} people, use person_id"})
+                    continue
+                pid = found[0]
+            elif pid not in people:
+                errors.append({"row": n, "error": "Person not found"})
+                continue
+
+            role_key = keys.get(role, role) if role else "chair"
+            if (tid, pid, role_key) in existing:
+                counts["unchanged"] += 1
+                continue
+            if role_key not in labels and role_key not in new_roles:
+                if not session.exec(select(RoleTemplate).where(RoleTemplate.key == role_key)).first():
+                    session.add(RoleTemplate(key=role_key, label=role_key, sort_order=999,
+                                             created_at=now, updated_at=now))
+                new_roles.add(role_key)
+
+            session.add(Assignment(task_id=tid, person_id=pid, responsibility=role_key, created_at=now))
+            existing.add((tid, pid, role_key))
+            audit(session, cid, "task", tid, "assign",
+                  {"assignees": []},
+                  {"assignees": [{"person_id": pid, "responsibility": role_key}]})
+            counts["created"] += 1
+        errors.sort(key=lambda e: e["row"])
+        return counts, errors
+
+    result = run_import(session, file, format, apply_chunk)
+    if new_roles:
+        role_cache.invalidate()
+    return result
 
 
 # -----------------------
 # Audit logs
 # -----------------------
+AUDIT_PAGE_MAX = 1000
+
+
+def _list_audit(session: Session, cid: int, limit: int, cursor, entity_type, entity_id, action,
+                since, until, response: Response):
+    limit = max(1, min(limit, AUDIT_PAGE_MAX))
+    try:
+        rows, next_cursor = audit_page(session, cid, limit, cursor, entity_type, entity_id,
+                                       action, since, until, columns=fastjson.fast())
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if fastjson.fast():
+        return fastjson.json_response(rows, response)
+    return rows
+
+
 @app.get("/conferences/{cid}/audit", response_model=List[AuditLog])
-def list_audit(cid: int, limit: int = 200, session: Session = Depends(get_session)):
-    stmt = select(AuditLog).where(AuditLog.conference_id == cid).order_by(AuditLog.created_at.desc()).limit(limit)
-    return session.exec(stmt).all()
+async def list_audit(cid: int, response: Response, limit: int = 200, cursor: Optional[str] = None,
+                     entity_type: Optional[str] = None, entity_id: Optional[int] = None,
+                     action: Optional[str] = None, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None, session=Depends(get_read_session)):
+    """
+    ✅ 최신순 audit (keyset pagination)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더 → ?cursor= 로 전달
+    - entity_type / entity_id / action / since~until 필터
+    """
+    return await run_read(session, _list_audit, cid, limit, cursor, entity_type, entity_id, action,
+                          since, until, response)
+
+
+@app.get("/conferences/{cid}/events")
+async def conference_events(cid: int, request: Request, last_event_id: Optional[int] = None,
+                            last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID")):
+    """
+    ✅ 변경 피드 (Server-Sent Events)
+    - event: task / milestones / ... (AuditLog.entity_type), id = AuditLog.id
+    - data: {"id", "entity_id", "action", "full", "changes"}
+      (full=false 면 changes 는 바뀐 필드만)
+    - 재연결 시 Last-Event-ID (또는 ?last_event_id=) 이후부터 이어서
+    - event: reset → 너무 밀렸으니 전체 새로고침
+    """
+    if last_event_id is None and last_event_id_header and last_event_id_header.isdigit():
+        last_event_id = int(last_event_id_header)
+    return StreamingResponse(
+        events.stream(cid, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/conferences/{cid}/audit/{audit_id}/state")
+def get_audit_state(cid: int, audit_id: int, session: Session = Depends(get_session)):
+    """✅ 해당 audit 시점의 entity 상태 (checkpoint + diff 로 복원)"""
+    row = session.get(AuditLog, audit_id)
+    if not row or row.conference_id != cid:
+        raise HTTPException(404, "AuditLog not found")
+    return {
+        "audit_id": row.id,
+        "entity_type": row.entity_type,
+        "entity_id": row.entity_id,
+        "created_at": row.created_at,
+        "state": entity_state(session, row),
+    }
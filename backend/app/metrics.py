@@ -0,0 +1,261 @@
+# backend/app/metrics.py
+"""
+요청 latency / SQL 계측
+
+- ASGI middleware: route(경로 템플릿)별 latency histogram + 요청당 SQL 문 수 / 시간
+  - 스트리밍 응답은 body 를 다 보낸 시점까지를 잼
+  - 응답 헤더 Server-Timing: app;dur=… , db;dur=…;desc="N queries" (브라우저 devtools 에 표시)
+- SQL 은 SQLAlchemy engine 이벤트로 (db.engine + DB_ASYNC 엔진의 sync_engine 모두)
+  - 요청 밖 (audit write-behind worker 등) 의 SQL 은 전체 합계에만
+- 느린 것 로그 (logger "app.metrics", WARNING)
+  - SLOW_QUERY_MS     : SQL 한 문장이 이보다 오래 걸리면 (기본 200)
+  - SLOW_REQUEST_MS   : 요청 전체가 이보다 오래 걸리면 (기본 1000)
+  - REQUEST_QUERY_WARN: 요청 하나가 SQL 을 이보다 많이 실행하면 (N+1 의심, 기본 50)
+- GET /metrics 에서 Prometheus text 형식으로 (값은 프로세스별 — worker 가 여럿이면 scrape 도 각각)
+- METRICS=0 이면 middleware / 이벤트 둘 다 안 붙임
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+log = logging.getLogger(__name__)
+
+METRICS = (os.getenv("METRICS") or "1").lower() in ("1", "true", "yes")
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS") or 200)
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS") or 1000)
+REQUEST_QUERY_WARN = int(os.getenv("REQUEST_QUERY_WARN") or 50)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+_SQL_LOG_CHARS = 500
+
+
+class _RequestStats:
+    __slots__ = ("scope", "queries", "sql_seconds")
+
+    def __init__(self, scope: dict):
+        self.scope = scope  # routing 후에 scope["route"] 가 채워짐
+        self.queries = 0
+        self.sql_seconds = 0.0
+
+
+# 요청마다 하나 (threadpool / run_sync 로 넘어가도 context 가 복사되므로 같은 객체)
+_current: ContextVar[Optional[_RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 = +Inf
+        self.sum = 0.0
+
+    def observe(self, v: float) -> None:
+        i = 0
+        while i < len(self.buckets) and v > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += v
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: dict[tuple, _Histogram] = {}  # (method, route, status)
+        self.queries: dict[tuple, _Histogram] = {}  # (method, route)
+        self.sql_seconds: dict[tuple, float] = {}   # (method, route)
+        self.sql_total = 0
+        self.sql_total_seconds = 0.0
+        self.slow_queries = 0
+        self.slow_requests = 0
+
+    def record_query(self, seconds: float, slow: bool) -> None:
+        with self._lock:
+            self.sql_total += 1
+            self.sql_total_seconds += seconds
+            self.slow_queries += slow
+
+    def record_request(self, method: str, route: str, status: int, seconds: float,
+                       stats: _RequestStats, slow: bool) -> None:
+        key = (method, route)
+        with self._lock:
+            h = self.latency.get((method, route, status))
+            if h is None:
+                h = self.latency[(method, route, status)] = _Histogram(LATENCY_BUCKETS)
+            h.observe(seconds)
+            q = self.queries.get(key)
+            if q is None:
+                q = self.queries[key] = _Histogram(QUERY_BUCKETS)
+            q.observe(stats.queries)
+            self.sql_seconds[key] = self.sql_seconds.get(key, 0.0) + stats.sql_seconds
+            self.slow_requests += slow
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        out: list[str] = []
+        with self._lock:
+            _histograms(out, "http_request_duration_seconds", "Request latency by route",
+                        ("method", "route", "status"), self.latency)
+            _histograms(out, "http_request_sql_queries", "SQL statements per request",
+                        ("method", "route"), self.queries)
+            out += ["# HELP http_request_sql_seconds_total SQL time spent inside requests",
+                    "# TYPE http_request_sql_seconds_total counter"]
+            for key, v in sorted(self.sql_seconds.items()):
+                out.append(f"http_request_sql_seconds_total{_labels(('method', 'route'), key)} {v:.6f}")
+            for name, kind, help_, v in (
+                ("db_queries_total", "counter", "SQL statements (all, incl. background)", self.sql_total),
+                ("db_query_seconds_total", "counter", "SQL time (all, incl. background)",
+                 round(self.sql_total_seconds, 6)),
+                ("db_slow_queries_total", "counter", f"SQL statements slower than {SLOW_QUERY_MS:g} ms",
+                 self.slow_queries),
+                ("http_slow_requests_total", "counter",
+                 f"Requests slower than {SLOW_REQUEST_MS:g} ms or over {REQUEST_QUERY_WARN} queries",
+                 self.slow_requests),
+            ):
+                out += [f"# HELP {name} {help_}", f"# TYPE {name} {kind}", f"{name} {v}"]
+        return "\n".join(out) + "\n"
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+def _esc(v) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple, values: tuple, le: Optional[str] = None) -> str:
+    parts = [f'{n}="{_esc(v)}"' for n, v in zip(names, values)]
+    if le is not None:
+        parts.append(f'le="{le}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _histograms(out: list[str], name: str, help_: str, names: tuple, series: dict) -> None:
+    out += [f"# HELP {name} {help_}", f"# TYPE {name} histogram"]
+    for key, h in sorted(series.items()):
+        acc = 0
+        for le, n in zip(h.buckets, h.counts):
+            acc += n
+            out.append(f"{name}_bucket{_labels(names, key, f'{le:g}')} {acc}")
+        acc += h.counts[-1]
+        out.append(f"{name}_bucket{_labels(names, key, '+Inf')} {acc}")
+        out.append(f"{name}_sum{_labels(names, key)} {h.sum:.6f}")
+        out.append(f"{name}_count{_labels(names, key)} {acc}")
+
+
+registry = Registry()
+
+
+# -----------------------
+# SQL (engine 이벤트)
+# -----------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    dt = time.perf_counter() - starts.pop()
+    slow = dt * 1000 >= SLOW_QUERY_MS
+    registry.record_query(dt, slow)
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.sql_seconds += dt
+    if slow:
+        log.warning("slow query %.1f ms [%s]: %s", dt * 1000,
+                    _route_of(stats.scope) if stats else "background", " ".join(statement.split())[:_SQL_LOG_CHARS])
+
+
+def _handle_error(exc_context):
+    # 실패한 문장은 after_cursor_execute 가 안 불리므로 시작 시각만 치움
+    conn = exc_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def instrument_engines() -> None:
+    """모든 Engine 에 (db.engine, async 엔진의 sync_engine, 나중에 만든 엔진도)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+# -----------------------
+# ASGI middleware
+# -----------------------
+def _route_of(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"  # 경로 템플릿 (/tasks/{tid}), id 별로 안 쪼갬
+
+
+def _server_timing(app_seconds: float, stats: _RequestStats) -> bytes:
+    return (f'app;dur={app_seconds * 1000:.1f}, '
+            f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.queries} queries"').encode()
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = _RequestStats(scope)
+        token = _current.set(stats)
+        t0 = time.perf_counter()
+        status = 500
+        done = False
+
+        def finish() -> None:
+            nonlocal done
+            if done:
+                return
+            done = True
+            dt = time.perf_counter() - t0
+            route = _route_of(scope)
+            slow_time = dt * 1000 >= SLOW_REQUEST_MS
+            many = stats.queries > REQUEST_QUERY_WARN
+            if slow_time or many:
+                log.warning("slow request %s %s %d: %.1f ms, %d queries (%.1f ms SQL)",
+                            scope["method"], route, status, dt * 1000,
+                            stats.queries, stats.sql_seconds * 1000)
+            registry.record_request(scope["method"], route, status, dt, stats, slow_time or many)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(time.perf_counter() - t0, stats)))
+                headers.append((b"timing-allow-origin", b"*"))  # 다른 origin 의 프론트에서도 보이게
+                message = {**message, "headers": headers}
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
+            _current.reset(token)
+
+
+def install(app) -> None:
+    """METRICS 가 켜져 있으면 middleware + SQL 이벤트"""
+    if not METRICS:
+        return
+    instrument_engines()
+    app.add_middleware(MetricsMiddleware)
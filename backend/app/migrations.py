@@ -0,0 +1,143 @@
+# backend/app/migrations.py
+"""
+스키마 버전 관리 (alembic 없이 버전 테이블 + 순서대로 적용하는 단계 목록)
+
+- schema_version(version, name, applied_at) 에 적용한 단계를 기록, 안 한 단계만 순서대로
+- 단계마다 한 트랜잭션 (SQLite / Postgres 모두 DDL 도 rollback 됨)
+- Postgres 는 advisory lock 으로 여러 worker 가 동시에 띄워져도 한 번만
+- 0001 baseline: models.py 기준 create_all + 예전 DB 에 없던 컬럼/index (기존 init_db 동작)
+  → 처음 만드는 DB 는 baseline 만으로 최신 스키마
+- 스키마를 바꿀 때: models.py 수정 + MIGRATIONS 에 단계 추가 (add_column / create_index 처럼
+  이미 있으면 건너뛰게 — 새 DB 는 baseline 에서 이미 만들어져 있음)
+
+    python -m app.migrations [status|upgrade]
+"""
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, insert, select, text
+from sqlalchemy.schema import CreateColumn
+from sqlmodel import SQLModel
+
+from . import models  # noqa: F401  (SQLModel.metadata 에 테이블 등록)
+
+_meta = MetaData()
+schema_version = Table(
+    "schema_version", _meta,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+_LOCK_ID = 7_240_001  # pg_advisory_xact_lock 키 (아무 상수)
+
+
+def add_column(conn, table_name: str, column_name: str) -> None:
+    """models.py 의 컬럼이 DB 에 없으면 추가 (NOT NULL 이면 server_default 가 있어야 함)"""
+    table = SQLModel.metadata.tables[table_name]
+    if column_name in {c["name"] for c in inspect(conn).get_columns(table_name)}:
+        return
+    ddl = CreateColumn(table.c[column_name]).compile(dialect=conn.dialect)
+    conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {ddl}")
+
+
+def create_index(conn, table_name: str, index_name: str) -> None:
+    """models.py 에 선언한 index 를 (없으면) 생성"""
+    table = SQLModel.metadata.tables[table_name]
+    idx = next(i for i in table.indexes if i.name == index_name)
+    idx.create(conn, checkfirst=True)
+
+
+def drop_index(conn, index_name: str) -> None:
+    """models.py 에서 뺀 index 삭제 (없으면 무시)"""
+    conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def _baseline(conn) -> None:
+    SQLModel.metadata.create_all(conn)
+    # create_all 은 이미 있는 테이블을 건너뛰므로, 나중에 추가된 컬럼/index 는 따로
+    for table in SQLModel.metadata.sorted_tables:
+        for col in table.columns:
+            add_column(conn, table.name, col.name)
+        for idx in table.indexes:
+            idx.create(conn, checkfirst=True)
+
+
+def _query_indexes(conn) -> None:
+    # 목록 / 대시보드 쿼리 모양에 맞춘 복합 index
+    # (conference_id, task_group, status) 는 …_priority 의 앞부분이라 삭제
+    drop_index(conn, "ix_task_conf_group_status")
+    for table_name, index_name in (
+        ("task", "ix_task_conf_group_status_priority"),
+        ("task", "ix_task_conf_group_status_updated"),
+        ("task", "ix_task_conf_due"),
+        ("milestone", "ix_milestone_conf_target"),
+    ):
+        create_index(conn, table_name, index_name)
+
+
+def delete_orphan_assignments(conn) -> int:
+    """지워진 사람을 가리키는 할당 (화면에 이름 없이 보이던 행) 삭제 → 지운 행 수"""
+    return conn.exec_driver_sql(
+        "DELETE FROM assignment WHERE NOT EXISTS (SELECT 1 FROM person WHERE person.id = assignment.person_id)"
+    ).rowcount
+
+
+def _assignment_person_fk(conn) -> None:
+    # 예전 DB 의 assignment.person_id 에는 FK 가 없었음 (create_all 은 있는 테이블을 안 바꿈)
+    delete_orphan_assignments(conn)
+    if conn.dialect.name != "postgresql":
+        return  # SQLite 는 ALTER TABLE 로 FK 를 못 붙임 → 예전 DB 는 delete_person 의 정리에만 의존
+    if any(fk["referred_table"] == "person" for fk in inspect(conn).get_foreign_keys("assignment")):
+        return
+    conn.exec_driver_sql(
+        "ALTER TABLE assignment ADD CONSTRAINT assignment_person_id_fkey "
+        "FOREIGN KEY (person_id) REFERENCES person (id)")
+
+
+# (버전, 이름, 함수(conn)) — 번호는 바꾸지 말고 뒤에만 추가
+MIGRATIONS: list[tuple[int, str, Callable]] = [
+    (1, "baseline", _baseline),
+    (2, "query_indexes", _query_indexes),
+    (3, "assignment_person_fk", _assignment_person_fk),
+]
+
+
+def applied(conn) -> dict[int, datetime]:
+    schema_version.create(conn, checkfirst=True)
+    return dict(conn.execute(select(schema_version.c.version, schema_version.c.applied_at)).all())
+
+
+def upgrade(engine) -> list[int]:
+    """아직 안 한 단계 적용 → 이번에 적용한 버전 목록"""
+    done: list[int] = []
+    for version, name, fn in MIGRATIONS:
+        with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": _LOCK_ID})
+            if version in applied(conn):
+                continue
+            fn(conn)
+            conn.execute(insert(schema_version).values(
+                version=version, name=name, applied_at=datetime.utcnow()))
+            done.append(version)
+    return done
+
+
+def status(engine) -> list[dict]:
+    with engine.begin() as conn:
+        have = applied(conn)
+    return [{"version": v, "name": n, "applied_at": have.get(v)} for v, n, _ in MIGRATIONS]
+
+
+if __name__ == "__main__":
+    from . import db
+
+    if sys.argv[1:2] == ["upgrade"]:
+        print("applied:", upgrade(db.engine) or "nothing (up to date)")
+    else:
+        for m in status(db.engine):
+            print(f"{m['version']:04d} {m['name']:<20} {m['applied_at'] or 'pending'}")
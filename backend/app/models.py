@@ -2,7 +2,7 @@ from datetime import datetime, date
 from typing import Optional
 
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 
 
 # =========================
@@ -10,6 +10,7 @@ from sqlalchemy import UniqueConstraint
 # =========================
 class Conference(SQLModel, table=True):
     __table_args__ = (
+        # create / clone 의 (year, name) 중복 확인도 이 unique index 로
         UniqueConstraint("year", "name", name="uq_conference_year_name"),
     )
 
@@ -23,6 +24,10 @@ class Conference(SQLModel, table=True):
     venue_city: Optional[str] = None
     timezone: str = "Asia/Seoul"
     status: str = "planning"
+    # task/milestone/assignment 변경 시 +1 (ETag 용, versions.py)
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # 기본 Task 팩을 이미 넣었는지 (milestones/generate 를 다시 불러도 중복 X)
+    tasks_seeded: bool = Field(default=False, sa_column_kwargs={"server_default": "0"})
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -46,6 +51,19 @@ class Conference(SQLModel, table=True):
 # Task
 # =========================
 class Task(SQLModel, table=True):
+    # 쿼리 모양별 index (bench/query_plans.py 로 계획 확인)
+    # conference_id 단독 index 는 (conference_id, id) 순서가 필요한 곳 (sort=id, export, clone) 용
+    __table_args__ = (
+        # 대시보드 집계 (group × status × priority GROUP BY, covering)
+        Index("ix_task_conf_group_status_priority", "conference_id", "task_group", "status", "priority"),
+        # 목록 group / status 필터 + updated_at 정렬 keyset
+        Index("ix_task_conf_group_status_updated", "conference_id", "task_group", "status", "updated_at", "id"),
+        # 목록 기본 정렬 (updated_at desc) keyset
+        Index("ix_task_conf_updated", "conference_id", "updated_at", "id"),
+        # 대시보드 overdue / due_soon (마감일 순)
+        Index("ix_task_conf_due", "conference_id", "due_date", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     conference_id: int = Field(foreign_key="conference.id", index=True)
 
@@ -58,6 +76,8 @@ class Task(SQLModel, table=True):
 
     start_date: Optional[date] = None
     due_date: Optional[date] = None
+    # 이 task 가 끝나야 하는 Milestone.key (critical path 계산용)
+    milestone_key: Optional[str] = None
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -73,6 +93,11 @@ class Task(SQLModel, table=True):
 # Person
 # =========================
 class Person(SQLModel, table=True):
+    __table_args__ = (
+        # 목록 기본 정렬 (name) keyset
+        Index("ix_person_name", "name", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
     affiliation: Optional[str] = None
@@ -88,12 +113,30 @@ class Person(SQLModel, table=True):
 class Assignment(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     task_id: int = Field(foreign_key="task.id", index=True)
-    person_id: int = Field(index=True)
+    person_id: int = Field(foreign_key="person.id", index=True)
 
     responsibility: str = "chair"
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     task: Optional[Task] = Relationship(back_populates="assignments")
+    # ✅ 단방향 (Person 삭제 시 할당 정리는 delete_person 에서 DELETE 한 번으로)
+    person: Optional[Person] = Relationship()
+
+
+# =========================
+# TaskDependency (task 는 depends_on 이 끝난 뒤 시작)
+# =========================
+class TaskDependency(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("task_id", "depends_on_id", name="uq_taskdependency_edge"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    conference_id: int = Field(foreign_key="conference.id", index=True)
+    task_id: int = Field(foreign_key="task.id", index=True)
+    depends_on_id: int = Field(foreign_key="task.id", index=True)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
 # =========================
@@ -113,6 +156,13 @@ class RoleTemplate(SQLModel, table=True):
 # Milestone
 # =========================
 class Milestone(SQLModel, table=True):
+    __table_args__ = (
+        # generate 는 (conference_id, key) 로 upsert
+        Index("ux_milestone_conf_key", "conference_id", "key", unique=True),
+        # 목록 / 일정 계산은 target_date 순
+        Index("ix_milestone_conf_target", "conference_id", "target_date"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     conference_id: int = Field(foreign_key="conference.id", index=True)
 
@@ -129,6 +179,13 @@ class Milestone(SQLModel, table=True):
 # AuditLog
 # =========================
 class AuditLog(SQLModel, table=True):
+    __table_args__ = (
+        # 학회별 최신순 keyset pagination
+        Index("ix_auditlog_conf_created", "conference_id", "created_at", "id"),
+        # 특정 entity(task 등) 이력
+        Index("ix_auditlog_conf_entity", "conference_id", "entity_type", "entity_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     conference_id: int = Field(foreign_key="conference.id", index=True)
@@ -140,6 +197,8 @@ class AuditLog(SQLModel, table=True):
 
     before_json: str = "{}"
     after_json: str = "{}"
+    # full: before/after 그대로 | diff: 바뀐 필드만 | checkpoint: 주기적 전체 스냅샷
+    encoding: str = Field(default="full", sa_column_kwargs={"server_default": "full"})
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -0,0 +1,296 @@
+# backend/app/queries.py
+from __future__ import annotations
+
+import base64
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import case, func, tuple_
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, select
+
+from .models import Assignment, AuditLog, Person, Task
+
+
+def assignment_query():
+    """
+    Assignment 조회 공통 쿼리
+    - person 을 joinedload 로 한 번에 (N+1 방지)
+    - role label 은 RoleTemplate 캐시에서 (cache.role_cache)
+    """
+    return select(Assignment).options(joinedload(Assignment.person))
+
+
+def assignment_out(a: Assignment, role_labels: dict[str, str]) -> dict[str, Any]:
+    """프론트가 바로 쓰는 형태 (person name/affiliation, role_label 포함)"""
+    p = a.person
+    return {
+        "id": a.id,
+        "task_id": a.task_id,
+        "person_id": a.person_id,
+        "name": p.name if p else "",
+        "affiliation": p.affiliation if p else None,
+        "responsibility": a.responsibility,
+        "role_label": role_labels.get(a.responsibility, a.responsibility),
+    }
+
+
+def task_assignments(session: Session, task_id: int,
+                     role_labels: dict[str, str]) -> list[dict[str, Any]]:
+    stmt = assignment_query().where(Assignment.task_id == task_id).order_by(Assignment.id)
+    return [assignment_out(a, role_labels) for a in session.exec(stmt).all()]
+
+
+def conference_assignments(session: Session, cid: int, person_id: int | None,
+                           role_labels: dict[str, str]) -> list[dict[str, Any]]:
+    stmt = (
+        assignment_query()
+        .join(Task, Task.id == Assignment.task_id)
+        .where(Task.conference_id == cid)
+    )
+    if person_id:
+        stmt = stmt.where(Assignment.person_id == person_id)
+    # Task.id (= task_id) 로 정렬해야 task → assignment index 순서 그대로 (임시 정렬 X)
+    stmt = stmt.order_by(Task.id, Assignment.id)
+    return [assignment_out(a, role_labels) for a in session.exec(stmt).all()]
+
+
+# -----------------------
+# Audit (keyset pagination)
+# -----------------------
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """잘못된 cursor 는 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(row_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def audit_query(cid: int, limit: int, cursor: Optional[str] = None,
+                entity_type: Optional[str] = None, entity_id: Optional[int] = None,
+                action: Optional[str] = None, since: Optional[datetime] = None,
+                until: Optional[datetime] = None, columns: bool = False):
+    """
+    최신순 (created_at desc, id desc) 한 페이지 SELECT (limit + 1 개)
+    - (conference_id, created_at, id) index 를 타고 OFFSET 없이 이어서 읽음
+    - columns=True 면 ORM 객체 대신 컬럼 행
+    """
+    stmt = select(*AuditLog.__table__.c) if columns else select(AuditLog)
+    stmt = stmt.where(AuditLog.conference_id == cid)
+    if entity_type:
+        stmt = stmt.where(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        stmt = stmt.where(AuditLog.entity_id == entity_id)
+    if action:
+        stmt = stmt.where(AuditLog.action == action)
+    if since:
+        stmt = stmt.where(AuditLog.created_at >= since)
+    if until:
+        stmt = stmt.where(AuditLog.created_at < until)
+    if cursor:
+        c_at, c_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(AuditLog.created_at, AuditLog.id) < (c_at, c_id))
+    return stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit + 1)
+
+
+def audit_page(session: Session, cid: int, limit: int, cursor: Optional[str] = None,
+               entity_type: Optional[str] = None, entity_id: Optional[int] = None,
+               action: Optional[str] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None,
+               columns: bool = False) -> tuple[list, Optional[str]]:
+    """한 페이지 + 다음 cursor (columns=True 면 dict 목록)"""
+    stmt = audit_query(cid, limit, cursor, entity_type, entity_id, action, since, until, columns)
+    if columns:
+        rows = [dict(r._mapping) for r in session.execute(stmt)]
+    else:
+        rows = list(session.exec(stmt).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        created_at, row_id = (last["created_at"], last["id"]) if columns else (last.created_at, last.id)
+        next_cursor = encode_cursor(created_at, row_id)
+    return rows, next_cursor
+
+
+# -----------------------
+# 목록 (필드 projection + keyset pagination)
+# -----------------------
+def parse_fields(model, fields: Optional[str]) -> list:
+    """'id,name,status' → 컬럼 목록 (id 는 항상 포함), 없는 필드는 ValueError"""
+    cols = model.__table__.c
+    if not fields:
+        return list(cols)
+    names = ["id"] + [f.strip() for f in fields.split(",") if f.strip() and f.strip() != "id"]
+    unknown = [n for n in names if n not in cols]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+    return [cols[n] for n in dict.fromkeys(names)]
+
+
+def _encode_key(value: Any, row_id: int) -> str:
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_key(cursor: str, col) -> tuple[Any, int]:
+    try:
+        py_type = col.type.python_type
+    except NotImplementedError:  # sqlmodel AutoString 등
+        py_type = str
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+        if py_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif py_type is date:
+            value = date.fromisoformat(value)
+        return value, int(row_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def list_query(model, where: list, fields: Optional[str], sort: str, sortable: tuple[str, ...],
+               limit: Optional[int] = None, cursor: Optional[str] = None):
+    """
+    목록 SELECT 문 (ORM 객체가 아니라 컬럼만)
+    - fields: 필요한 컬럼만 SELECT
+    - sort: sortable 중 하나, '-' 붙이면 내림차순 → (sort, id) index 순서 그대로 읽음
+    - limit 가 있으면 (sort, id) keyset cursor, limit + 1 개를 읽어 다음 페이지 여부 판단
+    → (stmt, 응답 컬럼 이름, sort 컬럼, id 컬럼)
+    """
+    desc = sort.startswith("-")
+    key = sort.lstrip("-")
+    if key not in sortable:
+        raise ValueError(f"sort must be one of {', '.join(sortable)} (prefix '-' for descending)")
+
+    cols = parse_fields(model, fields)
+    table = model.__table__
+    sort_col, id_col = table.c[key], table.c.id
+    extra = [] if sort_col in cols else [sort_col]  # cursor 만들 때 필요
+
+    stmt = select(*cols, *extra).where(*where)
+    if cursor:
+        value, row_id = _decode_key(cursor, sort_col)
+        if key == "id":
+            stmt = stmt.where(id_col < row_id if desc else id_col > row_id)
+        else:
+            pair = tuple_(sort_col, id_col)
+            stmt = stmt.where(pair < (value, row_id) if desc else pair > (value, row_id))
+    if key == "id":
+        stmt = stmt.order_by(id_col.desc() if desc else id_col)
+    else:
+        stmt = stmt.order_by(*((sort_col.desc(), id_col.desc()) if desc else (sort_col, id_col)))
+    if limit:
+        stmt = stmt.limit(limit + 1)
+    return stmt, [c.name for c in cols], sort_col, id_col
+
+
+def list_page(session: Session, model, where: list, fields: Optional[str], sort: str,
+              sortable: tuple[str, ...], limit: Optional[int] = None,
+              cursor: Optional[str] = None) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """목록 한 페이지를 dict 로 + 다음 cursor"""
+    stmt, names, sort_col, id_col = list_query(model, where, fields, sort, sortable, limit, cursor)
+    rows = session.execute(stmt).all()
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = _encode_key(last[sort_col], last[id_col])
+    return [dict(zip(names, r)) for r in rows], next_cursor
+
+
+# -----------------------
+# Stats (대시보드 집계)
+# -----------------------
+def _task_brief(row) -> dict[str, Any]:
+    tid, name, group, status, priority, due = row
+    return {"id": tid, "name": name, "task_group": group, "status": status,
+            "priority": priority, "due_date": due}
+
+
+def conference_stats(session: Session, cid: int, today: date,
+                     soon_days: int = 7, limit: int = 50) -> dict[str, Any]:
+    """
+    학회 대시보드 숫자 (task 목록 / assignment 전체를 내려보내지 않음)
+    - group × status × priority: (conference_id, task_group, status, priority) covering index 로 GROUP BY
+    - 사람별 workload: task 마다 최신 assignment 만 (프론트 LATEST_ASSIGN 과 같은 기준)
+    - overdue / due_soon: done 이 아닌 것만, 마감일 순 limit 개
+    """
+    counts = session.exec(
+        select(Task.task_group, Task.status, Task.priority, func.count())
+        .where(Task.conference_id == cid)
+        .group_by(Task.task_group, Task.status, Task.priority)
+    ).all()
+
+    by_group: dict[str, dict[str, int]] = {}
+    by_status: dict[str, int] = {}
+    for group, status, _priority, n in counts:
+        g = by_group.setdefault(group, {})
+        g[status] = g.get(status, 0) + n
+        by_status[status] = by_status.get(status, 0) + n
+
+    open_ = Task.status != "done"
+    overdue = open_ & (Task.due_date < today)
+
+    latest = (
+        select(func.max(Assignment.id).label("id"))
+        .join(Task, Task.id == Assignment.task_id)
+        .where(Task.conference_id == cid)
+        .group_by(Assignment.task_id)
+        .subquery()
+    )
+    workload = session.exec(
+        select(Person.id, Person.name, Person.affiliation, func.count(),
+               func.sum(case((open_, 1), else_=0)),
+               func.sum(case((overdue, 1), else_=0)))
+        .select_from(Assignment)
+        .join(latest, latest.c.id == Assignment.id)
+        .join(Task, Task.id == Assignment.task_id)
+        .join(Person, Person.id == Assignment.person_id)
+        .group_by(Person.id, Person.name, Person.affiliation)
+        .order_by(func.sum(case((open_, 1), else_=0)).desc(), Person.name)
+    ).all()
+
+    brief = (Task.id, Task.name, Task.task_group, Task.status, Task.priority, Task.due_date)
+    soon_until = today + timedelta(days=soon_days)
+    lists = {}
+    for key, cond in (
+        ("overdue", overdue),
+        ("due_soon", open_ & (Task.due_date >= today) & (Task.due_date <= soon_until)),
+    ):
+        where = (Task.conference_id == cid) & cond
+        lists[key] = {
+            "count": session.exec(select(func.count()).select_from(Task).where(where)).one(),
+            "tasks": [_task_brief(r) for r in session.exec(
+                select(*brief).where(where).order_by(Task.due_date, Task.id).limit(limit))],
+        }
+
+    return {
+        "conference_id": cid,
+        "as_of": today,
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "by_group": by_group,
+        "by_group_status_priority": [
+            {"task_group": g, "status": st, "priority": pr, "count": n} for g, st, pr, n in counts
+        ],
+        "workload": [
+            {"person_id": pid, "name": name, "affiliation": aff,
+             "assigned": n, "open": n_open or 0, "overdue": n_over or 0}
+            for pid, name, aff, n, n_open, n_over in workload
+        ],
+        "overdue": lists["overdue"],
+        "due_soon": {"days": soon_days, **lists["due_soon"]},
+    }
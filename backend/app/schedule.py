@@ -0,0 +1,459 @@
+# backend/app/schedule.py
+"""
+일정 재조정 (reschedule)
+
+- 학회 start_date 이동 / 특정 milestone 이동을 한 번에 반영
+- milestone / task 날짜는 행마다 patch 하지 않고 set-based UPDATE 한 번씩
+- dry_run 이면 바뀔 내용(diff)만 계산해서 돌려줌
+- task 의존관계 기반 critical path / slack (학회별 캐시, 바뀐 부분만 재계산)
+"""
+from __future__ import annotations
+
+import heapq
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import and_, func, or_, update
+from sqlmodel import Session, select
+
+from .models import AuditLog, Conference, Milestone, Task, TaskDependency
+
+
+def shift_date(session: Session, col, days: int):
+    """col + days 일 (SQL 식, NULL 은 그대로)"""
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLite 는 date 를 'YYYY-MM-DD' 문자열로 저장
+        return func.date(col, f"{days:+d} days")
+    return col + timedelta(days=days)
+
+
+class ScheduleShift:
+    """
+    옮길 대상
+    - since=None  : 학회 전체 (start/end_date 포함)
+    - since=date  : 그 날짜 이후의 milestone / task (start_date 또는 due_date) 만 (milestone 하나를 밀 때)
+    - locked milestone, done task 는 그대로
+    """
+
+    def __init__(self, conf: Conference, days: int, since: Optional[date] = None):
+        self.conf = conf
+        self.days = days
+        self.since = since
+        self.start_before = conf.start_date
+
+    def milestone_filter(self):
+        cond = [Milestone.conference_id == self.conf.id, Milestone.locked == False]  # noqa: E712
+        if self.since is not None:
+            cond.append(Milestone.target_date >= self.since)
+        return and_(*cond)
+
+    def task_filter(self):
+        cond = [
+            Task.conference_id == self.conf.id,
+            Task.status != "done",
+            or_(Task.start_date.is_not(None), Task.due_date.is_not(None)),
+        ]
+        if self.since is not None:
+            # 마감일이 없는 task 도 시작일이 since 이후면 같이
+            cond.append(or_(Task.start_date >= self.since, Task.due_date >= self.since))
+        return and_(*cond)
+
+    def _move(self, d: Optional[date]) -> Optional[str]:
+        return (d + timedelta(days=self.days)).isoformat() if d else None
+
+    def diff(self, session: Session) -> dict[str, Any]:
+        """dry-run: 바뀔 행 목록 (id, 이전 → 이후)"""
+        milestones = session.exec(
+            select(Milestone.id, Milestone.key, Milestone.target_date)
+            .where(self.milestone_filter()).order_by(Milestone.target_date)
+        ).all()
+        tasks = session.exec(
+            select(Task.id, Task.name, Task.start_date, Task.due_date)
+            .where(self.task_filter()).order_by(Task.due_date, Task.id)
+        ).all()
+        return {
+            **self.summary(len(milestones), len(tasks)),
+            "milestones": [
+                {"id": mid, "key": key, "target_date": [d.isoformat(), self._move(d)]}
+                for mid, key, d in milestones
+            ],
+            "tasks": [
+                {"id": tid, "name": name,
+                 "start_date": [s.isoformat() if s else None, self._move(s)],
+                 "due_date": [d.isoformat() if d else None, self._move(d)]}
+                for tid, name, s, d in tasks
+            ],
+        }
+
+    def apply(self, session: Session) -> dict[str, Any]:
+        """UPDATE 3번 (conference / milestone / task), commit 은 호출하는 쪽에서"""
+        if self.since is None:
+            self.conf.start_date += timedelta(days=self.days)
+            self.conf.end_date += timedelta(days=self.days)
+            session.add(self.conf)
+
+        m_values = {"target_date": shift_date(session, Milestone.target_date, self.days)}
+        if self.since is not None:
+            # start_date 는 그대로 → target_date = start_date + relative_days 관계 유지
+            m_values["relative_days"] = Milestone.relative_days + self.days
+        m = session.execute(
+            update(Milestone).where(self.milestone_filter()).values(**m_values)
+            .execution_options(synchronize_session=False)
+        )
+        t = session.execute(
+            update(Task).where(self.task_filter()).values(
+                start_date=shift_date(session, Task.start_date, self.days),
+                due_date=shift_date(session, Task.due_date, self.days),
+                updated_at=datetime.utcnow(),
+            ).execution_options(synchronize_session=False)
+        )
+        return self.summary(m.rowcount, t.rowcount)
+
+    def summary(self, n_milestones: int, n_tasks: int) -> dict[str, Any]:
+        start = self.start_before
+        if self.since is None:
+            start = start + timedelta(days=self.days)
+        return {
+            "shift_days": self.days,
+            "since": self.since.isoformat() if self.since else None,
+            "start_date": start.isoformat(),
+            "milestones_moved": n_milestones,
+            "tasks_moved": n_tasks,
+        }
+
+
+# -----------------------
+# Critical path (task 의존관계)
+# -----------------------
+CPM_INCREMENTAL_MAX = int(os.getenv("CPM_INCREMENTAL_MAX") or 500)  # 이보다 많이 바뀌었으면 전체 재계산
+
+
+def creates_cycle(session: Session, task_id: int, depends_on_id: int) -> bool:
+    """task → depends_on 을 추가하면 cycle 인지 (depends_on 이 이미 task 에 직간접 의존)"""
+    reach = (
+        select(TaskDependency.depends_on_id)
+        .where(TaskDependency.task_id == depends_on_id)
+        .cte("reach", recursive=True)
+    )
+    reach = reach.union(
+        select(TaskDependency.depends_on_id)
+        .join(reach, TaskDependency.task_id == reach.c.depends_on_id)
+    )
+    return session.exec(
+        select(reach.c.depends_on_id).where(reach.c.depends_on_id == task_id).limit(1)
+    ).first() is not None
+
+
+class _Node:
+    __slots__ = ("id", "name", "task_group", "status", "start", "due", "milestone_key",
+                 "preds", "succs", "es", "ef", "lf", "ls")
+
+    def __init__(self, row):
+        self.preds: set[int] = set()
+        self.succs: set[int] = set()
+        self.es = self.ef = self.lf = self.ls = None
+        self.update(row)
+
+    def update(self, row) -> None:
+        (self.id, self.name, self.task_group, self.status,
+         self.start, self.due, self.milestone_key) = row
+
+    @property
+    def duration(self) -> int:
+        if self.start and self.due and self.due >= self.start:
+            return (self.due - self.start).days + 1
+        return 1
+
+
+_NODE_COLUMNS = (Task.id, Task.name, Task.task_group, Task.status,
+                 Task.start_date, Task.due_date, Task.milestone_key)
+
+
+class CriticalPath:
+    """
+    학회 하나의 task DAG + 계산 결과
+    - es/ef: 선행 task 와 날짜로 본 예상 시작/종료 (안 끝난 일은 빨라도 오늘 종료)
+    - lf/ls: milestone target_date / 후행 task 에서 거꾸로 본 늦어도 되는 날짜
+    - slack = lf - ef (일), 0 이하면 critical
+    - 변경은 AuditLog(task / dependency) 로 알아내고, 바뀐 task 부터 앞/뒤로만 다시 계산
+    """
+
+    def __init__(self, conference_id: int):
+        self.conference_id = conference_id
+        self.nodes: dict[int, _Node] = {}
+        self.deadlines: dict[str, date] = {}
+        self.pos: dict[int, int] = {}
+        self.cycle: list[int] = []
+        self.as_of: Optional[date] = None
+        self.last_audit_id = -1
+        self.mode = "full"
+        self.recomputed = 0
+        self._result: Optional[dict[str, Any]] = None
+        self._ordered: list[_Node] = []
+
+    # ---- 불러오기 ----
+    def _latest_audit_id(self, session: Session) -> int:
+        return session.exec(
+            select(func.max(AuditLog.id)).where(AuditLog.conference_id == self.conference_id)
+        ).one() or 0
+
+    def load(self, session: Session, as_of: date, latest: int) -> None:
+        cid = self.conference_id
+        self.nodes = {row[0]: _Node(row) for row in session.exec(
+            select(*_NODE_COLUMNS).where(Task.conference_id == cid))}
+        for task_id, dep_id in session.exec(
+                select(TaskDependency.task_id, TaskDependency.depends_on_id)
+                .where(TaskDependency.conference_id == cid)):
+            self._link(task_id, dep_id)
+        self.deadlines = dict(session.exec(
+            select(Milestone.key, Milestone.target_date).where(Milestone.conference_id == cid)).all())
+        self.as_of = as_of
+        self.last_audit_id = latest
+        self._reorder()
+        self.mode = "full"
+        self.recomputed = self._forward(set(self.nodes), full=True)
+        self._backward(set(self.nodes), full=True)
+        self._result = None
+
+    def refresh(self, session: Session, as_of: date) -> None:
+        latest = self._latest_audit_id(session)
+        if as_of != self.as_of or latest < self.last_audit_id:
+            return self.load(session, as_of, latest)
+        if latest == self.last_audit_id:
+            self.mode, self.recomputed = "cached", 0
+            return
+
+        rows = session.exec(
+            select(AuditLog.entity_type, AuditLog.entity_id)
+            .where(AuditLog.conference_id == self.conference_id,
+                   AuditLog.id > self.last_audit_id, AuditLog.id <= latest)
+            .order_by(AuditLog.id)
+            .limit(CPM_INCREMENTAL_MAX + 1)
+        ).all()
+        # milestone 날짜가 통째로 바뀌는 변경은 전체 재계산
+        if len(rows) > CPM_INCREMENTAL_MAX or any(t in ("milestones", "schedule") for t, _ in rows):
+            return self.load(session, as_of, latest)
+
+        task_ids = {eid for t, eid in rows if t in ("task", "dependency")}
+        edge_ids = {eid for t, eid in rows if t == "dependency"}
+        changed = set(task_ids)
+
+        fresh = {row[0]: row for row in session.exec(select(*_NODE_COLUMNS).where(Task.id.in_(task_ids)))}
+        for tid in task_ids:
+            if tid in fresh:
+                if tid in self.nodes:
+                    self.nodes[tid].update(fresh[tid])
+                else:
+                    self.nodes[tid] = _Node(fresh[tid])
+                    edge_ids.add(tid)
+            elif tid in self.nodes:
+                edge_ids.add(tid)
+
+        if edge_ids:
+            new_preds: dict[int, set[int]] = {tid: set() for tid in edge_ids}
+            for task_id, dep_id in session.exec(
+                    select(TaskDependency.task_id, TaskDependency.depends_on_id)
+                    .where(TaskDependency.task_id.in_(edge_ids))):
+                new_preds[task_id].add(dep_id)
+            for tid, preds in new_preds.items():
+                node = self.nodes.get(tid)
+                old = node.preds if node else set()
+                changed |= old | preds
+                for p in old - preds:
+                    self._unlink(tid, p)
+                for p in preds - old:
+                    self._link(tid, p)
+                if tid not in fresh and node:
+                    for s in list(node.succs):
+                        self._unlink(s, tid)
+                        changed.add(s)
+                    del self.nodes[tid]
+                    changed.discard(tid)
+            self._reorder()
+
+        changed &= set(self.nodes)
+        self.last_audit_id = latest
+        self.mode = "incremental"
+        self.recomputed = self._forward(changed)
+        self._backward(changed)
+        self._result = None
+
+    def _link(self, task_id: int, dep_id: int) -> None:
+        if task_id in self.nodes and dep_id in self.nodes:
+            self.nodes[task_id].preds.add(dep_id)
+            self.nodes[dep_id].succs.add(task_id)
+
+    def _unlink(self, task_id: int, dep_id: int) -> None:
+        if task_id in self.nodes:
+            self.nodes[task_id].preds.discard(dep_id)
+        if dep_id in self.nodes:
+            self.nodes[dep_id].succs.discard(task_id)
+
+    def _reorder(self) -> None:
+        """위상 정렬 (의존관계가 바뀔 때만)"""
+        indeg = {i: len(n.preds) for i, n in self.nodes.items()}
+        queue = sorted(i for i, d in indeg.items() if d == 0)
+        order = []
+        while queue:
+            i = queue.pop()
+            order.append(i)
+            for s in self.nodes[i].succs:
+                indeg[s] -= 1
+                if indeg[s] == 0:
+                    queue.append(s)
+        # cycle 이 있으면 (동시에 추가된 경우 등) 남은 것은 뒤에 붙임
+        self.cycle = sorted(i for i, d in indeg.items() if d > 0)
+        self.pos = {i: k for k, i in enumerate(order + self.cycle)}
+
+    # ---- 계산 ----
+    def _calc_forward(self, n: _Node) -> None:
+        dur = n.duration
+        if n.status == "done":
+            n.es, n.ef = n.start or n.due, n.due or n.start  # 끝난 일은 그대로
+            return
+        cands = []
+        if n.start or n.due:
+            cands.append(n.start or n.due - timedelta(days=dur - 1))
+        ready = [self.nodes[p].ef for p in n.preds if self.nodes[p].ef]
+        if ready:
+            cands.append(max(ready) + timedelta(days=1))
+        n.es = max(cands) if cands else None
+        n.ef = n.es + timedelta(days=dur - 1) if n.es else None
+        if n.ef and n.ef < self.as_of:
+            n.ef = self.as_of
+
+    def _calc_backward(self, n: _Node) -> None:
+        cands = []
+        if n.milestone_key in self.deadlines:
+            cands.append(self.deadlines[n.milestone_key])
+        cands += [self.nodes[s].ls - timedelta(days=1) for s in n.succs if self.nodes[s].ls]
+        if not cands and n.due:
+            cands.append(n.due)
+        n.lf = min(cands) if cands else None
+        n.ls = n.lf - timedelta(days=n.duration - 1) if n.lf else None
+
+    def _forward(self, start: set[int], full: bool = False) -> int:
+        """start 에서 후행 쪽으로, 값이 바뀐 곳까지만 (위상 순서)"""
+        heap = [(self.pos[i], i) for i in start]
+        heapq.heapify(heap)
+        done: set[int] = set()
+        while heap:
+            _, i = heapq.heappop(heap)
+            if i in done:
+                continue
+            done.add(i)
+            n = self.nodes[i]
+            old = (n.es, n.ef)
+            self._calc_forward(n)
+            if not full and ((n.es, n.ef) != old or i in start):
+                for s in n.succs:
+                    if s not in done:
+                        heapq.heappush(heap, (self.pos[s], s))
+        return len(done)
+
+    def _backward(self, start: set[int], full: bool = False) -> int:
+        """start 에서 선행 쪽으로 (역 위상 순서)"""
+        heap = [(-self.pos[i], i) for i in start]
+        heapq.heapify(heap)
+        done: set[int] = set()
+        while heap:
+            _, i = heapq.heappop(heap)
+            if i in done:
+                continue
+            done.add(i)
+            n = self.nodes[i]
+            old = (n.lf, n.ls)
+            self._calc_backward(n)
+            if not full and ((n.lf, n.ls) != old or i in start):
+                for p in n.preds:
+                    if p not in done:
+                        heapq.heappush(heap, (-self.pos[p], p))
+        return len(done)
+
+    # ---- 결과 ----
+    def _slack(self, n: _Node) -> Optional[int]:
+        return (n.lf - n.ef).days if n.lf and n.ef else None
+
+    def _out(self, n: _Node) -> dict[str, Any]:
+        return {
+            "id": n.id, "name": n.name, "task_group": n.task_group, "status": n.status,
+            "milestone_key": n.milestone_key,
+            "es": n.es, "ef": n.ef, "lf": n.lf, "slack_days": self._slack(n),
+        }
+
+    def _chain(self, n: _Node) -> list[int]:
+        """n 의 종료일을 결정한 선행 task 들 (앞에서부터)"""
+        chain = [n.id]
+        while True:
+            preds = [self.nodes[p] for p in n.preds if self.nodes[p].ef]
+            if not preds or n.status == "done":
+                break
+            p = max(preds, key=lambda x: x.ef)
+            if n.es != p.ef + timedelta(days=1):
+                break  # 선행 때문에 밀린 게 아님
+            chain.append(p.id)
+            n = p
+        return chain[::-1]
+
+    def result(self) -> dict[str, Any]:
+        if self._result is not None:
+            return self._result
+        ordered = self._ordered = sorted((n for n in self.nodes.values() if n.ef), key=lambda n: self.pos[n.id])
+        critical = [n for n in ordered
+                    if n.status != "done" and self._slack(n) is not None and self._slack(n) <= 0]
+
+        by_key: dict[str, list[_Node]] = {}
+        for n in ordered:
+            if n.milestone_key:
+                by_key.setdefault(n.milestone_key, []).append(n)
+        milestones = []
+        for key, target in sorted(self.deadlines.items(), key=lambda kv: kv[1]):
+            linked = by_key.get(key, [])
+            last = max(linked, key=lambda n: n.ef) if linked else None
+            milestones.append({
+                "key": key,
+                "target_date": target,
+                "tasks": len(linked),
+                "projected_date": last.ef if last else None,
+                "slip_days": (last.ef - target).days if last else None,
+                "driving_chain": self._chain(last) if last else [],
+            })
+
+        self._result = {
+            "conference_id": self.conference_id,
+            "as_of": self.as_of,
+            "milestones": milestones,
+            "critical_tasks": [self._out(n) for n in critical],
+            "cycle": self.cycle,
+        }
+        return self._result
+
+    def all_tasks(self) -> list[dict[str, Any]]:
+        """날짜가 잡힌 task 전체 (위상 순서)"""
+        self.result()
+        return [self._out(n) for n in self._ordered]
+
+
+class CriticalPathCache:
+    """학회별 CriticalPath (프로세스 메모리)"""
+
+    def __init__(self):
+        self._graphs: dict[int, CriticalPath] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, conference_id: int, as_of: Optional[date] = None) -> CriticalPath:
+        with self._lock:
+            graph = self._graphs.get(conference_id)
+            if graph is None:
+                graph = self._graphs[conference_id] = CriticalPath(conference_id)
+            graph.refresh(session, as_of or date.today())
+            return graph
+
+    def drop(self, conference_id: int) -> None:
+        with self._lock:
+            self._graphs.pop(conference_id, None)
+
+
+critical_paths = CriticalPathCache()
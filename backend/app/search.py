@@ -0,0 +1,244 @@
+# backend/app/search.py
+"""
+전체 검색 (SQLite FTS5)
+
+- task(name, description) / person(name, affiliation, role_title) / auditlog(before_json, after_json)
+- task / person: external content FTS5 테이블 + trigger 로 동기화 → set-based UPDATE/DELETE, INSERT…SELECT 도 그대로 반영
+- audit: 학회별 contentless FTS5 (fts_audit_{cid}), audit insert/delete 경로에서는 index 를 건드리지 않음
+    - 검색 직전에 index_audit() 가 마지막으로 넣은 rowid 이후만 INSERT…SELECT
+    - 학회 삭제는 drop_audit() 로 테이블째 DROP (행마다 'delete' X)
+- tokenizer = trigram: 띄어쓰기/형태소와 상관없이 부분 문자열 검색 (한글 포함)
+- trigram 은 3글자 이상만 index 를 탐 → 1~2글자 검색어는 원본 테이블 LIKE 로 처리
+- SQLite 가 아니거나 FTS5 가 없으면 전부 LIKE
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Integer, column, text
+from sqlmodel import Session
+
+from . import db
+
+# kind -> (FTS 테이블, 원본 테이블, 검색 컬럼)
+SOURCES = {
+    "task": ("fts_task", "task", ("name", "description")),
+    "person": ("fts_person", "person", ("name", "affiliation", "role_title")),
+    "audit": ("fts_audit", "auditlog", ("before_json", "after_json")),  # 실제 테이블은 fts_audit_{cid}
+}
+
+# 결과에 같이 내려줄 원본 컬럼 (title 은 첫 번째)
+_DISPLAY = {
+    "task": "s.name, s.conference_id",
+    "person": "s.name, NULL",
+    "audit": "s.entity_type || ' #' || s.entity_id || ' ' || s.action, s.conference_id",
+}
+
+# trigger 로 동기화하는 kind (audit 는 index_audit)
+_TRIGGERED = ("task", "person")
+
+# index_audit 가 한 트랜잭션에 넣는 audit 행 수
+AUDIT_INDEX_BATCH = int(os.getenv("AUDIT_INDEX_BATCH") or 5000)
+
+_enabled: Optional[bool] = None
+
+
+def _ddl(fts: str, table: str, cols: tuple[str, ...]) -> list[str]:
+    c = ", ".join(cols)
+    new = ", ".join(f"new.{x}" for x in cols)
+    old = ", ".join(f"old.{x}" for x in cols)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {c}) VALUES ('delete', old.id, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {c}) VALUES (new.id, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{c}, content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        # 날짜/상태만 바뀌는 UPDATE 는 index 를 건드리지 않음
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {c} ON {table} BEGIN {delete} {insert} END",
+    ]
+
+
+def init_search() -> bool:
+    """startup 에서 1번: FTS 테이블/trigger 생성, 처음 만든 테이블은 rebuild"""
+    global _enabled
+    engine = db.engine
+    if engine.dialect.name != "sqlite":
+        _enabled = False
+        return False
+    with engine.begin() as conn:
+        try:
+            have = {r[0] for r in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'fts\\_%' ESCAPE '\\'")}
+            # 예전 trigger 방식 fts_audit (audit insert/delete 마다 index 갱신) 정리
+            for suffix in ("ai", "ad", "au"):
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS fts_audit_{suffix}")
+            conn.exec_driver_sql("DROP TABLE IF EXISTS fts_audit")
+            for kind in _TRIGGERED:
+                fts, table, cols = SOURCES[kind]
+                for stmt in _ddl(fts, table, cols):
+                    conn.exec_driver_sql(stmt)
+                if fts not in have:
+                    conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        except Exception:
+            # FTS5 / trigram 을 지원하지 않는 sqlite 빌드
+            _enabled = False
+            return False
+    _enabled = True
+    return True
+
+
+def enabled() -> bool:
+    return bool(_enabled)
+
+
+# -----------------------
+# audit index (학회별, write path 밖에서 채움)
+# -----------------------
+def _audit_fts(cid: int) -> str:
+    return f"fts_audit_{int(cid)}"
+
+
+def _audit_tables(conn) -> dict[int, str]:
+    names = conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB 'fts_audit_[0-9]*' "
+        "AND name NOT GLOB 'fts_audit_*_*'").scalars()
+    return {int(n.rsplit("_", 1)[1]): n for n in names}
+
+
+def index_audit(conference_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    audit 검색 index 를 auditlog 에 맞춰 따라잡음 → 새로 넣은 행 수
+    - conference_ids 가 없으면 전체 학회
+    - "마지막 rowid 이후" 를 INSERT…SELECT 안에서 읽음 → 동시에 불려도 같은 행을 두 번 넣지 않음
+    """
+    if not enabled():
+        return 0
+    cols = ", ".join(SOURCES["audit"][2])
+    with db.engine.connect() as conn:
+        have = _audit_tables(conn)
+        if conference_ids is None:
+            conference_ids = conn.exec_driver_sql("SELECT id FROM conference").scalars().all()
+    added = 0
+    for cid in conference_ids:
+        fts = _audit_fts(cid)
+        while True:
+            with db.engine.begin() as conn:
+                if cid not in have:
+                    if conn.exec_driver_sql(
+                            "SELECT 1 FROM auditlog WHERE conference_id = ? LIMIT 1", (cid,)).first() is None:
+                        break
+                    conn.exec_driver_sql(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                                         f"{cols}, content='', tokenize='trigram')")
+                    have[cid] = fts
+                n = conn.exec_driver_sql(
+                    f"INSERT INTO {fts}(rowid, {cols}) "
+                    f"SELECT id, {cols} FROM auditlog WHERE conference_id = ? "
+                    f"AND id > COALESCE((SELECT rowid FROM {fts} ORDER BY rowid DESC LIMIT 1), 0) "
+                    f"ORDER BY id LIMIT ?", (cid, AUDIT_INDEX_BATCH)).rowcount
+            added += n
+            if n < AUDIT_INDEX_BATCH:
+                break
+    return added
+
+
+def drop_audit(session: Session, cid: int) -> None:
+    """delete_conference 트랜잭션 안에서: 학회 audit index 를 통째로 지움"""
+    if enabled():
+        session.execute(text(f"DROP TABLE IF EXISTS {_audit_fts(cid)}"))
+
+
+def _terms(q: str) -> tuple[list[str], list[str]]:
+    """(3글자 이상 → FTS, 1~2글자 → LIKE)"""
+    terms = [t for t in q.split() if t]
+    return [t for t in terms if len(t) >= 3], [t for t in terms if len(t) < 3]
+
+
+def _fts_query(terms: list[str]) -> str:
+    # 사용자가 넣은 따옴표/연산자는 그대로 문자로 취급
+    return " AND ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+
+def _like(t: str) -> str:
+    return "%" + t.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _search_kind(session: Session, kind: str, q: str, conference_id: Optional[int],
+                 limit: int) -> list[dict[str, Any]]:
+    fts, table, cols = SOURCES[kind]
+    long_terms, short_terms = _terms(q)
+    if not enabled():
+        long_terms, short_terms = [], long_terms + short_terms
+
+    params: dict[str, Any] = {"limit": limit}
+    where = []
+    for i, t in enumerate(short_terms):
+        params[f"t{i}"] = _like(t)
+        where.append("(" + " OR ".join(f"s.{c} LIKE :t{i} ESCAPE '\\'" for c in cols) + ")")
+    if conference_id is not None and kind != "person":
+        where.append("s.conference_id = :cid")
+        params["cid"] = conference_id
+
+    excerpt = "substr(" + " || ' ' || ".join(f"COALESCE(s.{c}, '')" for c in cols) + ", 1, 120)"
+    if long_terms:
+        params["match"] = _fts_query(long_terms)
+        if kind == "audit":
+            # contentless → snippet() 대신 원본 앞부분, 학회별 테이블을 각각 검색해서 합침
+            index_audit(None if conference_id is None else [conference_id])
+            tables = list(_audit_tables(session.connection()).items())
+            if conference_id is not None:
+                tables = [(c, t) for c, t in tables if c == conference_id]
+            targets = [(t, excerpt) for _, t in tables]
+        else:
+            targets = [(fts, f"snippet({fts}, -1, '[', ']', '…', 12)")]
+        sqls = [
+            f"SELECT s.id, {_DISPLAY[kind]}, bm25({t}) AS rank, {snip} "
+            f"FROM {t} JOIN {table} s ON s.id = {t}.rowid "
+            f"WHERE {t} MATCH :match {''.join(' AND ' + w for w in where)} "
+            f"ORDER BY rank LIMIT :limit"
+            for t, snip in targets
+        ]
+    else:
+        # 짧은 검색어만 있으면 원본 LIKE (최근 것부터)
+        sqls = [
+            f"SELECT s.id, {_DISPLAY[kind]}, 0.0 AS rank, {excerpt} "
+            f"FROM {table} s WHERE {' AND '.join(where) or '1 = 1'} "
+            f"ORDER BY s.id DESC LIMIT :limit"
+        ]
+
+    rows = [
+        {"kind": kind, "id": rid, "title": title, "conference_id": cid,
+         "rank": rank, "snippet": snippet}
+        for sql in sqls
+        for rid, title, cid, rank, snippet in session.execute(text(sql), params)
+    ]
+    if len(sqls) > 1:
+        rows = sorted(rows, key=lambda r: r["rank"])[:limit]
+    return rows
+
+
+def search(session: Session, q: str, kinds: list[str], conference_id: Optional[int] = None,
+           limit: int = 20, offset: int = 0) -> tuple[list[dict[str, Any]], Optional[int]]:
+    """
+    kind 별로 상위 (offset + limit + 1) 개씩 가져와 bm25 순으로 합침
+    → (items, next_offset)
+    """
+    want = offset + limit + 1
+    rows: list[dict[str, Any]] = []
+    for kind in kinds:
+        rows += _search_kind(session, kind, q, conference_id, want)
+    rows.sort(key=lambda r: r["rank"])  # bm25: 작을수록 관련도 높음
+    page = rows[offset:offset + limit]
+    return page, (offset + limit if len(rows) > offset + limit else None)
+
+
+def person_ids_matching(q: str):
+    """list_people 의 이름 검색용 (Person.id IN …), FTS 로 안 되는 경우 None"""
+    if not enabled() or len(q) < 3:
+        return None
+    return (
+        text("SELECT rowid FROM fts_person WHERE fts_person MATCH :m")
+        .bindparams(m="name : " + _fts_query([q]))
+        .columns(column("rowid", Integer))
+    )
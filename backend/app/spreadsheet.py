@@ -0,0 +1,157 @@
+# backend/app/spreadsheet.py
+"""
+CSV / XLSX 내보내기 · 가져오기
+
+- 내보내기: yield_per 로 EXPORT_CHUNK 행씩 읽으면서 바로 흘려보냄 (행 수와 상관없이 메모리 일정)
+  - CSV 는 엑셀에서 한글이 깨지지 않게 UTF-8 BOM
+  - XLSX 는 openpyxl write_only 로 임시 파일에 쓴 뒤 조각으로 읽어 보냄
+- 가져오기: 업로드 파일을 한 줄씩 읽어 IMPORT_CHUNK 행씩 묶음 (검증/upsert/commit 은 main 에서 묶음마다)
+- XLSX 는 openpyxl 이 설치돼 있을 때만 (없으면 CSV 만)
+"""
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import os
+import tempfile
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Optional
+
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from . import db
+
+try:
+    import openpyxl
+except ImportError:  # 선택 의존성
+    openpyxl = None
+
+EXPORT_CHUNK = int(os.getenv("EXPORT_CHUNK") or 1000)
+IMPORT_CHUNK = int(os.getenv("IMPORT_CHUNK") or 500)
+FORMATS = ("csv", "xlsx")
+
+_MEDIA = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+_READ_BYTES = 64 * 1024
+
+
+def check_format(fmt: Optional[str], filename: Optional[str] = None) -> str:
+    """format 파라미터 → 없으면 파일 확장자 → 기본 csv, 지원 안 하면 ValueError"""
+    if not fmt and filename and "." in filename:
+        fmt = filename.rsplit(".", 1)[1]
+    fmt = (fmt or "csv").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if fmt == "xlsx" and openpyxl is None:
+        raise ValueError("xlsx needs openpyxl (pip install openpyxl)")
+    return fmt
+
+
+# -----------------------
+# 내보내기
+# -----------------------
+def _csv_cell(v: Any) -> Any:
+    if isinstance(v, (date, datetime)):
+        return v.isoformat()
+    return "" if v is None else v
+
+
+def _partitions(stmt) -> Iterator[list]:
+    # 요청 세션은 응답 전에 닫히므로 스트리밍은 자기 세션으로
+    with Session(db.engine) as s:
+        for part in s.execute(stmt.execution_options(yield_per=EXPORT_CHUNK)).partitions():
+            yield part
+
+
+def _csv_stream(stmt, header: list[str]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(header)
+    yield codecs.BOM_UTF8 + buf.getvalue().encode()
+    for part in _partitions(stmt):
+        buf.seek(0)
+        buf.truncate()
+        w.writerows([_csv_cell(v) for v in r] for r in part)
+        yield buf.getvalue().encode()
+
+
+def _xlsx_stream(stmt, header: list[str]) -> Iterator[bytes]:
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(header)
+    for part in _partitions(stmt):
+        for r in part:
+            ws.append(list(r))
+    with tempfile.TemporaryFile() as f:
+        wb.save(f)
+        f.seek(0)
+        while chunk := f.read(_READ_BYTES):
+            yield chunk
+
+
+def export_response(stmt, header: list[str], fmt: str, filename: str) -> StreamingResponse:
+    """stmt(컬럼 순서 = header) 결과를 파일로 내려받게"""
+    body = _xlsx_stream(stmt, header) if fmt == "xlsx" else _csv_stream(stmt, header)
+    return StreamingResponse(body, media_type=_MEDIA[fmt], headers={
+        "Content-Disposition": f'attachment; filename="{filename}.{fmt}"',
+    })
+
+
+# -----------------------
+# 가져오기
+# -----------------------
+def _cell(v: Any) -> Any:
+    """엑셀 셀 값 정리: 날짜 → date, 정수로 떨어지는 float → int, 빈 칸 → None"""
+    if isinstance(v, datetime):
+        return v.date() if v.time() == datetime.min.time() else v
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, str):
+        v = v.strip()
+        return v or None
+    return v
+
+
+def _csv_rows(f) -> Iterator[list]:
+    yield from csv.reader(io.TextIOWrapper(f, encoding="utf-8-sig", newline=""))
+
+
+def _xlsx_rows(f) -> Iterator[tuple]:
+    wb = openpyxl.load_workbook(f, read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def read_rows(f, fmt: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    (엑셀 기준 행 번호, {header: 값}) 을 한 줄씩
+    - 첫 줄은 header (소문자로), 빈 줄은 건너뜀
+    - 파일이 깨져 있으면 ValueError
+    """
+    try:
+        rows = _xlsx_rows(f) if fmt == "xlsx" else _csv_rows(f)
+        header = [str(h or "").strip().lower() for h in next(rows, [])]
+        for n, r in enumerate(rows, start=2):
+            row = {h: _cell(v) for h, v in zip(header, r) if h}
+            if any(v is not None for v in row.values()):
+                yield n, row
+    except Exception as e:  # 인코딩 / 깨진 zip 등
+        raise ValueError(f"cannot read {fmt}: {e}") from e
+
+
+def chunked(rows: Iterable, size: int = 0) -> Iterator[list]:
+    size = size or IMPORT_CHUNK
+    part = []
+    for r in rows:
+        part.append(r)
+        if len(part) >= size:
+            yield part
+            part = []
+    if part:
+        yield part
@@ -0,0 +1,84 @@
+# backend/app/versions.py
+"""
+학회별 변경 버전 (Conference.version) + ETag / 304
+
+- task / milestone / assignment 를 바꾸는 쪽에서 touch(session, cid)
+  (audit() 가 자동으로 부름) → commit 직전에 학회당 UPDATE 1번으로 version+1
+- 읽기 endpoint 는 version 으로 weak ETag 를 만들고 If-None-Match 가 같으면 304
+  (사람 / 역할 템플릿이 들어가는 응답은 people_etag / 역할 캐시 version 도 같이)
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from fastapi import HTTPException, Response
+from sqlalchemy import event, func, update
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session, select
+
+from .models import Conference, Person
+
+_TOUCHED_KEY = "touched_conferences"
+
+
+def touch(session: Session, conference_id: int) -> None:
+    session.info.setdefault(_TOUCHED_KEY, set()).add(conference_id)
+
+
+@event.listens_for(SASession, "before_commit")
+def _bump_versions(session: SASession) -> None:
+    ids = session.info.pop(_TOUCHED_KEY, None)
+    if ids:
+        session.execute(
+            update(Conference)
+            .where(Conference.id.in_(ids))
+            .values(version=Conference.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+
+@event.listens_for(SASession, "after_rollback")
+def _drop_touched(session: SASession) -> None:
+    session.info.pop(_TOUCHED_KEY, None)
+
+
+def conference_etag(session: Session, cid: int, kind: str, *depends: str) -> str:
+    """
+    depends: 응답에 들어가는 학회 밖 데이터의 버전 (사람 이름 → people_etag, 역할 라벨 → 역할 캐시 version)
+    — 사람 / 역할 수정은 Conference.version 을 올리지 않으므로 같이 ETag 에 넣음
+    - 없는 학회는 404 (ETag 를 만들지 않음)
+    - 학회를 지우고 새로 만들면 id 가 다시 쓰일 수 있음 → created_at 도 넣음
+    """
+    row = session.exec(select(Conference.version, Conference.created_at).where(Conference.id == cid)).first()
+    if row is None:
+        raise HTTPException(404, "Conference not found")
+    version, created_at = row
+    etag = f'W/"{kind}-{cid}-{created_at:%Y%m%d%H%M%S%f}-{version}"'
+    return query_etag(etag, "|".join(depends))
+
+
+def people_etag(session: Session) -> str:
+    # people 은 학회와 무관 → 집계값으로 (행 전체를 읽지 않음)
+    n, max_id, max_updated = session.exec(
+        select(func.count(), func.max(Person.id), func.max(Person.updated_at))
+    ).one()
+    stamp = str(max_updated or 0).replace(" ", "T")  # ETag 안에는 공백 불가
+    return f'W/"people-{n}-{max_id or 0}-{stamp}"'
+
+
+def query_etag(etag: str, query: str) -> str:
+    """필터/정렬/페이지가 다른 요청은 다른 ETag (query string 해시를 덧붙임)"""
+    if not query:
+        return etag
+    return etag[:-1] + "-" + hashlib.sha1(query.encode()).hexdigest()[:10] + '"'
+
+
+def not_modified(etag: str, if_none_match: Optional[str], response: Response) -> Optional[Response]:
+    """If-None-Match 가 맞으면 304 Response, 아니면 response 에 ETag 를 달고 None"""
+    if if_none_match and (if_none_match.strip() == "*" or
+                          etag in [t.strip() for t in if_none_match.split(",")]):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"  # 브라우저가 매번 ETag 로 재검증
+    return None
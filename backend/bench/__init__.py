@@ -0,0 +1,11 @@
+"""
+Conference OS 벤치마크 스크립트 모음
+
+backend/ 에서 실행:
+    python -m bench.task_batch
+    python -m bench.suite --scale medium --out result.json   # 주요 API 전체 (JSON 리포트)
+    python -m bench.query_plans                              # 쿼리 계획 검사 (full scan / 임시 정렬이면 exit 1)
+
+- 임시 SQLite 파일 DB 를 만들어 ASGI app 을 in-process 로 호출 (운영 DB 는 건드리지 않음)
+- fastapi.testclient 를 쓰므로 httpx 가 필요 (pip install httpx)
+"""
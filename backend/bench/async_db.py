@@ -0,0 +1,115 @@
+# backend/bench/async_db.py
+"""
+목록 API: threadpool(DB_ASYNC=0) vs async 엔진(DB_ASYNC=1) 동시 접속 부하
+
+    python -m bench.async_db [TASKS] [REQUESTS] [BUSY_WORKERS]
+
+- 모드마다 subprocess 로 (DB_ASYNC 는 import 시점에 결정)
+- ASGI app 을 in-process 로 httpx.AsyncClient 에 물려 동시 요청 수(1/16/64/256)별 req/s, p50/p99
+- BUSY_WORKERS: threadpool worker 를 그만큼 계속 잡아 둠 (sync SSE / long-poll 이 HOLD_S 초씩 물고
+  다시 요청하는 상황) → threadpool 모드는 남은 worker 로만 처리, async 모드는 영향 없음
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from .common import bench_client, create_conference, report
+
+CONCURRENCY = (1, 16, 64, 256)
+HOLD_S = 1.0
+
+
+def _seed(client, n_tasks: int) -> int:
+    cid = create_conference(client, name="async-db")
+    client.post(f"/conferences/{cid}/milestones/generate", params={"create_default_tasks": False})
+    items = [{"task_group": "PAPER", "name": f"심사 {i}", "due_date": "2026-05-01"} for i in range(n_tasks)]
+    ids = [t["id"] for t in client.post(f"/conferences/{cid}/tasks:batch", json={"items": items}).json()["created"]]
+    pids = [client.post("/people", json={"name": f"위원 {i}"}).json()["id"] for i in range(50)]
+    for i, tid in enumerate(ids[:500]):
+        client.post(f"/tasks/{tid}/assign", json={"person_id": pids[i % len(pids)]})
+    return cid
+
+
+async def _load(cid: int, n_requests: int, busy_workers: int) -> dict:
+    import anyio
+    import httpx
+
+    from app import db
+    from app.main import app
+
+    urls = [f"/conferences/{cid}/tasks?limit=200", f"/conferences/{cid}/milestones",
+            f"/conferences/{cid}/audit?limit=100", f"/conferences/{cid}/assignments"]
+    stop = threading.Event()
+    limiter = anyio.to_thread.current_default_thread_limiter()
+
+    async def long_poll() -> None:
+        while not stop.is_set():
+            await anyio.to_thread.run_sync(stop.wait, HOLD_S)
+
+    hogs = [asyncio.ensure_future(long_poll()) for _ in range(busy_workers)]
+    await asyncio.sleep(0.1)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for c in CONCURRENCY:
+            lat: list[float] = []
+            sem = asyncio.Semaphore(c)
+
+            async def one(i: int) -> None:
+                async with sem:
+                    t0 = time.perf_counter()
+                    r = await client.get(urls[i % len(urls)])
+                    r.raise_for_status()
+                    lat.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            await asyncio.gather(*[one(i) for i in range(n_requests)])
+            total = time.perf_counter() - t0
+            lat.sort()
+            results[f"c{c}"] = {
+                "req_per_s": round(n_requests / total, 1),
+                "p50_ms": round(lat[len(lat) // 2] * 1000, 1),
+                "p99_ms": round(lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000, 1),
+            }
+
+    stop.set()
+    await asyncio.gather(*hogs)
+    if db.ASYNC_ENABLED:
+        await db.get_async_engine().dispose()
+    return {"threadpool_tokens": limiter.total_tokens, **results}
+
+
+def run_mode(n_tasks: int, n_requests: int, busy_workers: int) -> dict:
+    from app import db
+
+    with bench_client() as client:
+        cid = _seed(client, n_tasks)
+        out = asyncio.run(_load(cid, n_requests, busy_workers))
+    return {"async": db.ASYNC_ENABLED, **out}
+
+
+def main(n_tasks: int = 2000, n_requests: int = 1000, busy_workers: int = 0) -> None:
+    results = {}
+    for mode in ("0", "1"):
+        env = {**os.environ, "DB_ASYNC": mode}
+        out = subprocess.run(
+            [sys.executable, "-m", "bench.async_db", "--mode", str(n_tasks), str(n_requests), str(busy_workers)],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        results["async" if mode == "1" else "threadpool"] = json.loads(out.strip().splitlines()[-1])
+    report("async_db", {"n_tasks": n_tasks, "requests_per_level": n_requests,
+                        "busy_workers": busy_workers, **results})
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--mode"]:
+        print(json.dumps(run_mode(*[int(x) for x in sys.argv[2:5]])))
+    else:
+        main(*[int(x) for x in sys.argv[1:4]])
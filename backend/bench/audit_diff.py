@@ -0,0 +1,61 @@
+# backend/bench/audit_diff.py
+"""
+AuditLog 저장 형식: full 스냅샷 vs diff(+checkpoint)
+
+    python -m bench.audit_diff [TASKS] [EDITS]
+
+- edit 1건당 before_json+after_json 길이(문자 수)
+- /conferences/{cid}/audit/{id}/state 복원 시간
+"""
+from __future__ import annotations
+
+import random
+import sys
+
+from sqlmodel import Session, func, select
+
+from .common import bench_client, create_conference, report, timed
+
+
+def _run(client, encoding: str, n_tasks: int, n_edits: int) -> dict:
+    from app import audit, db
+    from app.models import AuditLog
+
+    audit.AUDIT_ENCODING = encoding
+    cid = create_conference(client, name=f"audit-{encoding}")
+    items = [{"task_group": "PAPER", "name": f"task {i}",
+              "description": "발표신청/접수 현황 점검 및 원문 제출 안내 " * 4} for i in range(n_tasks)]
+    ids = [t["id"] for t in client.post(f"/conferences/{cid}/tasks:batch", json={"items": items}).json()["created"]]
+
+    rnd = random.Random(0)
+    for e in range(n_edits):
+        body = {"items": [{"id": tid, "status": rnd.choice(["todo", "doing", "done"]),
+                           "due_date": f"2026-05-{e % 28 + 1:02d}"} for tid in ids]}
+        client.patch(f"/conferences/{cid}/tasks:batch", json=body).raise_for_status()
+
+    with Session(db.engine) as s:
+        n, size = s.exec(
+            select(func.count(), func.sum(func.length(AuditLog.before_json) + func.length(AuditLog.after_json)))
+            .where(AuditLog.conference_id == cid, AuditLog.action != "create")
+        ).one()
+        last_ids = s.exec(
+            select(func.max(AuditLog.id)).where(AuditLog.conference_id == cid).group_by(AuditLog.entity_id)
+        ).all()
+
+    it = iter(last_ids * 10)
+    rebuild = timed(lambda: client.get(f"/conferences/{cid}/audit/{next(it)}/state").raise_for_status(),
+                    repeat=len(last_ids) * 10)
+    return {"edits": n, "json_chars_per_edit": round(size / n, 1),
+            "rebuild_p50_ms": round(rebuild["p50_s"] * 1000, 3),
+            "rebuild_p99_ms": round(rebuild["p99_s"] * 1000, 3)}
+
+
+def main(n_tasks: int = 100, n_edits: int = 50) -> None:
+    with bench_client() as client:
+        results = {enc: _run(client, enc, n_tasks, n_edits) for enc in ("full", "diff")}
+    report("audit_diff", {"tasks": n_tasks, "edits_per_task": n_edits, **results})
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,59 @@
+# backend/bench/common.py
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Iterator, Optional
+
+
+@contextlib.contextmanager
+def bench_client(setup: Optional[Callable[[object], object]] = None) -> Iterator["TestClient"]:
+    """임시 DB 파일에 연결된 TestClient (setup(engine): app startup 전에 데이터 채우기)"""
+    from fastapi.testclient import TestClient
+
+    from app import db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db.engine = db.make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        if setup is not None:
+            setup(db.engine)
+        from app.main import app
+
+        with TestClient(app) as client:
+            client.post("/role-templates/seed")
+            yield client
+        db.engine.dispose()
+
+
+def create_conference(client, year: int = 2026, name: str = "BENCH") -> int:
+    r = client.post("/conferences", json={
+        "year": year, "name": name,
+        "start_date": f"{year}-06-01", "end_date": f"{year}-06-03",
+    })
+    r.raise_for_status()
+    return r.json()["id"]
+
+
+def timed(fn: Callable[[], object], repeat: int = 1) -> dict:
+    """fn 을 repeat 번 실행하고 초 단위 통계"""
+    xs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        xs.append(time.perf_counter() - t0)
+    xs.sort()
+    return {
+        "n": len(xs),
+        "total_s": round(sum(xs), 4),
+        "mean_s": round(statistics.fmean(xs), 6),
+        "p50_s": round(xs[len(xs) // 2], 6),
+        "p99_s": round(xs[min(len(xs) - 1, int(len(xs) * 0.99))], 6),
+    }
+
+
+def report(name: str, results: dict) -> None:
+    print(json.dumps({"bench": name, **results}, ensure_ascii=False, indent=2))
@@ -0,0 +1,140 @@
+# backend/bench/db_profile.py
+"""
+DB_PROFILE=plain vs tuned: uvicorn 멀티 워커에 동시 읽기/쓰기 부하
+
+    python -m bench.db_profile [--workers 4] [--threads 16] [--seconds 10] [--tasks 300]
+
+- 프로필마다 임시 DB 로 uvicorn 을 띄움 (실제 HTTP, 워커 프로세스 여러 개)
+- reader 스레드: GET /conferences/{cid}/tasks
+- writer 스레드: PATCH /tasks/{id}
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+from .common import report
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(db_path: str, profile: str, workers: int) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}", "DB_PROFILE": profile}
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # 워커들이 동시에 create_all 하지 않도록 스키마를 먼저 만듦
+    subprocess.run([sys.executable, "-c", "import app.models; from app.db import init_db; init_db()"],
+                   env=env, cwd=cwd, check=True)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env, cwd=cwd,
+    )
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            httpx.get(f"{base}/conferences", timeout=1).raise_for_status()
+            return proc, base
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def _seed(base: str, n_tasks: int) -> tuple[int, list[int]]:
+    with httpx.Client(base_url=base, timeout=30) as c:
+        c.post("/role-templates/seed")
+        c.post("/conferences", json={"year": 2026, "name": "BENCH",
+                                     "start_date": "2026-06-01", "end_date": "2026-06-03"})
+        cid = c.get("/conferences").json()[0]["id"]
+        items = [{"task_group": "PROGRAM", "name": f"task {i}"} for i in range(n_tasks)]
+        r = c.post(f"/conferences/{cid}/tasks:batch", json={"items": items})
+        r.raise_for_status()
+        return cid, [t["id"] for t in r.json()["created"]]
+
+
+def _load(base: str, cid: int, task_ids: list[int], threads: int, seconds: float) -> dict:
+    stop = time.monotonic() + seconds
+    stats = {"read": [], "write": [], "errors": 0}
+    lock = threading.Lock()
+
+    def worker(kind: str):
+        lat, errors = [], 0
+        with httpx.Client(base_url=base, timeout=30) as c:
+            while time.monotonic() < stop:
+                t0 = time.perf_counter()
+                try:
+                    if kind == "read":
+                        r = c.get(f"/conferences/{cid}/tasks")
+                    else:
+                        r = c.patch(f"/tasks/{random.choice(task_ids)}",
+                                    json={"status": random.choice(["todo", "doing", "done"])})
+                    ok = r.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    lat.append(time.perf_counter() - t0)
+                else:
+                    errors += 1
+        with lock:
+            stats[kind].extend(lat)
+            stats["errors"] += errors
+
+    ts = [threading.Thread(target=worker, args=("read" if i % 2 == 0 else "write",))
+          for i in range(threads)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+
+    def summary(xs):
+        xs.sort()
+        if not xs:
+            return {"ops_per_s": 0}
+        return {
+            "ops_per_s": round(len(xs) / seconds, 1),
+            "p50_ms": round(xs[len(xs) // 2] * 1000, 2),
+            "p99_ms": round(xs[min(len(xs) - 1, int(len(xs) * 0.99))] * 1000, 2),
+        }
+
+    return {"read": summary(stats["read"]), "write": summary(stats["write"]), "errors": stats["errors"]}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--threads", type=int, default=16)
+    ap.add_argument("--seconds", type=float, default=10)
+    ap.add_argument("--tasks", type=int, default=300)
+    args = ap.parse_args()
+
+    results = {}
+    for profile in ("plain", "tuned"):
+        with tempfile.TemporaryDirectory() as tmp:
+            proc, base = _start_server(os.path.join(tmp, "bench.db"), profile, args.workers)
+            try:
+                cid, task_ids = _seed(base, args.tasks)
+                results[profile] = _load(base, cid, task_ids, args.threads, args.seconds)
+            finally:
+                proc.terminate()
+                proc.wait(10)
+
+    report("db_profile", {"workers": args.workers, "threads": args.threads,
+                          "seconds": args.seconds, "tasks": args.tasks, **results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# backend/bench/fast_json.py
+"""
+목록 응답: 기본(json) vs FAST_JSON(orjson + 스트리밍)
+
+    python -m bench.fast_json [TASKS] [REPEAT]
+
+- list_tasks(전체), list_audit(limit 1000), list_milestones 를 같은 데이터로 두 모드 모두 호출
+- 요청/초, p50/p99, 응답 크기, 두 모드의 응답 내용이 같은지
+"""
+from __future__ import annotations
+
+import sys
+
+from .common import bench_client, create_conference, report, timed
+
+
+def _seed(client, n_tasks: int) -> int:
+    cid = create_conference(client, name="fast-json")
+    client.post(f"/conferences/{cid}/milestones/generate", params={"create_default_tasks": False})
+    items = [{"task_group": "PAPER", "name": f"논문 심사 배정 {i}",
+              "description": "발표신청/접수 현황 점검 및 원문 제출 안내 " * 2,
+              "start_date": "2026-04-01", "due_date": "2026-05-01"} for i in range(n_tasks)]
+    client.post(f"/conferences/{cid}/tasks:batch", json={"items": items}).raise_for_status()
+    return cid
+
+
+def main(n_tasks: int = 10000, repeat: int = 30) -> None:
+    from app import fastjson
+
+    with bench_client() as client:
+        cid = _seed(client, n_tasks)
+        urls = {
+            "tasks": f"/conferences/{cid}/tasks",
+            "audit": f"/conferences/{cid}/audit?limit=1000",
+            "milestones": f"/conferences/{cid}/milestones",
+        }
+        results = {}
+        for name, url in urls.items():
+            bodies = {}
+            for mode in ("default", "fast"):
+                fastjson.FAST_JSON = mode == "fast"
+                bodies[mode] = client.get(url).json()
+                t = timed(lambda: client.get(url).raise_for_status(), repeat=repeat)
+                results.setdefault(name, {})[mode] = {
+                    "req_per_s": round(t["n"] / t["total_s"], 1),
+                    "p50_ms": round(t["p50_s"] * 1000, 2),
+                    "p99_ms": round(t["p99_s"] * 1000, 2),
+                    "bytes": len(client.get(url).content),
+                }
+            results[name]["same_body"] = bodies["default"] == bodies["fast"]
+        fastjson.FAST_JSON = False
+
+    report("fast_json", {"n_tasks": n_tasks, "repeat": repeat,
+                         "orjson": fastjson.orjson is not None, **results})
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    main(*args)
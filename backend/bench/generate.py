@@ -0,0 +1,204 @@
+# backend/bench/generate.py
+"""
+합성 데이터 생성 (큰 학회 여러 개)
+
+    python -m bench.generate DATABASE_URL [--scale medium] [--conferences N] [--tasks N]
+                             [--people N] [--assignments N] [--audit N] [--seed 0]
+
+- 학회 N 개 × (task / 할당 / audit 행), 사람은 학회끼리 공유
+- 같은 seed 면 같은 데이터 (벤치 결과를 커밋끼리 비교할 수 있게)
+- API 를 거치지 않고 models.py 테이블에 bulk insert (수십만 행도 수십 초)
+  - milestone 은 MILESTONE_TEMPLATE 그대로, audit 은 audit() 가 남기는 모양
+    (task create = full, 이후 수정 = diff, AUDIT_CHECKPOINT_EVERY 번마다 checkpoint)
+- 스키마는 migrations.upgrade() 로 먼저 맞춤, Postgres 면 끝나고 id sequence 도 맞춤
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, insert, select
+
+from app import migrations
+from app.audit import AUDIT_CHECKPOINT_EVERY, audit_row
+from app.copy_db import reset_sequences
+from app.models import Assignment, AuditLog, Conference, Milestone, Person, Task
+from app.templates import DEFAULT_TASKS, MILESTONE_TEMPLATE
+
+# 학회 하나당 (task, 할당, audit 행), 사람은 전체
+SCALES = {
+    "small": {"conferences": 2, "tasks": 500, "people": 100, "assignments": 500, "audit": 5_000},
+    "medium": {"conferences": 5, "tasks": 2_000, "people": 300, "assignments": 3_000, "audit": 30_000},
+    "large": {"conferences": 10, "tasks": 10_000, "people": 1_000, "assignments": 15_000, "audit": 200_000},
+}
+
+GROUPS = sorted({t["task_group"] for t in DEFAULT_TASKS})
+STATUSES = ("todo", "doing", "done")
+PRIORITIES = ("low", "med", "high")
+ROLES = ("chair", "vice_chair", "secretary", "program_chair", "program_member", "reviewer", "staff")
+
+_CHUNK = 5000
+_BASE_YEAR = 2100  # 실제 학회 연도와 안 겹치게
+
+
+def _insert(conn, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), _CHUNK):
+        conn.execute(insert(model.__table__), rows[i:i + _CHUNK])
+
+
+def _next_id(conn, model) -> int:
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _people(conn, rng: random.Random, n: int, now: datetime) -> list[int]:
+    start = _next_id(conn, Person)
+    rows = [{
+        "id": start + i, "name": f"위원 {i:05d}", "affiliation": f"대학 {rng.randrange(50)}",
+        "role_title": rng.choice(("교수", "연구원", "학생", None)), "created_at": now, "updated_at": now,
+    } for i in range(n)]
+    _insert(conn, Person, rows)
+    return [r["id"] for r in rows]
+
+
+def _conference(conn, rng: random.Random, year: int, n_tasks: int, n_assignments: int,
+                n_audit: int, people: list[int]) -> dict[str, int]:
+    start_date = date(year, 6, 1)
+    began = datetime(year - 1, 12, 1)  # audit 시각: 반년 전부터 조금씩
+    conf_id = _next_id(conn, Conference)
+    _insert(conn, Conference, [{
+        "id": conf_id, "year": year, "name": "BENCH", "start_date": start_date,
+        "end_date": start_date + timedelta(days=2), "timezone": "Asia/Seoul", "status": "planning",
+        "version": 0, "tasks_seeded": True, "created_at": began, "updated_at": began,
+    }])
+    _insert(conn, Milestone, [{
+        "conference_id": conf_id, "key": t["key"], "name": t["name"], "relative_days": t["relative_days"],
+        "target_date": start_date + timedelta(days=t["relative_days"]), "locked": False,
+    } for t in MILESTONE_TEMPLATE])
+
+    first = _next_id(conn, Task)
+    tasks = []
+    for i in range(n_tasks):
+        due = start_date + timedelta(days=rng.randint(-120, 30))
+        tasks.append({
+            "id": first + i, "conference_id": conf_id, "task_group": rng.choice(GROUPS),
+            "name": f"작업 {i:06d}", "description": "설명 " * rng.randrange(0, 20) or None,
+            "status": "todo", "priority": rng.choice(PRIORITIES),
+            "start_date": due - timedelta(days=rng.randint(1, 30)) if rng.random() < 0.5 else None,
+            "due_date": due, "milestone_key": rng.choice(MILESTONE_TEMPLATE)["key"],
+            "created_at": began, "updated_at": began,
+        })
+
+    # audit: task 마다 create → 남은 만큼 무작위 task 수정 (시각은 계속 증가)
+    # CHUNK 행씩 바로 insert (audit 은 task FK 가 없어서 task 보다 먼저 넣어도 됨)
+    step = timedelta(seconds=max(1, 180 * 86400 // max(n_audit, 1)))
+    clock = began
+    audit_rows: list[dict[str, Any]] = []
+    n_written = 0
+
+    def add(row: dict[str, Any]) -> None:
+        nonlocal n_written
+        audit_rows.append(row)
+        if len(audit_rows) >= _CHUNK:
+            _insert(conn, AuditLog, audit_rows)
+            n_written += len(audit_rows)
+            audit_rows.clear()
+
+    since_reset = [0] * n_tasks
+    n_create = min(n_tasks, n_audit)
+    for t in tasks[:n_create]:
+        row = audit_row(conf_id, "task", t["id"], "create", {}, t)
+        row["created_at"] = clock = clock + step
+        add(row)
+    for _ in range(n_audit - n_create if n_create else 0):
+        i = rng.randrange(n_create)
+        t = tasks[i]
+        before = dict(t)
+        field = rng.choice(("status", "priority", "due_date"))
+        if field == "status":
+            t["status"] = rng.choice(STATUSES)
+        elif field == "priority":
+            t["priority"] = rng.choice(PRIORITIES)
+        else:
+            t["due_date"] = t["due_date"] + timedelta(days=rng.randint(-7, 7))
+        clock += step
+        t["updated_at"] = clock
+        if since_reset[i] >= AUDIT_CHECKPOINT_EVERY:
+            since_reset[i], encoding = 0, "checkpoint"
+        else:
+            since_reset[i], encoding = since_reset[i] + 1, "diff"
+        row = audit_row(conf_id, "task", t["id"], "update", before, t, encoding=encoding)
+        row["created_at"] = clock
+        add(row)
+
+    _insert(conn, Task, tasks)
+    _insert(conn, Assignment, [{
+        "task_id": first + rng.randrange(n_tasks), "person_id": rng.choice(people),
+        "responsibility": rng.choice(ROLES), "created_at": began,
+    } for _ in range(n_assignments if n_tasks else 0)])
+    _insert(conn, AuditLog, audit_rows)
+    return {"id": conf_id, "tasks": n_tasks, "assignments": n_assignments if n_tasks else 0,
+            "audit": n_written + len(audit_rows)}
+
+
+def generate(engine, conferences: int, tasks: int, people: int, assignments: int, audit: int,
+             seed: int = 0) -> dict:
+    """engine 의 DB 에 합성 데이터 추가 → {"conferences": [id...], "people": [id...], rows, seconds}"""
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    migrations.upgrade(engine)
+    now = datetime(_BASE_YEAR - 1, 12, 1)
+    with engine.begin() as conn:
+        person_ids = _people(conn, rng, people, now)
+        taken = set(conn.execute(select(Conference.year).where(Conference.name == "BENCH")).scalars())
+    made = []
+    years = (y for y in range(_BASE_YEAR, _BASE_YEAR + 10_000) if y not in taken)
+    for _ in range(conferences):
+        with engine.begin() as conn:  # 학회마다 commit
+            made.append(_conference(conn, rng, next(years), tasks, assignments, audit, person_ids))
+    reset_sequences(engine)
+    return {
+        "conferences": [c["id"] for c in made],
+        "people": person_ids,
+        "rows": {
+            "conference": len(made), "person": len(person_ids),
+            "milestone": len(made) * len(MILESTONE_TEMPLATE),
+            "task": sum(c["tasks"] for c in made),
+            "assignment": sum(c["assignments"] for c in made),
+            "auditlog": sum(c["audit"] for c in made),
+        },
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def scale_args(p: argparse.ArgumentParser) -> None:
+    """--scale + 항목별 덮어쓰기 (suite 와 같이 씀)"""
+    p.add_argument("--scale", choices=sorted(SCALES), default="small")
+    for k in SCALES["small"]:
+        p.add_argument(f"--{k}", type=int, help=f"기본: scale 의 값 ({k}{'' if k in ('conferences', 'people') else ' / 학회'})")
+    p.add_argument("--seed", type=int, default=0)
+
+
+def scale_of(args: argparse.Namespace) -> dict[str, int]:
+    return {k: v if getattr(args, k) is None else getattr(args, k) for k, v in SCALES[args.scale].items()}
+
+
+def main(argv: list[str] | None = None) -> None:
+    from app.db import make_engine, normalize_url
+
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("database_url")
+    scale_args(p)
+    args = p.parse_args(argv)
+    engine = make_engine(normalize_url(args.database_url))
+    out = generate(engine, seed=args.seed, **scale_of(args))
+    engine.dispose()
+    print(json.dumps({k: v for k, v in out.items() if k != "people"}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
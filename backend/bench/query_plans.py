@@ -0,0 +1,204 @@
+# backend/bench/query_plans.py
+"""
+Query plan 회귀 검사 (SQLite EXPLAIN QUERY PLAN)
+
+    python -m bench.query_plans [--verbose]
+
+- 작은 합성 데이터 (bench.generate) 위에서 CASES 의 API 를 한 번씩 호출하고,
+  그동안 나간 SELECT / UPDATE / DELETE (와 INSERT … SELECT) 를 같은 파라미터로 EXPLAIN QUERY PLAN
+- 실패 (exit 1):
+  - 실제 테이블 전체 읽기: SCAN <table> (USING INDEX 로 통째로 훑는 것도 포함)
+  - 정렬/그룹용 임시 B-tree: USE TEMP B-TREE FOR …
+  - 테이블에 실행할 때마다 만드는 임시 index: AUTOMATIC … INDEX
+- 일부러 통째로 읽는 곳 (전체 목록 등) 은 ALLOWED 에 이유와 함께
+- 통계(sqlite_stat1) 없이 검사 — app 은 ANALYZE 를 하지 않으므로 운영 DB 와 같은 조건
+  (작은 합성 데이터로 ANALYZE 하면 "작으니 다 읽자" 계획이 나와서 의미 없음)
+- models.py 의 index 를 바꾸거나 main.py / queries.py 의 쿼리를 바꾸면 같이 돌려 볼 것
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from typing import Any
+
+from sqlalchemy import event
+from sqlmodel import SQLModel
+
+from .common import bench_client, report
+from .generate import generate
+
+SCALE = {"conferences": 2, "tasks": 300, "people": 50, "assignments": 300, "audit": 2_000}
+
+# 이름 → (method, url, json) — url 의 {cid} {cid2} {tid} {tid2} {pid} {aid} {cursor} 는 데이터로 채움
+CASES: dict[str, tuple[str, str, Any]] = {
+    "conferences": ("GET", "/conferences", None),
+    "conference": ("GET", "/conferences/{cid}", None),
+    "conference_create": ("POST", "/conferences", {"year": 2999, "name": "PLAN", "start_date": "2999-06-01",
+                                                    "end_date": "2999-06-03"}),
+    "milestones": ("GET", "/conferences/{cid}/milestones", None),
+    "milestones_generate": ("POST", "/conferences/{cid}/milestones/generate", None),
+    "reschedule": ("POST", "/conferences/{cid}/reschedule", {"milestone_key": "M_30", "shift_days": 3}),
+    "stats": ("GET", "/conferences/{cid}/stats", None),
+    "critical_path": ("GET", "/conferences/{cid}/schedule/critical-path?all_tasks=true", None),
+    "tasks": ("GET", "/conferences/{cid}/tasks", None),
+    "tasks_group": ("GET", "/conferences/{cid}/tasks?group=PROGRAM", None),
+    "tasks_status": ("GET", "/conferences/{cid}/tasks?status=done", None),
+    "tasks_group_status": ("GET", "/conferences/{cid}/tasks?group=PROGRAM&status=done", None),
+    "tasks_page": ("GET", "/conferences/{cid}/tasks?limit=20&cursor={cursor}", None),
+    "tasks_sort_id": ("GET", "/conferences/{cid}/tasks?sort=id&limit=20", None),
+    "tasks_sort_updated": ("GET", "/conferences/{cid}/tasks?sort=updated_at&fields=id,name", None),
+    "tasks_export": ("GET", "/conferences/{cid}/tasks:export", None),
+    "task_create": ("POST", "/conferences/{cid}/tasks", {"task_group": "PLAN", "name": "plan check"}),
+    "task_patch": ("PATCH", "/tasks/{tid}", {"status": "doing"}),
+    "tasks_batch_patch": ("PATCH", "/conferences/{cid}/tasks:batch",
+                          {"items": [{"id": "{tid}", "priority": "high"}, {"id": "{tid2}", "status": "done"}]}),
+    "dependencies": ("GET", "/conferences/{cid}/dependencies", None),
+    "dependency_add": ("POST", "/tasks/{tid2}/dependencies", {"depends_on_id": "{tid}"}),
+    "dependency_delete": ("DELETE", "/tasks/{tid2}/dependencies/{tid}", None),
+    "assign": ("POST", "/tasks/{tid}/assign", {"person_id": "{pid}"}),
+    "task_assignments": ("GET", "/tasks/{tid}/assignments", None),
+    "conference_assignments": ("GET", "/conferences/{cid}/assignments", None),
+    "person_assignments": ("GET", "/conferences/{cid}/assignments?person_id={pid}", None),
+    "assignments_export": ("GET", "/conferences/{cid}/assignments:export", None),
+    "audit": ("GET", "/conferences/{cid}/audit?limit=50", None),
+    "audit_entity": ("GET", "/conferences/{cid}/audit?entity_type=task&entity_id={tid}", None),
+    "audit_since": ("GET", "/conferences/{cid}/audit?since=2000-01-01T00:00:00&limit=50", None),
+    "audit_state": ("GET", "/conferences/{cid}/audit/{aid}/state", None),
+    "people": ("GET", "/people?limit=20", None),
+    "people_export": ("GET", "/people:export", None),
+    "person_patch": ("PATCH", "/people/{pid}", {"affiliation": "plan check"}),
+    "role_templates": ("GET", "/role-templates", None),
+    "search": ("GET", "/search?q=작업 0001&conference_id={cid}", None),
+    "clone": ("POST", "/conferences/{cid}/clone", {"year": 2998}),
+    "conference_delete": ("DELETE", "/conferences/{cid2}", None),
+}
+
+# 사람 이름이 들어가는 응답의 ETag (versions.people_etag): person 전체 count / max 집계
+_PEOPLE_ETAG = ("SCAN person", "max(person.updated_at)", "people_etag: 사람 전체 집계 (사람 수는 작음)")
+
+# 일부러 통째로 읽거나 정렬하는 곳: 케이스 → [(계획 문구 일부, SQL 일부, 이유)]
+# (SQL 일부까지 맞아야 허용 — 같은 API 의 다른 쿼리가 나빠지면 잡히게)
+ALLOWED: dict[str, list[tuple[str, str, str]]] = {
+    "conferences": [("SCAN conference", "FROM conference", "학회 전체 목록 (학회 수는 작음)")],
+    "people": [("SCAN person", "FROM person", "사람 전체 목록 (name 순 index 를 그대로 읽고 limit 로 끊음)")],
+    "people_export": [("SCAN person", "FROM person", "사람 전체 내보내기")],
+    "role_templates": [("SCAN roletemplate", "FROM roletemplate", "역할 템플릿 전체 (메모리 캐시, 가끔만)"),
+                       ("USE TEMP B-TREE", "FROM roletemplate", "역할 템플릿 10여 개 정렬")],
+    "conference_create": [("SCAN roletemplate", "FROM roletemplate", "역할 템플릿 시드 확인 (캐시 miss 때만)"),
+                          ("USE TEMP B-TREE", "FROM roletemplate", "역할 템플릿 10여 개 정렬")],
+    "stats": [("USE TEMP B-TREE", "sum(CASE", "사람별 workload: 집계 결과(사람 수만큼)를 open 수로 정렬"),
+              _PEOPLE_ETAG],
+    "conference_assignments": [_PEOPLE_ETAG],
+    "person_assignments": [("USE TEMP B-TREE", "assignment.person_id = ?", "한 사람의 할당만 정렬"),
+                           _PEOPLE_ETAG],
+    "search": [("USE TEMP B-TREE", "bm25(", "관련도(bm25) 순 — FTS 매칭 결과만 정렬")],
+    "clone": [("USE TEMP B-TREE", "INSERT INTO assignment", "복제 시 한 번: 중복 할당 GROUP BY")],
+}
+
+_WRITE_OR_READ = re.compile(r"^\s*(SELECT|WITH|UPDATE|DELETE|INSERT\b.*\bSELECT\b)", re.S | re.I)
+_BAD = re.compile(r"^SCAN (\w+)|^SEARCH (\w+) USING AUTOMATIC|USE TEMP B-TREE")
+
+
+def _fill(v: Any, data: dict) -> Any:
+    if isinstance(v, str):
+        s = v.format(**data)
+        return int(s) if s.isdigit() and v.startswith("{") and v.endswith("}") else s
+    if isinstance(v, dict):
+        return {k: _fill(x, data) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_fill(x, data) for x in v]
+    return v
+
+
+def _problems(detail: str, tables: set[str]) -> bool:
+    m = _BAD.search(detail)
+    if not m:
+        return False
+    table = m.group(1) or m.group(2)
+    return table is None or table in tables  # subquery / CTE / CONSTANT ROW 를 훑는 건 괜찮음
+
+
+def check(engine, captured: dict[str, list[tuple[str, Any]]], verbose: bool = False) -> dict:
+    tables = set(SQLModel.metadata.tables)
+    violations, allowed, plans = [], [], {}
+    seen = set()
+    with engine.connect() as conn:
+        for case, stmts in captured.items():
+            for sql, params in stmts:
+                if (sql, repr(params)) in seen:
+                    continue
+                seen.add((sql, repr(params)))
+                rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params).all()
+                details = [r[3] for r in rows]
+                if verbose:
+                    plans.setdefault(case, []).append({"sql": " ".join(sql.split()), "plan": details})
+                for d in details:
+                    if not _problems(d, tables):
+                        continue
+                    why = next((r for p, q, r in ALLOWED.get(case, []) if p in d and q in sql), None)
+                    item = {"case": case, "plan": d, "sql": " ".join(sql.split())[:300]}
+                    if why:
+                        allowed.append({**item, "reason": why})
+                    else:
+                        violations.append(item)
+    out = {"statements": len(seen), "violations": violations, "allowed": allowed}
+    if verbose:
+        out["plans"] = plans
+    return out
+
+
+def run_cases(client, data: dict) -> dict[str, list[tuple[str, Any]]]:
+    """CASES 를 한 번씩 호출 → case 이름별로 그동안 나간 (SQL, 파라미터)"""
+    from app import db
+
+    captured: dict[str, list[tuple[str, Any]]] = {}
+    current: list = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if current and not executemany and _WRITE_OR_READ.match(statement):
+            captured.setdefault(current[0], []).append((statement, parameters))
+
+    cid, cid2 = data["conferences"][:2]
+    tasks = client.get(f"/conferences/{cid}/tasks?sort=id&fields=id&limit=2").json()
+    first = client.get(f"/conferences/{cid}/tasks?limit=20")
+    audit_id = client.get(f"/conferences/{cid}/audit?limit=1").json()[0]["id"]
+    ids = {"cid": cid, "cid2": cid2, "tid": tasks[0]["id"], "tid2": tasks[1]["id"],
+           "pid": data["people"][0], "aid": audit_id, "cursor": first.headers["X-Next-Cursor"]}
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        for name, (method, url, body) in CASES.items():
+            current[:] = [name]
+            r = client.request(method, _fill(url, ids), json=_fill(body, ids),
+                               headers={"X-Admin-Password": os.environ["ADMIN_PASSWORD"]})
+            if r.status_code >= 400:
+                raise RuntimeError(f"{name}: {method} {url} → {r.status_code}: {r.text[:200]}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    return captured
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("--verbose", action="store_true", help="모든 문장의 계획도 출력")
+    args = p.parse_args(argv)
+    os.environ.setdefault("ADMIN_PASSWORD", "bench")
+    data: dict = {}
+
+    def setup(engine) -> None:
+        data.update(generate(engine, seed=0, **SCALE))
+
+    with bench_client(setup) as client:
+        from app import db
+
+        captured = run_cases(client, data)
+        result = {"cases": len(CASES), **check(db.engine, captured, args.verbose)}
+
+    report("query_plans", result)
+    return 1 if result["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
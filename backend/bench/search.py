@@ -0,0 +1,77 @@
+# backend/bench/search.py
+"""
+GET /search (FTS5 trigram) vs 원본 테이블 LIKE '%q%' 스캔
+
+    python -m bench.search [TASKS] [EDITS]
+
+- templates.py 의 한글 이름으로 task 를 만들고 batch patch 로 audit 를 쌓음
+- 같은 검색어로 /search 와 LIKE 쿼리(task + auditlog) 시간 비교
+- audit index 는 write path 밖에서 채우므로 측정 전에 index_audit() 로 한 번 따라잡음
+- 흔한 검색어는 LIKE 가 앞쪽에서 21개를 금방 채우므로 유리, 드문 검색어는 LIKE 가 전체 스캔
+"""
+from __future__ import annotations
+
+import random
+import sys
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from .common import bench_client, create_conference, report, timed
+
+# 흔한 검색어 (템플릿 문구) + 드문 검색어 (NEEDLE_EVERY 개마다 1개)
+QUERIES = ["논문집", "조직위원회 확정", "등록", "유니콘특강", "유니콘특강 세션"]
+NEEDLE = "유니콘특강 세션"
+NEEDLE_EVERY = 2000
+
+
+def _seed(client, n_tasks: int, n_edits: int) -> int:
+    from app.templates import DEFAULT_TASKS, MILESTONE_TEMPLATE
+
+    names = [t["name"] for t in DEFAULT_TASKS] + [m["name"] for m in MILESTONE_TEMPLATE]
+    rnd = random.Random(0)
+    cid = create_conference(client, name="search")
+    items = [{"task_group": "PROGRAM", "name": f"{rnd.choice(names)} #{i}",
+              "description": NEEDLE if i % NEEDLE_EVERY == 0 else rnd.choice(names)}
+             for i in range(n_tasks)]
+    ids = [t["id"] for t in client.post(f"/conferences/{cid}/tasks:batch", json={"items": items}).json()["created"]]
+    for _ in range(n_edits):
+        body = {"items": [{"id": tid, "status": rnd.choice(["todo", "doing", "done"])} for tid in ids]}
+        client.patch(f"/conferences/{cid}/tasks:batch", json=body).raise_for_status()
+    return cid
+
+
+def _like(q: str) -> int:
+    """예전 방식: 원본 테이블 LIKE '%q%' (관련도 없이 최신순 21개)"""
+    from app import db
+
+    params = {f"t{i}": f"%{t}%" for i, t in enumerate(q.split())}
+    found = 0
+    for table, cols in (("task", ("name", "description")), ("auditlog", ("before_json", "after_json"))):
+        where = " AND ".join("(" + " OR ".join(f"{c} LIKE :t{i}" for c in cols) + ")" for i in range(len(params)))
+        with Session(db.engine) as s:
+            found += len(s.execute(text(f"SELECT id FROM {table} WHERE {where} ORDER BY id DESC LIMIT 21"),
+                                   params).all())
+    return found
+
+
+def main(n_tasks: int = 20000, n_edits: int = 2) -> None:
+    with bench_client() as client:
+        from app import search
+
+        _seed(client, n_tasks, n_edits)
+        search.index_audit()
+        results = {}
+        for q in QUERIES:
+            fts = timed(lambda: client.get("/search", params={"q": q, "kinds": "task,audit"}).raise_for_status(),
+                        repeat=20)
+            like = timed(lambda: _like(q), repeat=20)
+            results[q] = {"hits_on_page": _like(q),
+                          "fts_p50_ms": round(fts["p50_s"] * 1000, 2),
+                          "like_p50_ms": round(like["p50_s"] * 1000, 2)}
+    report("search", {"tasks": n_tasks, "audit_rows": n_tasks * (1 + n_edits), **results})
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    main(*args)
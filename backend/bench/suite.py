@@ -0,0 +1,215 @@
+# backend/bench/suite.py
+"""
+주요 API 벤치 한 번에 (합성 큰 학회 데이터 위에서) → JSON 리포트
+
+    python -m bench.suite [--scale small|medium|large] [--conferences N] [--tasks N] [--people N]
+                          [--assignments N] [--audit N] [--seed 0] [--requests 200] [--warmup 10]
+                          [--only tasks_list,audit_page] [--out result.json] [--compare base.json]
+
+- 임시 SQLite DB 에 bench.generate 로 데이터를 채운 뒤 ASGI app 을 in-process 로 (TestClient, 요청 1개씩)
+- 시나리오: task 목록 (전체 / cursor 페이지 / 필터), 할당 (task 별 / 학회 전체), audit 페이지,
+  milestone 생성 (새 학회마다), 학회 삭제 (생성한 큰 학회를 하나씩, 마지막에)
+- 시나리오마다 req/s, mean / p50 / p90 / p99 / max (ms), 요청당 SQL 수 (Server-Timing, METRICS=1 일 때)
+- 리포트에 git commit / 버전 / 설정 env 를 같이 남김
+- --compare: 예전 리포트와 p50 / req/s 변화율 (scale·seed 가 같아야 의미 있음)
+  공유 머신에서는 같은 커밋끼리도 ±30% 정도 흔들림 → --requests 를 늘리고 큰 차이만 볼 것
+  예) git stash; python -m bench.suite --out base.json; git stash pop; python -m bench.suite --compare base.json
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from .common import bench_client, create_conference, report
+from .generate import generate, scale_args, scale_of
+
+ENV_KEYS = ("DB_PROFILE", "DB_ASYNC", "FAST_JSON", "AUDIT_MODE", "AUDIT_ENCODING", "METRICS")
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def _git() -> dict:
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(dirty)}
+
+
+def _meta() -> dict:
+    return {
+        **_git(),
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "env": {k: os.getenv(k) for k in ENV_KEYS if os.getenv(k) is not None},
+    }
+
+
+def _stats(lat: list[float], queries: list[int], size: int) -> dict:
+    lat = sorted(lat)
+    n = len(lat)
+    total = sum(lat)
+
+    def pct(p: float) -> float:
+        return round(lat[min(n - 1, int(n * p))] * 1000, 2)
+
+    return {
+        "n": n,
+        "req_per_s": round(n / total, 1) if total else None,
+        "mean_ms": round(total / n * 1000, 2),
+        "p50_ms": pct(0.50),
+        "p90_ms": pct(0.90),
+        "p99_ms": pct(0.99),
+        "max_ms": round(lat[-1] * 1000, 2),
+        "sql_per_req": round(sum(queries) / len(queries), 1) if queries else None,
+        "bytes_per_req": size // n,
+    }
+
+
+def run_scenario(step: Callable[[int], object], n: int, warmup: int = 0,
+                 prepare: Optional[Callable[[int], object]] = None) -> dict:
+    """step(i) 를 n 번 (prepare(i) 가 있으면 그 결과로 부르고, prepare 시간은 뺌) → 통계"""
+    for i in range(warmup):
+        step(i)
+    gc.collect()
+    lat: list[float] = []
+    queries: list[int] = []
+    size = 0
+    for i in range(n):
+        arg = prepare(i) if prepare else i
+        t0 = time.perf_counter()
+        r = step(arg)
+        lat.append(time.perf_counter() - t0)
+        if r.status_code >= 400:
+            raise RuntimeError(f"{r.request.method} {r.request.url} → {r.status_code}: {r.text[:200]}")
+        m = _QUERIES.search(r.headers.get("server-timing", ""))
+        if m:
+            queries.append(int(m.group(1)))
+        size += len(r.content)
+    return _stats(lat, queries, size)
+
+
+def _pager(client, url: str, cids: list[int], limit: int = 100) -> Callable[[int], object]:
+    """X-Next-Cursor 를 따라가다 끝나면 다음 학회 처음부터"""
+    state = {"k": 0, "cursor": None}
+
+    def step(_i: int):
+        cid = cids[state["k"] % len(cids)]
+        params = {"limit": limit}  # params 를 주면 url 의 ?… 는 무시됨 (httpx)
+        if state["cursor"]:
+            params["cursor"] = state["cursor"]
+        r = client.get(url.format(cid=cid), params=params)
+        state["cursor"] = r.headers.get("X-Next-Cursor")
+        if not state["cursor"]:
+            state["k"] += 1
+        return r
+    return step
+
+
+def scenarios(client, data: dict, rng: random.Random, n: int) -> dict[str, tuple]:
+    """이름 → (step, 횟수, prepare) — 학회 삭제는 마지막 (데이터를 지움)"""
+    from app.models import Task
+    from sqlmodel import Session, select
+
+    from app import db
+
+    cids = data["conferences"]
+    with Session(db.engine) as s:
+        tids = s.exec(select(Task.id).where(Task.conference_id.in_(cids))).all()
+        groups = s.exec(select(Task.task_group).distinct()).all()
+    admin = {"X-Admin-Password": os.environ["ADMIN_PASSWORD"]}
+
+    def pick(xs: list):
+        return xs[rng.randrange(len(xs))]
+
+    def new_conference(i: int) -> int:
+        return create_conference(client, year=3000 + i, name="BENCH-GEN")
+
+    return {
+        "tasks_list": (lambda i: client.get(f"/conferences/{pick(cids)}/tasks"), n, None),
+        "tasks_page": (_pager(client, "/conferences/{cid}/tasks", cids), n, None),
+        "tasks_filter": (lambda i: client.get(f"/conferences/{pick(cids)}/tasks", params={
+            "group": pick(groups), "status": pick(["todo", "doing", "done"])}), n, None),
+        "task_assignments": (lambda i: client.get(f"/tasks/{pick(tids)}/assignments"), n, None),
+        "conference_assignments": (lambda i: client.get(f"/conferences/{pick(cids)}/assignments"), n, None),
+        "audit_page": (_pager(client, "/conferences/{cid}/audit", cids), n, None),
+        "milestones_generate": (lambda cid: client.post(f"/conferences/{cid}/milestones/generate"),
+                                min(n, 50), new_conference),
+        "conference_delete": (lambda i: client.delete(f"/conferences/{cids[i]}", headers=admin),
+                              len(cids), None),
+    }
+
+
+def compare(base: dict, now: dict) -> dict:
+    """시나리오별 p50 / req/s: 예전 → 지금 (change_pct: + 면 느려짐 / 빨라짐)"""
+    out = {"comparable": base.get("scale") == now["scale"] and base.get("seed") == now["seed"],
+           "base_commit": base.get("meta", {}).get("commit")}
+    for name, cur in now["scenarios"].items():
+        old = base.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        row = {}
+        for k in ("p50_ms", "req_per_s"):
+            if old.get(k) and cur.get(k):
+                row[k] = {"base": old[k], "now": cur[k], "change_pct": round((cur[k] / old[k] - 1) * 100, 1)}
+        out[name] = row
+    return out
+
+
+def main(argv: list[str] | None = None) -> dict:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    scale_args(p)
+    p.add_argument("--requests", type=int, default=200, help="읽기 시나리오마다 요청 수")
+    p.add_argument("--warmup", type=int, default=10)
+    p.add_argument("--only", help="쉼표로 구분한 시나리오 이름만")
+    p.add_argument("--out", help="리포트 JSON 저장 경로")
+    p.add_argument("--compare", help="비교할 예전 리포트 JSON")
+    args = p.parse_args(argv)
+    os.environ.setdefault("ADMIN_PASSWORD", "bench")
+
+    scale = scale_of(args)
+    result = {"meta": _meta(), "scale": scale, "seed": args.seed, "requests": args.requests}
+    data: dict = {}
+
+    def setup(engine) -> None:
+        data.update(generate(engine, seed=args.seed, **scale))
+
+    with bench_client(setup) as client:
+        result["generate"] = {"rows": data["rows"], "seconds": data["seconds"]}
+        rng = random.Random(args.seed)
+        only = set(args.only.split(",")) if args.only else None
+        result["scenarios"] = {}
+        for name, (step, n, prepare) in scenarios(client, data, rng, args.requests).items():
+            if only and name not in only:
+                continue
+            warmup = args.warmup if prepare is None and name != "conference_delete" else 0
+            result["scenarios"][name] = run_scenario(step, n, warmup, prepare)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            result["compare"] = compare(json.load(f), result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"bench": "suite", **result}, f, ensure_ascii=False, indent=2)
+    report("suite", result)
+    return result
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
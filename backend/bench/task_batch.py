@@ -0,0 +1,62 @@
+# backend/bench/task_batch.py
+"""
+Task 생성/수정: 항목별 호출 vs :batch 한 번
+
+    python -m bench.task_batch [N]
+"""
+from __future__ import annotations
+
+import sys
+
+from .common import bench_client, create_conference, report, timed
+
+
+def main(n: int = 500) -> None:
+    items = [{"task_group": "PROGRAM", "name": f"task {i}", "priority": "high"} for i in range(n)]
+
+    with bench_client() as client:
+        cid = create_conference(client, name="per-item")
+
+        def per_item_create():
+            for it in items:
+                client.post(f"/conferences/{cid}/tasks", json=it).raise_for_status()
+
+        single_create = timed(per_item_create)
+        ids = [t["id"] for t in client.get(f"/conferences/{cid}/tasks").json()]
+
+        def per_item_patch():
+            for tid in ids:
+                client.patch(f"/tasks/{tid}", json={"due_date": "2026-05-08"}).raise_for_status()
+
+        single_patch = timed(per_item_patch)
+
+        cid2 = create_conference(client, name="batch")
+        created = []
+
+        def batch_create():
+            r = client.post(f"/conferences/{cid2}/tasks:batch", json={"items": items})
+            r.raise_for_status()
+            created.extend(t["id"] for t in r.json()["created"])
+
+        batch_c = timed(batch_create)
+
+        def batch_patch():
+            body = {"items": [{"id": tid, "due_date": "2026-05-08"} for tid in created]}
+            client.patch(f"/conferences/{cid2}/tasks:batch", json=body).raise_for_status()
+
+        batch_p = timed(batch_patch)
+
+    def rate(r):
+        return round(n / r["total_s"], 1)
+
+    report("task_batch", {
+        "n": n,
+        "create_per_item_tasks_per_s": rate(single_create),
+        "create_batch_tasks_per_s": rate(batch_c),
+        "patch_per_item_tasks_per_s": rate(single_patch),
+        "patch_batch_tasks_per_s": rate(batch_p),
+    })
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,95 @@
+# backend/tests/conftest.py
+"""
+공통 fixture
+
+    cd backend && python -m pytest tests
+
+- client: 임시 SQLite 파일 DB 에 연결된 TestClient (테스트마다 새 DB, startup 에서 migration)
+- sql_count: with sql_count() as n: ... → n["queries"] 에 그동안 실행된 SQL 문 수
+- @pytest.mark.postgres: TEST_DATABASE_URL 이 없으면 skip (그 DB 의 public 스키마를 지우고 씀)
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # backend/ → import app
+
+from app import db  # noqa: E402
+from app.cache import role_cache  # noqa: E402
+from app.schedule import critical_paths  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "postgres: TEST_DATABASE_URL (비워도 되는 Postgres DB) 가 있어야 실행")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old = db.engine
+    db.engine = db.make_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    yield db.engine
+    db.engine.dispose()
+    db.engine = old
+
+
+@pytest.fixture
+def client(engine):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    # 프로세스 메모리 캐시는 이전 테스트의 DB 내용 → 비움
+    role_cache.invalidate()
+    critical_paths._graphs.clear()
+    with TestClient(app) as c:
+        c.post("/role-templates/seed")
+        yield c
+
+
+@pytest.fixture
+def admin(client):
+    return {"X-Admin-Password": os.environ["ADMIN_PASSWORD"]}
+
+
+@pytest.fixture
+def sql_count(engine):
+    @contextlib.contextmanager
+    def counting():
+        n = {"queries": 0, "statements": []}
+
+        def before(conn, cursor, statement, parameters, context, executemany):
+            n["queries"] += 1
+            n["statements"].append(statement)
+
+        event.listen(engine, "before_cursor_execute", before)
+        try:
+            yield n
+        finally:
+            event.remove(engine, "before_cursor_execute", before)
+    return counting
+
+
+def create_conference(client, year: int = 2026, name: str = "TEST") -> int:
+    r = client.post("/conferences", json={
+        "year": year, "name": name,
+        "start_date": f"{year}-06-01", "end_date": f"{year}-06-03",
+    })
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
+
+
+def create_task(client, cid: int, name: str = "task", **fields) -> int:
+    r = client.post(f"/conferences/{cid}/tasks", json={"task_group": "PLAN", "name": name, **fields})
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
+
+
+def create_person(client, name: str = "person", **fields) -> int:
+    r = client.post("/people", json={"name": name, **fields})
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
@@ -0,0 +1,59 @@
+from sqlmodel import Session, select
+
+from app.models import Assignment, AuditLog
+
+from conftest import create_conference, create_person, create_task
+
+
+def _assign(client, task_id: int, person_id: int, role: str = "chair") -> None:
+    r = client.post(f"/tasks/{task_id}/assign", json={"person_id": person_id, "responsibility": role})
+    assert r.status_code == 200, r.text
+
+
+def test_assignment_lists_run_constant_queries(client, sql_count):
+    """할당 수가 늘어도 SQL 문 수는 같음 (person / role label 을 할당마다 따로 읽지 않음)"""
+    cid = create_conference(client)
+    tid = create_task(client, cid)
+    roles = ["chair", "secretary", "reviewer"]
+    counts = {"task": [], "conference": []}
+    for size in (1, 5, 20):
+        while len(client.get(f"/tasks/{tid}/assignments").json()) < size:
+            n = len(client.get(f"/tasks/{tid}/assignments").json())
+            _assign(client, tid, create_person(client, f"위원 {n}"), roles[n % len(roles)])
+        client.get("/role-templates")  # 캐시 채움 (첫 요청만 RoleTemplate 를 읽음)
+
+        with sql_count() as n:
+            rows = client.get(f"/tasks/{tid}/assignments").json()
+        assert len(rows) == size
+        assert all(r["name"] and r["role_label"] for r in rows)
+        counts["task"].append(n["queries"])
+
+        with sql_count() as n:
+            rows = client.get(f"/conferences/{cid}/assignments").json()
+        assert len(rows) == size
+        counts["conference"].append(n["queries"])
+
+    assert len(set(counts["task"])) == 1, counts
+    assert len(set(counts["conference"])) == 1, counts
+
+
+def test_delete_person_removes_assignments(client, engine):
+    cid = create_conference(client)
+    t1, t2 = create_task(client, cid, "a"), create_task(client, cid, "b")
+    pid, other = create_person(client, "삭제"), create_person(client, "남음")
+    _assign(client, t1, pid)
+    _assign(client, t2, pid, "reviewer")
+    _assign(client, t1, other)
+    etag = client.get(f"/conferences/{cid}/assignments").headers["ETag"]
+
+    r = client.delete(f"/people/{pid}")
+    assert r.status_code == 200, r.text
+    assert r.json()["assignments_removed"] == 2
+
+    r = client.get(f"/conferences/{cid}/assignments", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert [a["person_id"] for a in r.json()] == [other]
+    with Session(engine) as s:
+        assert s.exec(select(Assignment).where(Assignment.person_id == pid)).all() == []
+        unassigned = s.exec(select(AuditLog.entity_id).where(AuditLog.action == "unassign")).all()
+    assert sorted(unassigned) == [t1, t2]
@@ -0,0 +1,54 @@
+from app.audit import AUDIT_CHECKPOINT_EVERY
+
+from conftest import create_conference, create_person, create_task
+
+
+def _history(client, cid: int, tid: int) -> list[dict]:
+    rows = client.get(f"/conferences/{cid}/audit?entity_type=task&entity_id={tid}&limit=1000").json()
+    return rows[::-1]  # 오래된 순
+
+
+def _state(client, cid: int, audit_id: int) -> dict:
+    r = client.get(f"/conferences/{cid}/audit/{audit_id}/state")
+    assert r.status_code == 200, r.text
+    return r.json()["state"]
+
+
+def test_state_ignores_assign_rows(client):
+    cid = create_conference(client)
+    tid = create_task(client, cid, "발표 접수")
+    pid = create_person(client, "위원")
+    assert client.patch(f"/tasks/{tid}", json={"status": "doing"}).status_code == 200
+    assert client.post(f"/tasks/{tid}/assign", json={"person_id": pid}).status_code == 200
+    assert client.patch(f"/tasks/{tid}", json={"priority": "high"}).status_code == 200
+
+    rows = _history(client, cid, tid)
+    assert [r["action"] for r in rows] == ["create", "update_status", "assign", "update"]
+    task = client.get(f"/conferences/{cid}/tasks").json()[0]
+
+    at_assign = _state(client, cid, rows[2]["id"])
+    assert "assignees" not in at_assign
+    assert at_assign["status"] == "doing" and at_assign["priority"] == "med"
+
+    latest = _state(client, cid, rows[3]["id"])
+    assert "assignees" not in latest
+    assert {k: latest[k] for k in task} == task
+
+
+def test_state_across_checkpoint_with_assigns(client):
+    cid = create_conference(client)
+    tid = create_task(client, cid)
+    people = [create_person(client, f"위원 {i}") for i in range(3)]
+    n = AUDIT_CHECKPOINT_EVERY + 5
+    for i in range(n):
+        client.patch(f"/tasks/{tid}", json={"name": f"이름 {i}"})
+        if i % 10 == 0:
+            client.post(f"/tasks/{tid}/assign", json={"person_id": people[i // 10]})
+
+    rows = _history(client, cid, tid)
+    assert "checkpoint" in {r["encoding"] for r in rows}
+    for r in rows:
+        state = _state(client, cid, r["id"])
+        assert "assignees" not in state
+        assert state["id"] == tid
+    assert _state(client, cid, rows[-1]["id"])["name"] == f"이름 {n - 1}"
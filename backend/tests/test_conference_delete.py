@@ -0,0 +1,88 @@
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+
+from app import search
+from app.models import Assignment, AuditLog, Conference, Milestone, Task, TaskDependency
+from bench.generate import generate
+
+from conftest import create_conference
+
+SCALE = {"conferences": 2, "tasks": 3_000, "people": 200, "assignments": 4_000, "audit": 8_000}
+
+
+def _counts(s: Session, cid: int) -> dict[str, int]:
+    task_ids = select(Task.id).where(Task.conference_id == cid)
+    return {
+        "assignment": s.exec(select(func.count()).where(Assignment.task_id.in_(task_ids))).one(),
+        "taskdependency": s.exec(select(func.count()).where(TaskDependency.conference_id == cid)).one(),
+        "milestone": s.exec(select(func.count()).where(Milestone.conference_id == cid)).one(),
+        "auditlog": s.exec(select(func.count()).where(AuditLog.conference_id == cid)).one(),
+        "task": s.exec(select(func.count()).where(Task.conference_id == cid)).one(),
+        "conference": s.exec(select(func.count()).where(Conference.id == cid)).one(),
+    }
+
+
+def _link_tasks(client, cid: int, n: int) -> None:
+    ids = [t["id"] for t in client.get(f"/conferences/{cid}/tasks?sort=id&fields=id&limit={n + 1}").json()]
+    for a, b in zip(ids, ids[1:]):
+        assert client.post(f"/tasks/{b}/dependencies", json={"depends_on_id": a}).status_code == 200
+
+
+def _audit_index_rows(s: Session, cid: int) -> int | None:
+    if not s.exec(text(f"SELECT 1 FROM sqlite_master WHERE name = 'fts_audit_{cid}'")).first():
+        return None
+    return s.exec(text(f"SELECT count(*) FROM fts_audit_{cid}")).one()[0]
+
+
+def test_delete_large_conference(client, engine, admin, sql_count):
+    data = generate(engine, seed=0, **SCALE)
+    cid, other = data["conferences"]
+    for c in (cid, other):
+        _link_tasks(client, c, 20)
+
+    with Session(engine) as s:
+        before = _counts(s, cid)
+        kept = _counts(s, other)
+    assert before["task"] == SCALE["tasks"] and before["assignment"] == SCALE["assignments"]
+    assert before["taskdependency"] == 20 and before["auditlog"] > SCALE["audit"]
+
+    # audit 검색 index 는 write path 밖에서 채움 (auditlog 에 trigger 없음)
+    assert search.index_audit() == before["auditlog"] + kept["auditlog"]
+    with Session(engine) as s:
+        assert _audit_index_rows(s, cid) == before["auditlog"]
+        assert _audit_index_rows(s, other) == kept["auditlog"]
+        assert s.exec(text("SELECT count(*) FROM sqlite_master WHERE type = 'trigger' "
+                           "AND tbl_name = 'auditlog'")).one()[0] == 0
+
+    with sql_count() as n:
+        r = client.delete(f"/conferences/{cid}", headers=admin)
+    assert r.status_code == 200, r.text
+    assert r.json()["deleted"] == before
+    # audit index 는 행마다 'delete' 하지 않고 DROP 한 번
+    assert [q for q in n["statements"] if "fts_audit" in q] == [f"DROP TABLE IF EXISTS fts_audit_{cid}"]
+
+    with Session(engine) as s:
+        assert all(v == 0 for v in _counts(s, cid).values())
+        assert _counts(s, other) == kept
+        # 어느 학회에도 속하지 않는 행이 없음
+        orphans = s.exec(text(
+            "SELECT (SELECT count(*) FROM assignment WHERE task_id NOT IN (SELECT id FROM task))"
+            " + (SELECT count(*) FROM task WHERE conference_id NOT IN (SELECT id FROM conference))"
+            " + (SELECT count(*) FROM milestone WHERE conference_id NOT IN (SELECT id FROM conference))"
+            " + (SELECT count(*) FROM auditlog WHERE conference_id NOT IN (SELECT id FROM conference))"
+            " + (SELECT count(*) FROM taskdependency WHERE task_id NOT IN (SELECT id FROM task)"
+            "    OR depends_on_id NOT IN (SELECT id FROM task))"
+        )).one()[0]
+    assert orphans == 0
+    with Session(engine) as s:
+        assert _audit_index_rows(s, cid) is None
+        assert _audit_index_rows(s, other) == kept["auditlog"]
+    assert client.get(f"/conferences/{cid}").status_code == 404
+    assert len(client.get(f"/conferences/{other}/tasks?fields=id").json()) == SCALE["tasks"]
+
+
+def test_delete_conference_requires_admin(client):
+    cid = create_conference(client)
+    assert client.delete(f"/conferences/{cid}").status_code == 401
+    assert client.delete(f"/conferences/{cid}", headers={"X-Admin-Password": "wrong"}).status_code == 401
+    assert client.get(f"/conferences/{cid}").status_code == 200
@@ -0,0 +1,53 @@
+import os
+import shutil
+
+import pytest
+from sqlalchemy import text
+
+from app import copy_db, db
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def _legacy_source(tmp_path) -> str:
+    """schema_version 없는 예전 conf_os.db + 지워진 사람을 가리키는 할당 1건"""
+    path = tmp_path / "legacy.db"
+    shutil.copy(os.path.join(BACKEND, "conf_os.db"), path)
+    url = f"sqlite:///{path}"
+    engine = db.make_engine(url, "plain")
+    with engine.begin() as conn:
+        task_id = conn.exec_driver_sql("SELECT min(id) FROM task").scalar()
+        conn.exec_driver_sql(
+            "INSERT INTO assignment (task_id, person_id, responsibility, created_at) "
+            "VALUES (?, (SELECT coalesce(max(id), 0) + 100 FROM person), 'chair', '2026-01-01')", (task_id,))
+    engine.dispose()
+    return url
+
+
+def _check_copy(source_url: str, target_url: str) -> None:
+    result = copy_db.copy_db(source_url, target_url, chunk=3)
+    assert all(v["ok"] for v in result["verify"].values()), result["verify"]
+    assert result["tables"]["task"]["copied"] > 0
+
+    target = db.make_engine(copy_db.normalize_url(target_url))
+    with target.connect() as conn:
+        assert conn.execute(text(
+            "SELECT count(*) FROM assignment a WHERE NOT EXISTS (SELECT 1 FROM person p WHERE p.id = a.person_id)"
+        )).scalar() == 0
+    target.dispose()
+
+
+def test_copy_upgrades_legacy_source_and_drops_orphans(tmp_path):
+    _check_copy(_legacy_source(tmp_path), f"sqlite:///{tmp_path / 'target.db'}")
+
+
+@pytest.mark.postgres
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL 없음")
+def test_copy_legacy_sqlite_to_postgres(tmp_path):
+    target = db.make_engine(copy_db.normalize_url(TEST_DATABASE_URL))
+    with target.begin() as conn:
+        conn.exec_driver_sql("DROP SCHEMA public CASCADE")
+        conn.exec_driver_sql("CREATE SCHEMA public")
+    target.dispose()
+    _check_copy(_legacy_source(tmp_path), TEST_DATABASE_URL)
@@ -0,0 +1,72 @@
+from conftest import create_conference, create_person, create_task
+
+
+def _get(client, url: str, etag: str | None = None):
+    return client.get(url, headers={"If-None-Match": etag} if etag else {})
+
+
+def _setup(client):
+    cid = create_conference(client)
+    tid = create_task(client, cid)
+    pid = create_person(client, "예전 이름", affiliation="A대")
+    assert client.post(f"/tasks/{tid}/assign", json={"person_id": pid, "responsibility": "chair"}).status_code == 200
+    return cid, tid, pid
+
+
+def test_assignments_etag_follows_person_rename(client):
+    cid, _, pid = _setup(client)
+    url = f"/conferences/{cid}/assignments"
+    etag = _get(client, url).headers["ETag"]
+    assert _get(client, url, etag).status_code == 304
+
+    assert client.patch(f"/people/{pid}", json={"name": "새 이름"}).status_code == 200
+    r = _get(client, url, etag)
+    assert r.status_code == 200
+    assert r.json()[0]["name"] == "새 이름"
+    assert _get(client, url, r.headers["ETag"]).status_code == 304
+
+
+def test_assignments_etag_follows_role_label(client):
+    cid, _, _ = _setup(client)
+    url = f"/conferences/{cid}/assignments"
+    etag = _get(client, url).headers["ETag"]
+
+    chair = next(rt for rt in client.get("/role-templates").json() if rt["key"] == "chair")
+    assert client.patch(f"/role-templates/{chair['id']}", json={"label": "대회장"}).status_code == 200
+    r = _get(client, url, etag)
+    assert r.status_code == 200
+    assert r.json()[0]["role_label"] == "대회장"
+
+
+def test_assignments_etag_differs_by_person_filter(client):
+    cid, _, pid = _setup(client)
+    etag = _get(client, f"/conferences/{cid}/assignments").headers["ETag"]
+    assert _get(client, f"/conferences/{cid}/assignments?person_id={pid + 1}", etag).status_code == 200
+
+
+def test_stats_etag_follows_person_rename(client):
+    cid, _, pid = _setup(client)
+    url = f"/conferences/{cid}/stats"
+    etag = _get(client, url).headers["ETag"]
+    assert _get(client, url, etag).status_code == 304
+
+    assert client.patch(f"/people/{pid}", json={"affiliation": "B대"}).status_code == 200
+    r = _get(client, url, etag)
+    assert r.status_code == 200
+    assert r.text.count("B대") == 1
+
+
+def test_missing_conference_is_404(client):
+    cid = create_conference(client)
+    for path in ("tasks", "milestones", "assignments", "stats"):
+        assert _get(client, f"/conferences/{cid + 1}/{path}").status_code == 404, path
+
+
+def test_etag_changes_when_conference_id_is_reused(client, admin):
+    cid = create_conference(client)
+    url = f"/conferences/{cid}/tasks"
+    etag = _get(client, url).headers["ETag"]
+    assert client.delete(f"/conferences/{cid}", headers=admin).status_code == 200
+
+    assert create_conference(client) == cid  # SQLite 는 지운 id 를 다시 씀
+    assert _get(client, url, etag).status_code == 200
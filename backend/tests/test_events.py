@@ -0,0 +1,21 @@
+import json
+
+from app import events
+
+from conftest import create_conference, create_person, create_task
+
+
+def _deltas(cid: int) -> list[dict]:
+    return [json.loads(events._delta(r).split("data: ", 1)[1]) for r in events._rows_after(cid, 0, 100)]
+
+
+def test_only_snapshots_are_full(client):
+    cid = create_conference(client)
+    tid = create_task(client, cid)
+    pid = create_person(client)
+    assert client.patch(f"/tasks/{tid}", json={"status": "doing"}).status_code == 200
+    assert client.post(f"/tasks/{tid}/assign", json={"person_id": pid}).status_code == 200
+    assert client.delete(f"/people/{pid}").status_code == 200
+
+    full = {d["action"]: d["full"] for d in _deltas(cid)}
+    assert full == {"create": True, "update_status": False, "assign": False, "unassign": False}
@@ -0,0 +1,64 @@
+import pytest
+
+from app import fastjson
+
+from conftest import create_conference, create_person
+
+QUERIES = [
+    "",
+    "?fields=id,name",
+    "?sort=id",
+    "?sort=-id&fields=name",
+    "?sort=updated_at",
+    "?limit=7",
+    "?limit=7&sort=id&cursor={cursor_id}",
+    "?sort=-updated_at&cursor={cursor}",
+    "?sort=id&cursor={cursor_id}",
+    "?sort=-updated_at&fields=id&cursor={cursor}",
+]
+
+
+def _tasks(client) -> str:
+    cid = create_conference(client)
+    r = client.post(f"/conferences/{cid}/tasks:batch", json={"items": [
+        {"task_group": ("PLAN", "PROGRAM")[i % 2], "name": f"작업 {i:02d}"} for i in range(30)]})
+    assert r.status_code == 200, r.text
+    # updated_at 이 서로 다르게 (정렬 / cursor 가 id 로만 갈리지 않게)
+    for t in r.json()["created"][::4]:
+        client.patch(f"/tasks/{t['id']}", json={"priority": "high"})
+    return f"/conferences/{cid}/tasks"
+
+
+def _people(client) -> str:
+    for i in range(30):
+        create_person(client, f"사람 {i % 7}")  # 같은 이름 → name 정렬은 id 로 갈림
+    return "/people"
+
+
+@pytest.fixture(params=[_tasks, _people], ids=["tasks", "people"])
+def list_url(request, client):
+    return request.param(client)
+
+
+@pytest.mark.skipif(fastjson.orjson is None, reason="FAST_JSON 은 orjson 이 있어야 켜짐")
+def test_fast_json_matches_default_path(client, list_url, monkeypatch):
+    cursors = {
+        "cursor": client.get(f"{list_url}?limit=10&sort=-updated_at").headers["X-Next-Cursor"],
+        "cursor_id": client.get(f"{list_url}?limit=10&sort=id").headers["X-Next-Cursor"],
+    }
+    for q in QUERIES:
+        url = list_url + q.format(**cursors)
+        monkeypatch.setattr(fastjson, "FAST_JSON", False)
+        plain = client.get(url)
+        monkeypatch.setattr(fastjson, "FAST_JSON", True)
+        fast = client.get(url)
+        assert plain.status_code == fast.status_code == 200, (url, plain.text, fast.text)
+        assert fast.json() == plain.json(), url
+        assert fast.headers.get("X-Next-Cursor") == plain.headers.get("X-Next-Cursor"), url
+
+
+def test_cursor_without_limit_returns_rest(client, list_url):
+    first = client.get(f"{list_url}?limit=10&sort=id")
+    rest = client.get(f"{list_url}?sort=id&cursor={first.headers['X-Next-Cursor']}").json()
+    all_ids = [t["id"] for t in client.get(f"{list_url}?sort=id").json()]
+    assert [t["id"] for t in first.json()] + [t["id"] for t in rest] == all_ids
@@ -0,0 +1,68 @@
+import os
+import shutil
+
+from sqlmodel import SQLModel
+
+from app import db, migrations
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 0002 이전 (0001 baseline 시절) task index
+V1_INDEXES = {"ix_task_conf_group_status": "task (conference_id, task_group, status)"}
+V2_INDEXES = ("ix_task_conf_group_status_priority", "ix_task_conf_group_status_updated",
+              "ix_task_conf_due", "ix_milestone_conf_target")
+
+
+def _indexes(engine) -> dict[tuple, tuple]:
+    """(table, index 이름, 컬럼) → (unique, origin) — PRAGMA index_list / index_info"""
+    out = {}
+    with engine.connect() as conn:
+        tables = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' AND name NOT LIKE 'fts\\_%' ESCAPE '\\'").scalars().all()
+        for table in tables:
+            for _seq, name, unique, origin, _partial in conn.exec_driver_sql(f"PRAGMA index_list('{table}')"):
+                cols = tuple(r[2] for r in conn.exec_driver_sql(f"PRAGMA index_info('{name}')"))
+                key = "autoindex" if name.startswith("sqlite_autoindex") else name  # 이름은 생성 순서에 따라 다름
+                out[(table, key, cols)] = (unique, origin)
+    return out
+
+
+def _fresh(tmp_path):
+    engine = db.make_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    assert migrations.upgrade(engine) == [v for v, _, _ in migrations.MIGRATIONS]
+    return engine
+
+
+def test_fresh_db_has_exactly_the_model_indexes(tmp_path):
+    names = {name for (_t, name, _c) in _indexes(_fresh(tmp_path))} - {"autoindex"}
+    declared = {i.name for t in SQLModel.metadata.sorted_tables for i in t.indexes}
+    assert names == declared
+    assert not names & set(V1_INDEXES)
+
+
+def test_v1_db_upgrades_to_fresh_index_set(tmp_path):
+    expected = _indexes(_fresh(tmp_path))
+
+    # 0001 baseline 까지만 적용된 DB (0002 이전 index 구성)
+    engine = db.make_engine(f"sqlite:///{tmp_path / 'v1.db'}")
+    migrations.upgrade(engine)
+    with engine.begin() as conn:
+        for name in V2_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX {name}")
+        for name, target in V1_INDEXES.items():
+            conn.exec_driver_sql(f"CREATE INDEX {name} ON {target}")
+        conn.execute(migrations.schema_version.delete().where(migrations.schema_version.c.version > 1))
+    assert _indexes(engine) != expected
+
+    assert migrations.upgrade(engine) == [v for v, _, _ in migrations.MIGRATIONS if v > 1]
+    assert _indexes(engine) == expected
+    assert migrations.upgrade(engine) == []
+
+
+def test_legacy_db_file_upgrades_to_fresh_index_set(tmp_path):
+    # migration 이전 (schema_version 없는) 저장소의 conf_os.db — 복사본으로
+    shutil.copy(os.path.join(BACKEND, "conf_os.db"), tmp_path / "legacy.db")
+    engine = db.make_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    migrations.upgrade(engine)
+    assert _indexes(engine) == _indexes(_fresh(tmp_path))
@@ -0,0 +1,12 @@
+from bench import query_plans
+from bench.generate import generate
+
+
+def test_no_query_plan_violations(client, engine):
+    data = generate(engine, seed=0, **query_plans.SCALE)
+    captured = query_plans.run_cases(client, data)
+    assert set(captured) <= set(query_plans.CASES) and captured
+
+    result = query_plans.check(engine, captured)
+    assert result["statements"] > 0
+    assert result["violations"] == []
@@ -0,0 +1,52 @@
+from conftest import create_conference
+
+
+def _milestones(client, cid: int) -> dict[str, dict]:
+    return {m["key"]: m for m in client.get(f"/conferences/{cid}/milestones").json()}
+
+
+def test_generate_keeps_rescheduled_milestones(client):
+    cid = create_conference(client)
+    assert client.post(f"/conferences/{cid}/milestones/generate").status_code == 200
+    before = _milestones(client, cid)
+    key = min(before, key=lambda k: before[k]["target_date"])
+
+    r = client.post(f"/conferences/{cid}/reschedule", json={"milestone_key": key, "shift_days": 3})
+    assert r.status_code == 200, r.text
+    moved = _milestones(client, cid)
+    assert moved[key]["target_date"] != before[key]["target_date"]
+
+    # 다시 generate 해도 밀어둔 날짜 그대로
+    assert client.post(f"/conferences/{cid}/milestones/generate").status_code == 200
+    assert _milestones(client, cid) == moved
+
+
+def test_reschedule_dry_run_must_be_boolean(client):
+    cid = create_conference(client)
+    assert client.post(f"/conferences/{cid}/milestones/generate").status_code == 200
+    for bad in ("false", "true", 0, 1, None):
+        r = client.post(f"/conferences/{cid}/reschedule", json={"shift_days": 3, "dry_run": bad})
+        assert r.status_code == 422, (bad, r.text)
+    assert client.get(f"/conferences/{cid}").json()["start_date"] == "2026-06-01"
+
+    r = client.post(f"/conferences/{cid}/reschedule", json={"shift_days": 3, "dry_run": True})
+    assert r.json()["dry_run"] is True
+    assert client.get(f"/conferences/{cid}").json()["start_date"] == "2026-06-01"
+
+
+def test_milestone_shift_moves_tasks_starting_after_it(client):
+    cid = create_conference(client)
+    assert client.post(f"/conferences/{cid}/milestones/generate?create_default_tasks=false").status_code == 200
+    m = max(_milestones(client, cid).values(), key=lambda m: m["target_date"])
+    since = m["target_date"]
+    r = client.post(f"/conferences/{cid}/tasks:batch", json={"items": [
+        {"task_group": "PLAN", "name": "시작일만", "start_date": since},
+        {"task_group": "PLAN", "name": "이전 일정", "start_date": "2000-01-01", "due_date": "2000-01-02"},
+    ]})
+    tid, early = (t["id"] for t in r.json()["created"])
+
+    r = client.post(f"/conferences/{cid}/reschedule", json={"milestone_key": m["key"], "shift_days": 2})
+    assert r.status_code == 200, r.text
+    assert r.json()["tasks_moved"] == 1
+    starts = {t["id"]: t["start_date"] for t in client.get(f"/conferences/{cid}/tasks?fields=id,start_date").json()}
+    assert starts[tid] > since and starts[early] == "2000-01-01"
@@ -0,0 +1,49 @@
+from sqlmodel import Session, func, select
+
+from app.models import AuditLog
+
+from conftest import create_conference
+
+
+def _inserts(statements: list[str], table: str) -> int:
+    return sum(1 for s in statements if s.lstrip().upper().startswith(f"INSERT INTO {table.upper()} "))
+
+
+def test_batch_create_uses_one_insert_per_table(client, engine, sql_count):
+    cid = create_conference(client)
+    items = [{"task_group": "PLAN", "name": f"작업 {i}", **({"due_date": "2026-05-01"} if i % 2 else {})}
+             for i in range(40)]
+    with sql_count() as n:
+        r = client.post(f"/conferences/{cid}/tasks:batch", json={"items": items + ["bad", {"name": "no group"}]})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert [t["name"] for t in body["created"]] == [it["name"] for it in items]
+    assert [e["index"] for e in body["errors"]] == [40, 41]
+    assert _inserts(n["statements"], "task") == 1
+    assert _inserts(n["statements"], "auditlog") == 1
+
+    with Session(engine) as s:
+        audited = s.exec(select(AuditLog.entity_id).where(AuditLog.conference_id == cid,
+                                                          AuditLog.action == "create")).all()
+    assert sorted(audited) == sorted(t["id"] for t in body["created"])
+
+
+def test_batch_patch_reports_bad_ids_per_item(client, engine, sql_count):
+    cid = create_conference(client)
+    created = client.post(f"/conferences/{cid}/tasks:batch", json={"items": [
+        {"task_group": "PLAN", "name": f"작업 {i}"} for i in range(5)]}).json()["created"]
+    items = [{"id": t["id"], "status": "done"} for t in created]
+    items += [{"id": [created[0]["id"]]}, {"id": {"a": 1}}, {"id": True}, {"id": 999999}, {"status": "done"}]
+
+    with sql_count() as n:
+        r = client.patch(f"/conferences/{cid}/tasks:batch", json={"items": items})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert [t["status"] for t in body["updated"]] == ["done"] * 5
+    assert [(e["index"], e["error"]) for e in body["errors"]] == [
+        (5, "id (integer) is required"), (6, "id (integer) is required"), (7, "id (integer) is required"),
+        (8, "Task not found"), (9, "id (integer) is required"),
+    ]
+    assert _inserts(n["statements"], "auditlog") == 1
+    with Session(engine) as s:
+        assert s.exec(select(func.count()).where(AuditLog.action == "update_status")).one() == 5